@@ -1,3 +1,7 @@
+import itertools
+
+from . import diagnostics as diag
+from . import engine, table
 from .bts import resolve_flexcode
 from .mapping import (
     lingGlossFromLemmaIDDict,
@@ -69,13 +73,13 @@ def stemType (sub_pos):
     return ''
 
 
-def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
+def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict, diagnostics=None):
     """ Apply Leipzig Glossing Rules to Part of Speech and flexion information of a lemma occurrence.
     :param flexcode: BTS flexcode
     :param lemmaID: BTS lemma ID
     :param pos_subpos: BTS part of speech type/subtype; python dictionary with ``type`` and optional ``subtype`` key
+    :param diagnostics: optional :class:`aaew_linggloss.diagnostics.DiagnosticsCollector` receiving warnings and errors
     """
-    logFile = None # kein Error Log ausgeben
     pos = ''
     sub_pos =''
 
@@ -95,7 +99,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
     try:
         flexcode = int(flexcode)
     except ValueError:
-        if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid flexcode [no number]: '+flexcode)
+        if diagnostics is not None: diagnostics.report(diag.INVALID_FLEXCODE, pos, sub_pos, flexcode, glossing)
         return '(invalid code)'
 
     if flexcode >= 0:
@@ -134,7 +138,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle beschneiden
         skForm = ''
         if   flex ==  0: # 1x00x, "SK" (unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified suffix conjugation flexcode (form, xxx00x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.SC_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex ==  2: skForm = '.act' # 10020, "SK.akt.kzl"
         elif flex ==  4: skForm = '.pass' # 10040, "SK.pass.kzl"
         elif flex == 10:
@@ -210,7 +214,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 98: skForm = '.pass' # 10980 , "SK.pass.spez.unpersönl."
         elif flex == 99: skForm = '.act-compl' # 10990 , "SK.t-akt.kzl.unpersönl."
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid suffix conjugation flexcode (form, pattern xxxXXx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.SC_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += skForm + state
 
         # Check POS compatibility
@@ -219,9 +223,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         elif (pos == 'adjective' and str(sub_pos) == 'nan'):
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Resultative
     elif (flex // 10000) == 2:
@@ -230,14 +234,14 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         #if (flex // 1000) == 1: # präf.PsP
         #    glossing = 'tam:'+glossing
         if (flex // 1000) > 7: # ungültig
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid resultative flexcode (pattern x2[0-7]xxx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.RES_INVALID, pos, sub_pos, flexcode, glossing)
 
         flex = flex % 1000 # auf 3 Stellen beschneiden, Stamm- & einige aux-Info weg
         flex = flex // 10 # letzte Stelle abschneiden, weitere aux-Info weg
 
         form = ''
         if   flex ==  0: # 2x00x, "psp" (unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified resultative form (ending, pattern x2x00x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.RES_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex ==  1: form = '-1sg' # 20010, "psp.sg1"
         elif flex ==  2: form = '-2sg.m' # 20020, "psp.sg2m"
         elif flex ==  3: form = '-2sg.f' # 20030, "psp.sg2f"
@@ -255,7 +259,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 12: form = '-3du.f' # 20120, "psp.du3f"
         elif flex == 13: form = '-1du' # 20130, "psp.du1"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid resultative flexcode (ending, pattern x2x[1-13/31/34/38]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.RES_INVALID_ENDING, pos, sub_pos, flexcode, glossing)
         glossing += form
 
         # Check POS compatibility
@@ -266,9 +270,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
                 pass # ok
         elif (pos == 'epitheton_title' and str(sub_pos) != 'title') \
             or (pos == 'adverb' and str(sub_pos) == 'nan'):
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Partizip
     elif (flex // 10000) == 3:
@@ -282,7 +286,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         #    if str(sub_pos) == 'verb_2-lit': # j.rx.w, https://wikis.hu-berlin.de/ancientegyptian/%C2%A797
         #        glossing = 'V\\ptcp.distr' # wegen nägy. nicht immer korrekt
         elif (flex // 1000) > 2: # ungültig
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid participle flexcode (pattern x3[0-2]xxx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.PTCP_INVALID, pos, sub_pos, flexcode, glossing)
         flex = flex % 1000 # auf 3 Stellen beschneiden, Stamm-Info weg
 
         #Suffixe
@@ -291,7 +295,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
 
         ptcpForm = ''
         if   flex ==  0: # 3x00x, "partz" (unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified participle flexcode (genus verbi/number/gender, pattern x3x00x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.PTCP_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex ==  1: ptcpForm = '.act.m.sg' # 30010, "partz.akt.sgm"
         elif flex ==  2: ptcpForm = '.act.f.sg' # 30020, "partz.akt.sgf"
         elif flex == 32: ptcpForm = '.act.f' # 30320, "partz.akt.sg"
@@ -307,7 +311,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 11: ptcpForm = '.pass.m.du' # 30110, "partz.pass.dum"
         elif flex == 12: ptcpForm = '.pass.f.du' # 30120, "partz.pass.duf"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid participle flexcode (genus verbi/number/gender, pattern x3x[1-12/32/38]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.PTCP_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += ptcpForm + state
 
         # Check POS compatibility
@@ -319,9 +323,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'substantive' \
             or pos == 'entity_name'\
             or pos == 'epitheton_title':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Relativform
     elif (flex // 10000) == 4:
@@ -335,7 +339,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         #elif (flex // 1000) == 2: # präf.
         #    glossing = 'tam:'+glossing
         elif (flex // 1000) > 2: # ungültig
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid participle flexcode (pattern x4[0-2]xxx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_INVALID, pos, sub_pos, flexcode, glossing)
         flex = flex % 1000 # auf 3 Stellen beschneiden, Stamm-Info weg
 
         #Suffixe
@@ -345,7 +349,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         relForm = ''
         tam = ''
         if   flex ==  0: # 4x00x, "rel" (unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified relafive form flexcode (number/gender/tempus, pattern x4x00x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex ==  1:
             relForm = '.m.sg-ant' # 40010, "rel.f.n-.sgm" ### ipfv-Kombi nicht als Warnung abgefangen
             tam = 'ant'
@@ -378,13 +382,13 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 11: relForm = '.m.du' # 40110, "rel.f.dum"
         elif flex == 12: relForm = '.f.du' # 40120, "rel.f.duf"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid relafive form flexcode (number/gender/tempus, pattern x4x[1-12/31/32/38]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_INVALID_FORM, pos, sub_pos, flexcode, glossing)
 
         if stem == 'redupl':
             if tam != 'ant':
                 glossing = 'V~rel.ipfv'
             else:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Anterior relative form with reduplicating stem ('+str(sub_pos)+')<>'+glossing)
+                if diagnostics is not None: diagnostics.report(diag.REL_ANTERIOR_REDUPL, pos, sub_pos, flexcode, glossing)
 
         glossing += relForm + state
 
@@ -397,9 +401,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'substantive' \
             or pos == 'entity_name'\
             or pos == 'epitheton_title' :
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Imperativ
     elif (flex // 10000) == 5:
@@ -408,7 +412,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         #if (flex // 1000) == 1: # präf.
         #    glossing = 'tam:'+glossing
         if (flex // 1000) > 2: # ungültig
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid imperative flexcode (pattern 5[0-2]xxx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.IMP_INVALID, pos, sub_pos, flexcode, glossing)
         flex = flex % 1000 # auf 3 Stellen beschneiden, Stamm-Info weg
 
         #Suffixe
@@ -417,13 +421,13 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
 
         form = ''
         if flex == 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified imperative flexcode (pattern 5x0xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.IMP_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex == 1: form = '.sg' # 50010, "imp.sg"
         elif flex == 2: form = '.pl' # 50020, "imp.pl"
         elif flex == 3: form = '.du' # 50030, "imp.du"
         elif flex == 4: form = '' # 50040, "jmj.tw=" ENG §357
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid imperative flexcode (pattern 5x[1-4]xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.IMP_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -433,9 +437,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
                 pass # ok
         elif (pos == 'particle' and str(sub_pos) != 'particle_enclitic') \
             or pos == 'interjection':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Nominale Verbalformen
     elif (flex // 1000) == 60:
@@ -447,20 +451,20 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex % 10 > 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid nominal verb form flexcode (pattern 7xx[1-5]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NOMINAL_INVALID_SUFFIX, pos, sub_pos, flexcode, glossing)
         flex = flex // 10 # letzte Stelle abschneiden
 
         form = ''
         if   flex == 0:
             form = '\\nmlz/advz' # 60000, "subst/adv.verbf" (!unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Underspecified nominal/adverbial verb form flexcode (pattern 7x0xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NOMINAL_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex == 1: form = '\\nmlz.m' # 60100, "verbalnomen.kzl"
         elif flex == 2: form = '\\nmlz.m' # 60200, "verbalnomen.endg w/j"
         elif flex == 3: form = '\\nmlz.f' # 60300, "verbalnomen.endg. t"
         elif flex == 4: form = '\\nmlz.f' # 60400, "verbalnomen.endg. wt/jt"
         elif flex == 5: form = '\\nmlz' # 60500, "verbalnomen gem"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid nominal verb form flexcode (pattern 7x[1-5]xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NOMINAL_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -470,9 +474,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
                 pass # ok
         elif (pos == 'adverb' and str(sub_pos) != 'prepositional_adverb') \
             or pos == 'substantive':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Komplementsinfinitive
     elif (flex // 1000) == 62:
@@ -484,19 +488,19 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex % 10 > 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid complementary infinitive flexcode (pattern 62x0x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.COMPL_INF_INVALID_SUFFIX, pos, sub_pos, flexcode, glossing)
         flex = flex // 10 # letzte Stelle abschneiden
 
         form = ''
         if flex == 0: # 62000, "kompl.inf." (unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified(?) complementary infinitive flexcode (pattern 620?xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.COMPL_INF_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex == 1: form = '.f' # 62100, "kompl.inf.endg.t"
         elif flex == 2: form = '.f' # 62200, "kompl.inf.endg.wt"
         elif flex == 3: form = '.f' # 62300, "kompl.inf.jt/yt"
         elif flex == 4: form = '.m' # 62400, "kompl.inf.gem."
         elif flex == 5: form = '.f' # 62500, "kompl.inf.gem.endg.t"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid complementary infinitive flexcode (pattern 62[1-5]0x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.COMPL_INF_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -505,9 +509,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         elif pos == 'substantive':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Negativkomplement
     elif (flex // 1000) == 63:
@@ -519,12 +523,12 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex % 10 > 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid negative complement flexcode (pattern 63x0x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NEG_COMPL_INVALID_SUFFIX, pos, sub_pos, flexcode, glossing)
         flex = flex // 10 # letzte Stelle abschneiden
 
         form = ''
         if flex == 0: # 63000, "neg.kompl" (unterspezifiziert)
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified negative complement flexcode (pattern 630xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NEG_COMPL_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex == 1: form = '' # 63100, "neg.kompl.kzl"
         elif flex == 2: form = '' # 63200, "neg.kompl.endg.w"
         elif flex == 3: form = '' # 63300, "neg.kompl.endg.t"
@@ -532,7 +536,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 5: form = '' # 63500, "neg.kompl.gem.endg.t"
         elif flex == 6: form = '' # 63600, "neg.kompl.gem.endg.w"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid negative complement flexcode (pattern 63[1-6]0x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NEG_COMPL_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -541,7 +545,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Infinitive
     elif (flex // 1000) == 61 or (((flex // 1000) >= 64) and ((flex // 1000) <= 69)):
@@ -560,9 +564,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         elif pos == 'substantive':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Substantive
     elif (flex // 1000) == 70:
@@ -576,13 +580,13 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif stateFlex == 5: state = ':stpr' # stpr
         elif stateFlex == 6: state = ':stc' # stc
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid substantive flexcode (state; pattern 70x[0/5/6]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NOUN_INVALID_STATE, pos, sub_pos, flexcode, glossing)
 
         #Suffixe
         stateFlex = flex % 10 # letzte Ziffer isolieren
         if stateFlex != 0: # stpr
             if state != ':stpr':
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Erroneous substantive stat.pr. flex code [state] (pattern 70x5x): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.NOUN_ERRONEOUS_STPR, pos, sub_pos, flexcode, glossing)
                 state = ':stpr'
         flex = flex // 100 # letzte beiden Stelle abschneiden, state-Info weg
 
@@ -591,14 +595,14 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 1: form = ':pl' # pl
         elif flex == 3: form = ':du' # du
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid substantive flexcode (number; pattern 70[0/1/3]xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NOUN_INVALID_NUMBER, pos, sub_pos, flexcode, glossing)
 
         gender = ''
         if pos == 'substantive':
             if sub_pos == 'substantive_masc': gender ='.m'
             elif sub_pos == 'substantive_fem': gender ='.f'
             else:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified substantive form: no gender on noun ('+str(flexcode)+'): ' + glossing + gender + form + state)
+                if diagnostics is not None: diagnostics.report(diag.NOUN_NO_GENDER, pos, sub_pos, flexcode, glossing + form + state)
 
         glossing += gender + form + state
 
@@ -614,9 +618,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'pronoun' \
             or pos == 'numeral' \
             or pos == 'preposition' :
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Adjektive
     elif (flex // 1000) == 71:
@@ -637,7 +641,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             flex = flex // 10 # erste beiden Ziffern isolieren ; ACHTUNG: Schenkels Neuerungen noch nicht berücksichtgt
 
             if flex == 0:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified adjective flexcode (number/gender; pattern 71000): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.ADJ_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
             elif flex == 1: form = ':m.sg' #
             elif flex == 2: form = ':f.sg' #
             elif flex == 3: form = ':m.pl' #
@@ -645,10 +649,10 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             elif flex == 5: form = ':m.du' #
             elif flex == 6: form = ':f.du' #
             else:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adjective flexcode (number/gender; pattern 710[1-6]0): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.ADJ_INVALID_FORM, pos, sub_pos, flexcode, glossing)
 
             if flexcode % 10 != 0:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adjective flexcode (Suffix without stat.pr.; pattern 711[0/1?-5/6?]0): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.ADJ_SUFFIX_WITHOUT_STPR, pos, sub_pos, flexcode, glossing)
         elif stateFlex == 1:
             state = '' # "stc", eigentlich Kompositum, z.B. ni-sw
 
@@ -657,10 +661,10 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             if abhFlex == 0: state = '' #
             elif ((abhFlex >= 1) and (abhFlex <= 9)):
                 state = ':stpr' # stpr
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adjective flexcode (suffix pronoun instead of dep. pronoun; pattern 711[15-24]): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.ADJ_SUFFIX_PRONOUN, pos, sub_pos, flexcode, glossing)
             elif ((abhFlex >= 15) and (abhFlex <= 24)): state = '' # "stc"
             else:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adjective flexcode (pronoun; pattern 711[15-24]): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.ADJ_INVALID_PRONOUN, pos, sub_pos, flexcode, glossing)
         elif stateFlex == 2:
             state = ':stpr' # stpr redundant
             flex = flex // 10 # erste beiden Ziffern isolieren ; ACHTUNG: Schenkels Neuerungen noch nicht berücksichtgt
@@ -674,12 +678,12 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             elif flex == 26: # 71260, "adj. in SK m. Präfix nꜣ (Einerstelle Suffixpr.) / Spätzeit [nꜣ:nfr=f]
                 glossing = 'vblz-ADJ'
             else:
-                if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adjective flexcode (number/gender; pattern 712[0-6]x): '+str(flexcode))
+                if diagnostics is not None: diagnostics.report(diag.ADJ_INVALID_STPR_FORM, pos, sub_pos, flexcode, glossing)
 
             #Suffixe
             state = stateFromSuffix (flexcode)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adjective flexcode (number/gender; pattern 71[0-2][0-6]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.ADJ_INVALID, pos, sub_pos, flexcode, glossing)
         flex = flex % 10 # erste Stelle abschneiden, state-Info weg
         glossing += form + state
 
@@ -696,9 +700,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'epitheton_title' \
             or pos == 'preposition' \
             or pos == 'verb':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Adverbien
     elif (flex // 1000) == 72:
@@ -713,7 +717,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex != 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid adverbial flexcode (pattern 7200x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.ADV_INVALID, pos, sub_pos, flexcode, glossing)
 
         glossing += state
 
@@ -725,9 +729,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif pos == 'adjective' \
             or (pos == 'epitheton_title' and sub_pos != 'title') \
             or pos == 'preposition':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Zahlen
     elif (flex // 1000) == 74:
@@ -741,7 +745,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         form = ''
         subtype = ''
         if flex == 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified number form (pattern 7400x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NUM_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex == 1:
             form = '.ord:sg.m' # immer sg?
             subtype = 'ordinal'
@@ -755,7 +759,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             form = '.card:f' # wa.t, sn.ti
             subtype = 'cardinal'
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid number form (pattern 740[1-4]x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.NUM_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -768,9 +772,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'substantive' \
             or pos == 'adjective' \
             or pos == 'epitheton_title':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Possessivartikel
     elif (flex // 100) == 800:
@@ -782,7 +786,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex != 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid possessive article flexcode (pattern 8000x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.POSS_INVALID, pos, sub_pos, flexcode, glossing)
         glossing += state
 
         # Check POS compatibility
@@ -794,9 +798,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif pos == 'substantive' \
             or str(sub_pos) == 'personal_pronoun' \
             or (pos == 'adjective' and str(sub_pos) == 'nan'):
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Relativpronomina
     elif ((flex // 100) >= 801) and ((flex // 1000) <= 81):
@@ -810,24 +814,24 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif ((stateFlex >= 1) and (stateFlex <= 9)): state = ':stpr' # stpr
         elif ((stateFlex >= 15) and (stateFlex <= 24)): state = '' # abh. Pronomen / "stc"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid relative pronoun flexcode (pronoun, pattern 8xx0x / 8xx15-24): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_PRON_INVALID_PRONOUN, pos, sub_pos, flexcode, glossing)
         flex = flex // 100 # letzte zwei Stellen abschneiden, state-Info weg
 
         form = ''
         if   flex ==  0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified(?) relative pronoun form (pattern 8[0-1][1?-4]xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_PRON_UNDERSPECIFIED_FORM, pos, sub_pos, flexcode, glossing)
         elif flex ==  1: form = ':m.sg' #
         elif flex ==  2: form = ':f.sg' #
         elif flex ==  3: form = ':m.pl' #
         elif flex ==  4: form = ':f.pl' #
         elif flex == 10:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Underspecified relative pronoun form (pattern 8[0-1][1?-4]xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_PRON_UNDERSPECIFIED, pos, sub_pos, flexcode, glossing)
         elif flex == 11: form = ':m.sg' #
         elif flex == 12: form = ':f.sg' #
         elif flex == 13: form = ':m.pl' #
         elif flex == 14: form = ':f.pl' #
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid relative pronoun flexcode (gender/number, pattern 8[0-1][1-4]xx): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.REL_PRON_INVALID_FORM, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -841,9 +845,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or (pos == 'adjective' and str(sub_pos) == 'nan') \
             or (pos == 'particle' and str(sub_pos) != 'particle_enclitic') \
             or str(sub_pos) == 'nisbe_adjective_preposition':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Admirativsuffix
     elif (flex // 1000) == 90:
@@ -855,7 +859,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex != 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid admirativ suffix flexcode (pattern 9000x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.ADMIRATIVE_INVALID, pos, sub_pos, flexcode, glossing)
         glossing += state
 
         # Check POS compatibility
@@ -864,9 +868,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         elif pos == 'verb':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # sdm.tj.fj
     elif (flex // 100) == 910:
@@ -878,7 +882,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif flex == 10: form = '-f.sg' #
         elif flex == 20: form = '-m.pl' #
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid posterior participle flexcode (pattern 910[0-2]0): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.POST_PTCP_INVALID, pos, sub_pos, flexcode, glossing)
         glossing += form
 
         # Check POS compatibility
@@ -887,9 +891,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         elif (pos == 'adjective' and str(sub_pos) == 'nan'):
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Präpositionen
     elif (flex // 100) == 930:
@@ -901,7 +905,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         flex = flex // 10 # letzte Stelle abschneiden, state-Info weg
 
         if flex != 0:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid preposition flexcode (pattern 9300x): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.PREP_INVALID, pos, sub_pos, flexcode, glossing)
         glossing += state
 
         # Check POS compatibility
@@ -917,9 +921,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'substantive' \
             or pos == 'entity_name' \
             or pos == 'epitheton_title' :
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Partikeln
     elif (flex // 100) == 940:
@@ -933,7 +937,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif ((stateFlex >= 1) and (stateFlex <= 9)): state = ':stpr' # stpr
         elif ((stateFlex >= 15) and (stateFlex <= 24)): state = '' # "stc"
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid particle flexcode (pronoun; pattern 9400x, 94015-24): '+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.PTCL_INVALID, pos, sub_pos, flexcode, glossing)
 
         glossing += state
 
@@ -946,9 +950,9 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'interjection' \
             or pos == 'preposition' \
             or str(sub_pos) == 'interrogative_pronoun':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     # Auxilliar
     elif (flex // 1000) == 96:
@@ -964,7 +968,7 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
         elif ((flex >= 30) and (flex <= 38)): form = '' #
         elif ((flex >= 40) and (flex <= 43)): form = '' #
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Invalid auxilliary flexcode (form, pattern 7620x, 7630x-43x):'+str(flexcode))
+            if diagnostics is not None: diagnostics.report(diag.AUX_INVALID, pos, sub_pos, flexcode, glossing)
         glossing += form + state
 
         # Check POS compatibility
@@ -975,15 +979,81 @@ def computeLingGlossing(flexcode: int, lemmaID: str, pos_subpos: dict):
             or pos == 'undefined':
                 pass # ok
         elif pos == 'preposition':
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\t'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tWarning: Suspicious POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.SUSPICIOUS_POS, pos, sub_pos, flexcode, glossing)
         else:
-            if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Invalid POS<>flexcode combination: '+pos+'('+str(sub_pos)+')<>'+glossing)
+            if diagnostics is not None: diagnostics.report(diag.INVALID_POS, pos, sub_pos, flexcode, glossing)
 
     else:
         #unresolved
         glossing = lingGlossFromPOS(pos, sub_pos)
         if glossing == '':
             glossing = '(unresolved)'
-        if logFile: logFile.write('\n'+pos+'\t'+str(sub_pos)+'\t'+str(flexcode)+'\tError: Unhandled flex code: '+str(flexcode))
+        if diagnostics is not None: diagnostics.report(diag.UNHANDLED_FLEXCODE, pos, sub_pos, flexcode, glossing)
 
     return glossing
+
+
+def posSubposFromColumns(pos, sub_pos) -> dict:
+    """ assemble the ``pos_subpos`` dictionary expected by :func:`computeLingGlossing`
+    from separate type and subtype values.
+
+    >>> posSubposFromColumns('verb', None)
+    {'type': 'verb'}
+
+    :param pos: BTS part of speech type
+    :param sub_pos: BTS part of speech subtype, or ``None``
+    """
+    if sub_pos is None:
+        return {'type': pos}
+    return {'type': pos, 'subtype': sub_pos}
+
+
+def computeLingGlossings(occurrences) -> list:
+    """ Apply Leipzig Glossing Rules to a sequence of lemma occurrences at once.
+    Identical occurrences within the batch are glossed only once, using the precomputed
+    glossings of :mod:`aaew_linggloss.table`; results are the same as calling
+    :func:`computeLingGlossing` for each occurrence.
+
+    >>> computeLingGlossings([
+    ...     (70060, '125581', 'substantive', 'substantive_masc'),
+    ...     (0, '10030', 'pronoun', 'personal_pronoun'),
+    ...     (70060, '125581', 'substantive', 'substantive_masc'),
+    ... ])
+    ['N.m:sg:stc', '-1sg', 'N.m:sg:stc']
+
+    :param occurrences: iterable of ``(flexcode, lemmaID, type, subtype)`` tuples; ``subtype`` may be ``None``
+    :returns: list of glossings in input order
+    """
+    glossings = {}
+    result = []
+    for occurrence in occurrences:
+        occurrence = tuple(occurrence)
+        glossing = glossings.get(occurrence)
+        if glossing is None:
+            flexcode, lemmaID, pos, sub_pos = occurrence
+            glossing = table.compute_ling_glossing(
+                flexcode, lemmaID, posSubposFromColumns(pos, sub_pos)
+            )
+            glossings[occurrence] = glossing
+        result.append(glossing)
+    return result
+
+
+def computeLingGlossingColumns(flexcodes, lemmaIDs, types, subtypes=None) -> list:
+    """ Columnar variant of :func:`computeLingGlossings`: occurrences are given as
+    parallel sequences of equal length.
+
+    >>> computeLingGlossingColumns([70060, 3], ['125581', '1'], ['substantive', 'verb'])
+    ['N:sg:stc', 'V(infl. unedited)']
+
+    :param flexcodes: BTS flexcodes
+    :param lemmaIDs: BTS lemma IDs
+    :param types: BTS part of speech types
+    :param subtypes: BTS part of speech subtypes (optional)
+    :returns: list of glossings in input order
+    """
+    if subtypes is None:
+        subtypes = itertools.repeat(None)
+    return computeLingGlossings(
+        zip(flexcodes, lemmaIDs, types, subtypes)
+    )
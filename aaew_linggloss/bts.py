@@ -1,4 +1,11 @@
-from .mapping import FLEXCODES
+from . import mapping
+from .flexcodes import get_flexcode_table
+
+
+def __getattr__(name: str):
+    if name == 'FLEXCODES':
+        return mapping.FLEXCODES
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 def resolve_flexcode(flexcode) -> str:
@@ -6,7 +13,7 @@ def resolve_flexcode(flexcode) -> str:
     number.
 
     >>> resolve_flexcode(96423)
-    'Aux.tw=.stpr.2sgf_(Prep)_Verb'
+    'Partcl.tw.stpr.2sgf_(Prep)_Verb'
 
     >>> resolve_flexcode('10930')
     'SC.pass.gem.impers'
@@ -17,6 +24,13 @@ def resolve_flexcode(flexcode) -> str:
     :type flexcode: str or int
     :returns: verbalized glossing information
     """
-    return FLEXCODES.get(
-        str(flexcode)
-    )
+    if type(flexcode) is not int:
+        # only canonical string representations of a flexcode are known
+        text = str(flexcode)
+        try:
+            flexcode = int(text)
+        except ValueError:
+            return None
+        if str(flexcode) != text:
+            return None
+    return get_flexcode_table().get(flexcode)
@@ -0,0 +1,119 @@
+""" Glossing sentence documents on their way into an Elasticsearch bulk index.
+
+Reads bulk API NDJSON, i.e. action lines each followed by a source line (except for
+``delete`` actions), and adds glossings and BTS glossing encodings to the tokens of
+sentence documents. Everything else passes through unchanged. Input is processed one
+bulk item at a time, so streams of any length can be enriched in constant memory:
+
+>>> lines = ['{"index": {"_id": "s1"}}', '{"tokens": [{"flexion": {"btsFlex": 3}, "lemma": {"id": "10030"}}]}']
+>>> for line in enrich_bulk(lines): print(line, end='')
+{"index": {"_id": "s1"}}
+{"tokens": [{"flexion": {"btsFlex": 3, "lingGloss": "-1sg", "bGlossing": "(unspecified)"}, "lemma": {"id": "10030"}}]}
+"""
+import json
+
+from .bts import resolve_flexcode
+from .records import get_field, set_field
+from .sentences import TOKEN_FIELDS, SentenceGlosser
+
+
+TOKENS_FIELD = 'tokens'
+BTS_FIELD = 'flexion.bGlossing'
+
+# number of distinct lemmas after which the lemma metadata cache is reset
+MAX_LEMMAS = 100000
+
+ACTIONS = ('index', 'create', 'update', 'delete')
+
+
+def bulk_items(lines):
+    """ group bulk NDJSON lines into lists of action line and source line, if any.
+
+    >>> list(bulk_items(['{"delete": {"_id": 1}}', '{"index": {}}', '{}']))
+    [['{"delete": {"_id": 1}}'], ['{"index": {}}', '{}']]
+    """
+    lines = (line for line in lines if line.strip())
+    for line in lines:
+        action = json.loads(line)
+        if not isinstance(action, dict) or len(action) != 1 or next(iter(action)) not in ACTIONS:
+            raise ValueError('invalid bulk action: {}'.format(line.strip()))
+        if 'delete' in action:
+            yield [line]
+            continue
+        source = next(lines, None)
+        if source is None:
+            raise ValueError('missing source for bulk action: {}'.format(line.strip()))
+        yield [line, source]
+
+
+class BulkEnricher:
+    """ adds glossings to the sentence documents of bulk items.
+
+    :param fields: token field names, see :data:`aaew_linggloss.sentences.TOKEN_FIELDS`
+    :param tokens_field: document field holding the list of tokens
+    :param bts_field: token field to write the BTS glossing encoding to, or ``None``
+    """
+
+    def __init__(self, fields=TOKEN_FIELDS, tokens_field: str = TOKENS_FIELD, bts_field: str = BTS_FIELD):
+        self.fields = fields
+        self.tokens_field = tokens_field
+        self.bts_field = bts_field
+        self.glosser = SentenceGlosser(fields)
+
+    def enrich(self, document: dict) -> bool:
+        """ add glossings to the tokens of a document in place.
+
+        :returns: whether the document has tokens
+        """
+        tokens = get_field(document, self.tokens_field) if isinstance(document, dict) else None
+        if not isinstance(tokens, list) or not tokens:
+            return False
+        if len(self.glosser.lemmas) > MAX_LEMMAS:
+            self.glosser.lemmas.clear()
+        tokens = [
+            token for token in tokens
+            if isinstance(token, dict) and get_field(token, self.fields.flexcode) is not None
+        ]
+        for token, gloss in zip(tokens, self.glosser.glosses(tokens)):
+            set_field(token, self.fields.gloss, gloss)
+            if self.bts_field:
+                set_field(token, self.bts_field, resolve_flexcode(get_field(token, self.fields.flexcode)))
+        return True
+
+    def enrich_item(self, item: list) -> list:
+        """ enrich a bulk item as returned by :func:`bulk_items`, returning its lines.
+        Lines are passed through unchanged unless glossings were added.
+        """
+        if len(item) < 2:
+            return [_line(item[0])]
+        action, source = item
+        document = json.loads(source)
+        target = document
+        if isinstance(document, dict) and 'update' in json.loads(action):
+            target = document.get('doc')
+        if not self.enrich(target):
+            return [_line(action), _line(source)]
+        return [_line(action), json.dumps(document, ensure_ascii=False) + '\n']
+
+
+def _line(line: str) -> str:
+    return line if line.endswith('\n') else line + '\n'
+
+
+def enrich_bulk(lines, enricher: BulkEnricher = None):
+    """ add glossings to the sentence documents in a stream of bulk NDJSON lines.
+
+    :param lines: iterable of NDJSON lines
+    :returns: generator of enriched NDJSON lines
+    """
+    enricher = enricher or BulkEnricher()
+    for item in bulk_items(lines):
+        yield from enricher.enrich_item(item)
+
+
+def enrich_bulk_chunk(items: list, fields=TOKEN_FIELDS, tokens_field: str = TOKENS_FIELD,
+                      bts_field: str = BTS_FIELD) -> str:
+    """ enrich a list of bulk items, returning NDJSON text. Used by worker processes.
+    """
+    enricher = BulkEnricher(fields, tokens_field, bts_field)
+    return ''.join(line for item in items for line in enricher.enrich_item(item))
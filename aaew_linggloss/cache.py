@@ -0,0 +1,128 @@
+""" Opt-in memoization of glossings.
+
+Real-world lemma occurrences are highly repetitive, so long-running processes can
+save work by remembering the glossings of recently seen occurrences.
+"""
+from collections import OrderedDict
+
+from . import posSubposFromColumns
+from . import table
+
+
+class GlossCache:
+    """ least recently used cache in front of the glossing function.
+
+    Keys are normalized before lookup, so that e.g. flexcodes ``70060`` and
+    ``'70060'`` share an entry. Not thread-safe.
+
+    >>> cache = GlossCache(maxsize=2)
+    >>> cache.gloss(70060, '1', 'substantive', None)
+    'N:sg:stc'
+    >>> cache.gloss('70060', '1', 'substantive', None)
+    'N:sg:stc'
+    >>> cache.stats()['hits']
+    1
+
+    :param maxsize: maximum number of cached glossings
+    :param glossing: function with the signature of :func:`aaew_linggloss.computeLingGlossing`
+    """
+
+    def __init__(self, maxsize: int = 100000, glossing=table.compute_ling_glossing):
+        self.maxsize = maxsize
+        self.glossing = glossing
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(flexcode, lemmaID, pos, sub_pos) -> tuple:
+        """ normalize an occurrence into a cache key, or return ``None`` if it
+        should not be cached.
+
+        >>> GlossCache.key('-10930', '10', 'verb', float('nan'))
+        (-10930, '10', 'verb', None)
+        """
+        try:
+            flexcode = int(flexcode)
+            # lemma IDs are kept as they are: glossing functions other than the
+            # reference implementation, e.g. of a lemma registry, may accept any type
+            hash(lemmaID)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        # values other than strings never match part of speech rules
+        return (
+            flexcode,
+            lemmaID,
+            pos if isinstance(pos, str) else None,
+            sub_pos if isinstance(sub_pos, str) else None,
+        )
+
+    def gloss(self, flexcode, lemmaID, pos, sub_pos) -> str:
+        """ gloss a lemma occurrence given as separate values.
+        """
+        key = self.key(flexcode, lemmaID, pos, sub_pos)
+        if key is None:
+            return self.glossing(flexcode, lemmaID, posSubposFromColumns(pos, sub_pos))
+        entries = self._entries
+        glossing = entries.get(key)
+        if glossing is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return glossing
+        self.misses += 1
+        glossing = entries[key] = self.glossing(
+            flexcode, lemmaID, posSubposFromColumns(pos, sub_pos)
+        )
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return glossing
+
+    def computeLingGlossing(self, flexcode, lemmaID: str, pos_subpos: dict) -> str:
+        """ drop-in replacement for :func:`aaew_linggloss.computeLingGlossing`.
+        """
+        pos = sub_pos = None
+        if pos_subpos:
+            pos = pos_subpos.get('type')
+            if len(pos_subpos) > 1:
+                sub_pos = pos_subpos.get('subtype')
+        return self.gloss(flexcode, lemmaID, pos, sub_pos)
+
+    def stats(self) -> dict:
+        """ return hit, miss and eviction counts, current size and hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def items(self) -> list:
+        """ return ``(key, glossing)`` pairs, least recently used first.
+        """
+        return list(self._entries.items())
+
+    def update(self, items):
+        """ add ``(key, glossing)`` pairs as returned by :meth:`items`, e.g. to warm up
+        a new cache, without counting misses.
+        """
+        entries = self._entries
+        for key, glossing in items:
+            entries[key] = glossing
+            entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """ remove all entries and reset counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,493 @@
+""" Command line interface, available as ``aaew-linggloss`` or ``python -m aaew_linggloss``.
+
+Glossing a JSONL export read from stdin::
+
+    aaew-linggloss gloss < tokens.jsonl > glossed.jsonl
+
+Glossing TSV files with custom column names::
+
+    aaew-linggloss gloss --flexcode-field flex --lemmaid-field lemma tokens.tsv -o glossed.tsv
+
+Glossing on 8 CPU cores::
+
+    aaew-linggloss gloss --workers 8 < tokens.jsonl > glossed.jsonl
+
+Counting glossings per part of speech and flexcode categories per period as CSV::
+
+    aaew-linggloss stats --group-field period tokens.jsonl -o stats.csv
+
+Glossing in 8 workers started from a snapshot of the glossing state, warmed up on a
+sample (see :mod:`aaew_linggloss.snapshot`)::
+
+    aaew-linggloss snapshot linggloss.snapshot --warm sample.jsonl
+    aaew-linggloss gloss --snapshot linggloss.snapshot --workers 8 < tokens.jsonl > glossed.jsonl
+
+Serving glossings over HTTP on port 8080 (see :mod:`aaew_linggloss.server`)::
+
+    aaew-linggloss serve --port 8080
+"""
+import argparse
+import contextlib
+import functools
+import sys
+
+from . import records
+
+
+def _open(filename: str, mode: str):
+    if filename == '-':
+        return contextlib.nullcontext(sys.stdout if 'w' in mode else sys.stdin)
+    return open(filename, mode, encoding='utf-8', newline='')
+
+
+def add_field_arguments(parser: argparse.ArgumentParser, defaults: records.Fields = records.DEFAULT_FIELDS):
+    """ add options for configuring record field names to a (sub)command parser.
+    """
+    for field, default in defaults._asdict().items():
+        parser.add_argument(
+            '--{}-field'.format(field.lower()), dest=field, default=default,
+            metavar='NAME', help='record field holding {} (default: %(default)s)'.format(field),
+        )
+
+
+def fields_from_args(args: argparse.Namespace) -> records.Fields:
+    return records.Fields(
+        *(getattr(args, field) for field in records.Fields._fields)
+    )
+
+
+def add_io_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        'files', nargs='*', default=['-'], metavar='FILE',
+        help='input files (default: read from stdin)',
+    )
+    parser.add_argument(
+        '-o', '--output', default='-', metavar='FILE',
+        help='output file (default: write to stdout)',
+    )
+    parser.add_argument(
+        '-f', '--format', choices=records.FORMATS,
+        help='record format (default: guessed from file extension, else jsonl)',
+    )
+    parser.add_argument(
+        '--buffer-size', type=int, default=1000, metavar='N',
+        help='number of records written at once (default: %(default)s)',
+    )
+    parser.add_argument(
+        '-w', '--workers', type=int, default=1, metavar='N',
+        help='number of worker processes (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=10000, metavar='N',
+        help='number of records per worker task (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--cache-size', type=int, default=0, metavar='N',
+        help='memoize the glossings of up to N distinct occurrences, per worker process (default: off)',
+    )
+
+
+def read_inputs(args: argparse.Namespace):
+    """ read records from all input files one after another.
+    """
+    for filename in args.files:
+        with _open(filename, 'r') as f:
+            yield from records.read_records(
+                f, args.format or records.guess_format(filename)
+            )
+
+
+def read_input_lines(args: argparse.Namespace):
+    for filename in args.files:
+        with _open(filename, 'r') as f:
+            yield from f
+
+
+def gloss(args: argparse.Namespace):
+    fields = fields_from_args(args)
+    fmt = args.format or records.guess_format(args.files[0])
+    if (args.metrics or args.lemmas) and args.workers > 1:
+        sys.exit('--metrics and --lemmas cannot be combined with --workers')
+    if args.snapshot and args.lemmas:
+        # the snapshot's cache holds glossings without the lemma list
+        sys.exit('--snapshot cannot be combined with --lemmas')
+    if fmt == 'jsonl' and args.workers > 1:
+        # leave JSON parsing to the worker processes as well
+        from .parallel import chunked, gloss_jsonl_lines, map_chunks
+        with _open(args.output, 'w') as out:
+            buffered, count = [], 0
+            for text in map_chunks(
+                functools.partial(gloss_jsonl_lines, fields=fields),
+                chunked(read_input_lines(args), args.chunk_size),
+                args.workers,
+                initargs=(args.snapshot, args.cache_size),
+            ):
+                buffered.append(text)
+                count += text.count('\n')
+                if count >= args.buffer_size:
+                    out.writelines(buffered)
+                    buffered, count = [], 0
+            out.writelines(buffered)
+        return
+    warm_cache = None
+    if args.snapshot and args.workers <= 1:
+        # worker processes restore the snapshot themselves
+        from .snapshot import restore
+        warm_cache = restore(args.snapshot)
+    from .table import compute_ling_glossing
+    glossing, gloss = compute_ling_glossing, records.gloss_occurrence
+    if args.lemmas:
+        from .lemmas import LemmaRegistry
+        registry = LemmaRegistry.load(args.lemmas, fields=fields)
+        glossing, gloss = registry.computeLingGlossing, registry.gloss_occurrence
+    if args.cache_size > 0 or warm_cache is not None:
+        from .cache import GlossCache
+        if warm_cache is None:
+            cache = GlossCache(args.cache_size, glossing)
+        else:
+            cache = GlossCache(args.cache_size or warm_cache.maxsize, glossing)
+            cache.update(warm_cache.items())
+        glossing, gloss = cache.computeLingGlossing, cache.gloss
+    if args.metrics:
+        from .instrumentation import Instrumentation
+        instrumentation = Instrumentation(glossing)
+        gloss = instrumentation.gloss
+    with _open(args.output, 'w') as out:
+        with records.RecordWriter(out, fmt, [fields.gloss], args.buffer_size) as writer:
+            for record in records.gloss_records(
+                read_inputs(args), fields, args.workers, args.chunk_size, gloss, args.snapshot, args.cache_size,
+            ):
+                writer.write(record)
+    if args.metrics:
+        with _open(args.metrics, 'w') as f:
+            f.write(instrumentation.to_prometheus())
+
+
+def regloss(args: argparse.Namespace):
+    import os
+    from . import incremental
+    fields = fields_from_args(args)
+    fmt = args.format or records.guess_format(args.files[0])
+    state = incremental.fingerprint()
+    history = incremental.load_history(args.state) if os.path.exists(args.state) else {}
+    with contextlib.ExitStack() as stack:
+        on_change = None
+        if args.changelog:
+            changelog = stack.enter_context(records.RecordWriter(
+                stack.enter_context(_open(args.changelog, 'w')), 'jsonl'
+            ))
+            on_change = changelog.write
+        reglosser = incremental.Reglosser(history, state, fields, args.hash_field, on_change, args.state_field)
+        out = stack.enter_context(_open(args.output, 'w'))
+        fieldnames = [fields.gloss, args.hash_field, args.state_field]
+        with records.RecordWriter(out, fmt, fieldnames, args.buffer_size) as writer:
+            for record in reglosser.regloss(read_inputs(args)):
+                writer.write(record)
+    history[reglosser.digest] = state
+    incremental.save_history(args.state, history)
+    print('reglossed {} of {} records, {} glossings changed'.format(
+        reglosser.reglossed, reglosser.reglossed + reglosser.kept, reglosser.changed,
+    ), file=sys.stderr)
+
+
+def stats(args: argparse.Namespace):
+    from .stats import CorpusStatistics, count_chunk
+    fields = fields_from_args(args)
+    options = dict(
+        fields=fields, group_field=args.group_field, diagnostics=args.diagnostics, glossed=args.glossed,
+    )
+    statistics = CorpusStatistics(**options)
+    if args.workers > 1:
+        from .parallel import chunked, map_chunks
+        fmt = args.format or records.guess_format(args.files[0])
+        lines = fmt == 'jsonl'
+        for result in map_chunks(
+            functools.partial(count_chunk, jsonl=lines, **options),
+            chunked(read_input_lines(args) if lines else read_inputs(args), args.chunk_size),
+            args.workers,
+        ):
+            statistics.merge(result)
+    else:
+        statistics.count_records(read_inputs(args))
+    output_format = args.output_format or records.guess_format(args.output, 'json')
+    with _open(args.output, 'w') as out:
+        if output_format in ('csv', 'tsv'):
+            statistics.write_csv(out, '\t' if output_format == 'tsv' else ',')
+        else:
+            statistics.write_json(out)
+
+
+def snapshot(args: argparse.Namespace):
+    from .snapshot import save
+    cache = None
+    if args.warm:
+        from .cache import GlossCache
+        cache = GlossCache(args.cache_size)
+        fields = fields_from_args(args)
+        for filename in args.warm:
+            with _open(filename, 'r') as f:
+                for record in records.read_records(f, args.format or records.guess_format(filename)):
+                    cache.gloss(*records.occurrence(record, fields))
+    save(args.output, cache)
+
+
+def build_flexcodes(args: argparse.Namespace):
+    from .flexcodes import build
+    build(args.output)
+
+
+def golden(args: argparse.Namespace):
+    from . import golden
+    glossings = golden.ENGINES[args.engine]
+    if args.generate:
+        golden.write(args.file, golden.generate(glossings))
+        return
+    mismatches = golden.diff(golden.read(args.file), glossings)
+    # golden file columns, followed by the actual glossing
+    golden.write_rows(sys.stdout, [
+        occurrence + (expected, actual) for occurrence, expected, actual in mismatches
+    ])
+    if mismatches:
+        sys.exit('{} mismatches'.format(len(mismatches)))
+
+
+def lookup(args: argparse.Namespace):
+    from .reverse import get_index
+    for match in getattr(get_index(), args.mode)(args.gloss):
+        print('{}\t{}\t{}'.format(match.flexcode, match.gloss, ','.join(match.conditions)))
+
+
+def serve(args: argparse.Namespace):
+    from .server import run
+    run(args.host, args.port, args.cache_size)
+
+
+def enrich_bulk(args: argparse.Namespace):
+    from . import bulk
+    fields = fields_from_args(args)
+    bts_field = args.bts_field or None
+    with _open(args.output, 'w') as out:
+        if args.workers > 1:
+            from .parallel import chunked, map_chunks
+            out.writelines(map_chunks(
+                functools.partial(
+                    bulk.enrich_bulk_chunk, fields=fields, tokens_field=args.tokens_field,
+                    bts_field=bts_field,
+                ),
+                chunked(bulk.bulk_items(read_input_lines(args)), args.chunk_size),
+                args.workers,
+            ))
+            return
+        out.writelines(bulk.enrich_bulk(
+            read_input_lines(args), bulk.BulkEnricher(fields, args.tokens_field, bts_field)
+        ))
+
+
+def parser() -> argparse.ArgumentParser:
+    from .bulk import BTS_FIELD, TOKENS_FIELD
+    from .incremental import HASH_FIELD, STATE_FIELD
+    from .sentences import TOKEN_FIELDS
+
+    p = argparse.ArgumentParser(
+        prog='aaew-linggloss',
+        description='Apply Leipzig Glossing Rules to TLA lemma occurrences.',
+    )
+    commands = p.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+
+    cmd = commands.add_parser(
+        'gloss', help='add glossings to JSONL/CSV/TSV records',
+    )
+    add_io_arguments(cmd)
+    add_field_arguments(cmd)
+    cmd.add_argument(
+        '--lemmas', metavar='FILE',
+        help='lemma list (JSONL/CSV/TSV) to take part of speech type and subtype from',
+    )
+    cmd.add_argument(
+        '--metrics', metavar='FILE',
+        help='write per category glossing metrics in Prometheus text format to FILE',
+    )
+    cmd.add_argument(
+        '--snapshot', metavar='FILE',
+        help='start from a snapshot written by the snapshot command, including its cache',
+    )
+    cmd.set_defaults(func=gloss)
+
+    cmd = commands.add_parser(
+        'regloss', help='update glossings of previously glossed records where needed',
+    )
+    add_io_arguments(cmd)
+    add_field_arguments(cmd)
+    cmd.add_argument(
+        '--state', required=True, metavar='FILE',
+        help='glossing states of previous runs, updated afterwards',
+    )
+    cmd.add_argument(
+        '--changelog', metavar='FILE', help='write changed glossings as JSONL to FILE',
+    )
+    cmd.add_argument(
+        '--hash-field', default=HASH_FIELD, metavar='NAME',
+        help='record field holding the glossing input hash (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--state-field', default=STATE_FIELD, metavar='NAME',
+        help='record field holding the digest of the glossing state (default: %(default)s)',
+    )
+    cmd.set_defaults(func=regloss)
+
+    cmd = commands.add_parser(
+        'stats', help='count glossings, flexcode categories and diagnostics of a corpus',
+    )
+    cmd.add_argument(
+        'files', nargs='*', default=['-'], metavar='FILE',
+        help='input files (default: read from stdin)',
+    )
+    cmd.add_argument(
+        '-o', '--output', default='-', metavar='FILE',
+        help='output file (default: write to stdout)',
+    )
+    cmd.add_argument(
+        '-f', '--format', choices=records.FORMATS,
+        help='record format (default: guessed from file extension, else jsonl)',
+    )
+    cmd.add_argument(
+        '--output-format', choices=['json', 'csv', 'tsv'],
+        help='output format (default: guessed from output file extension, else json)',
+    )
+    cmd.add_argument(
+        '-w', '--workers', type=int, default=1, metavar='N',
+        help='number of worker processes (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--chunk-size', type=int, default=10000, metavar='N',
+        help='number of records per worker task (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--group-field', metavar='NAME',
+        help='record field to group flexcode category counts by, e.g. a period',
+    )
+    cmd.add_argument(
+        '--diagnostics', action='store_true',
+        help='count diagnostics as well (glosses with the slower reference implementation)',
+    )
+    cmd.add_argument(
+        '--glossed', action='store_true',
+        help='count the glossings already present in the gloss field instead of glossing',
+    )
+    add_field_arguments(cmd)
+    cmd.set_defaults(func=stats)
+
+    cmd = commands.add_parser(
+        'bulk', help='add glossings to sentence tokens in Elasticsearch bulk NDJSON',
+    )
+    cmd.add_argument(
+        'files', nargs='*', default=['-'], metavar='FILE',
+        help='input files (default: read from stdin)',
+    )
+    cmd.add_argument(
+        '-o', '--output', default='-', metavar='FILE',
+        help='output file (default: write to stdout)',
+    )
+    cmd.add_argument(
+        '-w', '--workers', type=int, default=1, metavar='N',
+        help='number of worker processes (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--chunk-size', type=int, default=1000, metavar='N',
+        help='number of bulk items per worker task (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--tokens-field', default=TOKENS_FIELD, metavar='NAME',
+        help='document field holding the list of tokens (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--bts-field', default=BTS_FIELD, metavar='NAME',
+        help='token field for BTS glossing encodings, empty to omit (default: %(default)s)',
+    )
+    add_field_arguments(cmd, TOKEN_FIELDS)
+    cmd.set_defaults(func=enrich_bulk)
+
+    cmd = commands.add_parser(
+        'snapshot', help='write the built glossing state to a file for fast startup',
+    )
+    cmd.add_argument('output', metavar='FILE', help='snapshot file to write')
+    cmd.add_argument(
+        '--warm', nargs='+', metavar='RECORDS',
+        help='JSONL/CSV/TSV records to warm up a glossing cache with, which is included',
+    )
+    cmd.add_argument(
+        '-f', '--format', choices=records.FORMATS,
+        help='format of the warm-up records (default: guessed from file extension, else jsonl)',
+    )
+    cmd.add_argument(
+        '--cache-size', type=int, default=100000, metavar='N',
+        help='size of the warmed up cache (default: %(default)s)',
+    )
+    add_field_arguments(cmd)
+    cmd.set_defaults(func=snapshot)
+
+    cmd = commands.add_parser(
+        'build-flexcodes', help='regenerate data/flexcodes.bin from data/flexcodes.json',
+    )
+    cmd.add_argument(
+        '-o', '--output', metavar='FILE',
+        help='output file (default: data/flexcodes.bin inside the package)',
+    )
+    cmd.set_defaults(func=build_flexcodes)
+
+    cmd = commands.add_parser(
+        'golden', help='compare glossings with a golden file, or generate one',
+    )
+    cmd.add_argument('file', metavar='FILE', help='gzipped TSV golden file')
+    cmd.add_argument(
+        '-e', '--engine', default='table',
+        choices=['reference', 'engine', 'table', 'vectorized'],
+        help='glossing implementation to check (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--generate', action='store_true',
+        help='write FILE from the selected implementation instead of comparing',
+    )
+    cmd.set_defaults(func=golden)
+
+    cmd = commands.add_parser(
+        'lookup', help='list the flexcodes producing a glossing',
+    )
+    cmd.add_argument('gloss', metavar='GLOSS', help='glossing or glossing fragment')
+    mode = cmd.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--prefix', dest='mode', action='store_const', const='prefix',
+        help='match glossings starting with GLOSS',
+    )
+    mode.add_argument(
+        '--substring', dest='mode', action='store_const', const='substring',
+        help='match glossings containing GLOSS',
+    )
+    cmd.set_defaults(func=lookup, mode='exact')
+
+    cmd = commands.add_parser(
+        'serve', help='serve glossings as JSON over HTTP',
+    )
+    cmd.add_argument(
+        '--host', default='127.0.0.1', help='address to listen on (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '-p', '--port', type=int, default=8080, help='port to listen on (default: %(default)s)',
+    )
+    cmd.add_argument(
+        '--cache-size', type=int, default=100000, metavar='N',
+        help='memoize the glossings of up to N distinct occurrences (default: %(default)s)',
+    )
+    cmd.set_defaults(func=serve)
+
+    return p
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+""" Diagnostics raised while glossing.
+
+:func:`aaew_linggloss.computeLingGlossing` reports suspicious and invalid input to an
+optional collector, e.g. for quality assurance passes over a whole corpus::
+
+    >>> from aaew_linggloss import computeLingGlossing
+    >>> collector = DiagnosticsCollector()
+    >>> computeLingGlossing(70060, '1', {'type': 'substantive'}, diagnostics=collector)
+    'N:sg:stc'
+    >>> collector.counts()
+    {'noun_no_gender': 1}
+
+Without a collector, no diagnostics are formatted or recorded at all.
+"""
+from collections import Counter, namedtuple
+
+
+WARNING = 'Warning'
+ERROR = 'Error'
+
+DiagnosticKind = namedtuple('DiagnosticKind', ['code', 'severity', 'message'])
+DiagnosticKind.__doc__ = """ type of a diagnostic, identified by a short ``code``. """
+
+INVALID_FLEXCODE = DiagnosticKind('invalid_flexcode', ERROR, 'Invalid flexcode [no number]')
+SUSPICIOUS_POS = DiagnosticKind('suspicious_pos', WARNING, 'Suspicious POS<>flexcode combination')
+INVALID_POS = DiagnosticKind('invalid_pos', ERROR, 'Invalid POS<>flexcode combination')
+UNHANDLED_FLEXCODE = DiagnosticKind('unhandled_flexcode', ERROR, 'Unhandled flex code')
+SC_UNDERSPECIFIED = DiagnosticKind('sc_underspecified', WARNING, 'Underspecified suffix conjugation flexcode (form, xxx00x)')
+SC_INVALID_FORM = DiagnosticKind('sc_invalid_form', ERROR, 'Invalid suffix conjugation flexcode (form, pattern xxxXXx)')
+RES_INVALID = DiagnosticKind('res_invalid', ERROR, 'Invalid resultative flexcode (pattern x2[0-7]xxx)')
+RES_UNDERSPECIFIED = DiagnosticKind('res_underspecified', WARNING, 'Underspecified resultative form (ending, pattern x2x00x)')
+RES_INVALID_ENDING = DiagnosticKind('res_invalid_ending', ERROR, 'Invalid resultative flexcode (ending, pattern x2x[1-13/31/34/38]x)')
+PTCP_INVALID = DiagnosticKind('ptcp_invalid', ERROR, 'Invalid participle flexcode (pattern x3[0-2]xxx)')
+PTCP_UNDERSPECIFIED = DiagnosticKind('ptcp_underspecified', WARNING, 'Underspecified participle flexcode (genus verbi/number/gender, pattern x3x00x)')
+PTCP_INVALID_FORM = DiagnosticKind('ptcp_invalid_form', ERROR, 'Invalid participle flexcode (genus verbi/number/gender, pattern x3x[1-12/32/38]x)')
+REL_INVALID = DiagnosticKind('rel_invalid', ERROR, 'Invalid participle flexcode (pattern x4[0-2]xxx)')
+REL_UNDERSPECIFIED = DiagnosticKind('rel_underspecified', WARNING, 'Underspecified relafive form flexcode (number/gender/tempus, pattern x4x00x)')
+REL_INVALID_FORM = DiagnosticKind('rel_invalid_form', ERROR, 'Invalid relafive form flexcode (number/gender/tempus, pattern x4x[1-12/31/32/38]x)')
+REL_ANTERIOR_REDUPL = DiagnosticKind('rel_anterior_redupl', WARNING, 'Anterior relative form with reduplicating stem')
+IMP_INVALID = DiagnosticKind('imp_invalid', ERROR, 'Invalid imperative flexcode (pattern 5[0-2]xxx)')
+IMP_UNDERSPECIFIED = DiagnosticKind('imp_underspecified', WARNING, 'Underspecified imperative flexcode (pattern 5x0xx)')
+IMP_INVALID_FORM = DiagnosticKind('imp_invalid_form', ERROR, 'Invalid imperative flexcode (pattern 5x[1-4]xx)')
+NOMINAL_INVALID_SUFFIX = DiagnosticKind('nominal_invalid_suffix', ERROR, 'Invalid nominal verb form flexcode (pattern 7xx[1-5]x)')
+NOMINAL_UNDERSPECIFIED = DiagnosticKind('nominal_underspecified', ERROR, 'Underspecified nominal/adverbial verb form flexcode (pattern 7x0xx)')
+NOMINAL_INVALID_FORM = DiagnosticKind('nominal_invalid_form', ERROR, 'Invalid nominal verb form flexcode (pattern 7x[1-5]xx)')
+COMPL_INF_INVALID_SUFFIX = DiagnosticKind('compl_inf_invalid_suffix', ERROR, 'Invalid complementary infinitive flexcode (pattern 62x0x)')
+COMPL_INF_UNDERSPECIFIED = DiagnosticKind('compl_inf_underspecified', WARNING, 'Underspecified(?) complementary infinitive flexcode (pattern 620?xx)')
+COMPL_INF_INVALID_FORM = DiagnosticKind('compl_inf_invalid_form', ERROR, 'Invalid complementary infinitive flexcode (pattern 62[1-5]0x)')
+NEG_COMPL_INVALID_SUFFIX = DiagnosticKind('neg_compl_invalid_suffix', ERROR, 'Invalid negative complement flexcode (pattern 63x0x)')
+NEG_COMPL_UNDERSPECIFIED = DiagnosticKind('neg_compl_underspecified', WARNING, 'Underspecified negative complement flexcode (pattern 630xx)')
+NEG_COMPL_INVALID_FORM = DiagnosticKind('neg_compl_invalid_form', ERROR, 'Invalid negative complement flexcode (pattern 63[1-6]0x)')
+NOUN_INVALID_STATE = DiagnosticKind('noun_invalid_state', ERROR, 'Invalid substantive flexcode (state; pattern 70x[0/5/6]x)')
+NOUN_ERRONEOUS_STPR = DiagnosticKind('noun_erroneous_stpr', WARNING, 'Erroneous substantive stat.pr. flex code [state] (pattern 70x5x)')
+NOUN_INVALID_NUMBER = DiagnosticKind('noun_invalid_number', ERROR, 'Invalid substantive flexcode (number; pattern 70[0/1/3]xx)')
+NOUN_NO_GENDER = DiagnosticKind('noun_no_gender', WARNING, 'Underspecified substantive form: no gender on noun')
+ADJ_UNDERSPECIFIED = DiagnosticKind('adj_underspecified', WARNING, 'Underspecified adjective flexcode (number/gender; pattern 71000)')
+ADJ_INVALID_FORM = DiagnosticKind('adj_invalid_form', ERROR, 'Invalid adjective flexcode (number/gender; pattern 710[1-6]0)')
+ADJ_SUFFIX_WITHOUT_STPR = DiagnosticKind('adj_suffix_without_stpr', ERROR, 'Invalid adjective flexcode (Suffix without stat.pr.; pattern 711[0/1?-5/6?]0)')
+ADJ_SUFFIX_PRONOUN = DiagnosticKind('adj_suffix_pronoun', ERROR, 'Invalid adjective flexcode (suffix pronoun instead of dep. pronoun; pattern 711[15-24])')
+ADJ_INVALID_PRONOUN = DiagnosticKind('adj_invalid_pronoun', ERROR, 'Invalid adjective flexcode (pronoun; pattern 711[15-24])')
+ADJ_INVALID_STPR_FORM = DiagnosticKind('adj_invalid_stpr_form', ERROR, 'Invalid adjective flexcode (number/gender; pattern 712[0-6]x)')
+ADJ_INVALID = DiagnosticKind('adj_invalid', ERROR, 'Invalid adjective flexcode (number/gender; pattern 71[0-2][0-6]x)')
+ADV_INVALID = DiagnosticKind('adv_invalid', ERROR, 'Invalid adverbial flexcode (pattern 7200x)')
+NUM_UNDERSPECIFIED = DiagnosticKind('num_underspecified', WARNING, 'Underspecified number form (pattern 7400x)')
+NUM_INVALID_FORM = DiagnosticKind('num_invalid_form', ERROR, 'Invalid number form (pattern 740[1-4]x)')
+POSS_INVALID = DiagnosticKind('poss_invalid', ERROR, 'Invalid possessive article flexcode (pattern 8000x)')
+REL_PRON_INVALID_PRONOUN = DiagnosticKind('rel_pron_invalid_pronoun', ERROR, 'Invalid relative pronoun flexcode (pronoun, pattern 8xx0x / 8xx15-24)')
+REL_PRON_UNDERSPECIFIED_FORM = DiagnosticKind('rel_pron_underspecified_form', WARNING, 'Underspecified(?) relative pronoun form (pattern 8[0-1][1?-4]xx)')
+REL_PRON_UNDERSPECIFIED = DiagnosticKind('rel_pron_underspecified', WARNING, 'Underspecified relative pronoun form (pattern 8[0-1][1?-4]xx)')
+REL_PRON_INVALID_FORM = DiagnosticKind('rel_pron_invalid_form', ERROR, 'Invalid relative pronoun flexcode (gender/number, pattern 8[0-1][1-4]xx)')
+ADMIRATIVE_INVALID = DiagnosticKind('admirative_invalid', ERROR, 'Invalid admirativ suffix flexcode (pattern 9000x)')
+POST_PTCP_INVALID = DiagnosticKind('post_ptcp_invalid', ERROR, 'Invalid posterior participle flexcode (pattern 910[0-2]0)')
+PREP_INVALID = DiagnosticKind('prep_invalid', ERROR, 'Invalid preposition flexcode (pattern 9300x)')
+PTCL_INVALID = DiagnosticKind('ptcl_invalid', ERROR, 'Invalid particle flexcode (pronoun; pattern 9400x, 94015-24)')
+AUX_INVALID = DiagnosticKind('aux_invalid', WARNING, 'Invalid auxilliary flexcode (form, pattern 7620x, 7630x-43x)')
+
+KINDS = {
+    kind.code: kind for kind in globals().values() if isinstance(kind, DiagnosticKind)
+}
+
+
+class Diagnostic(namedtuple('Diagnostic', ['kind', 'pos', 'sub_pos', 'flexcode', 'glossing'])):
+    """ a single diagnostic, with the offending occurrence and the glossing computed
+    up to the point the problem was detected.
+    """
+    __slots__ = ()
+
+    @property
+    def code(self) -> str:
+        return self.kind.code
+
+    @property
+    def severity(self) -> str:
+        return self.kind.severity
+
+    def __str__(self):
+        return '{}\t{}\t{}\t{}: {}: {}'.format(
+            self.pos, self.sub_pos, self.flexcode,
+            self.kind.severity, self.kind.message, self.glossing,
+        )
+
+
+class DiagnosticsCollector:
+    """ counts diagnostics per kind, optionally keeping the first ``max_records``
+    diagnostics for inspection.
+
+    :param max_records: number of :class:`Diagnostic` records to keep; ``None`` keeps all
+    """
+
+    def __init__(self, max_records: int = 0):
+        self.max_records = max_records
+        self.counter = Counter()
+        self.records = []
+
+    def report(self, kind: DiagnosticKind, pos, sub_pos, flexcode, glossing: str):
+        self.counter[kind.code] += 1
+        if self.max_records is None or len(self.records) < self.max_records:
+            self.records.append(Diagnostic(kind, pos, sub_pos, flexcode, glossing))
+
+    def counts(self, severity: str = None) -> dict:
+        """ return the number of diagnostics per kind code, optionally only those
+        of one severity.
+        """
+        return {
+            code: count for code, count in self.counter.items()
+            if severity is None or KINDS[code].severity == severity
+        }
+
+    def total(self, severity: str = None) -> int:
+        return sum(self.counts(severity).values())
+
+    def merge(self, other: 'DiagnosticsCollector'):
+        """ add the counts and records of another collector, e.g. from a worker process.
+        """
+        self.counter.update(other.counter)
+        for record in other.records:
+            if self.max_records is not None and len(self.records) >= self.max_records:
+                break
+            self.records.append(record)
+
+    def clear(self):
+        self.counter.clear()
+        self.records = []
+
+    def __iter__(self):
+        return iter(self.records)
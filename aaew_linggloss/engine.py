@@ -0,0 +1,585 @@
+""" Compiled form of the glossing rules implemented by
+:func:`aaew_linggloss.computeLingGlossing`.
+
+At import time, the flexcode categories are compiled into a dispatch table indexed by
+the first three digits of a (negation-stripped) flexcode, and the forms, states and
+stem type modifiers of every category are compiled into tuples indexed by the
+remaining digits. Glossing a lemma occurrence thus costs a constant number of lookups,
+regardless of how far down the reference implementation's ``if``/``elif`` cascade
+its flexcode would have been handled.
+
+:func:`aaew_linggloss.computeLingGlossing` remains the reference implementation;
+results of :func:`compute_ling_glossing` are identical.
+"""
+from collections import namedtuple
+
+from .mapping import (
+    lingGlossFromLemmaIDDict,
+    dictPOSGlossings,
+    dictSubPOSGlossings,
+    dictPOSGlossingsDefault,
+    dictSubPOSGlossingsDefault,
+)
+
+
+LEMMA = 'lemma'
+INVALID = 'invalid'
+STATUS = 'status'
+SUFFIX_CONJUGATION = 'suffix_conjugation'
+RESULTATIVE = 'resultative'
+PARTICIPLE = 'participle'
+RELATIVE_FORM = 'relative_form'
+IMPERATIVE = 'imperative'
+NOMINAL_VERB_FORM = 'nominal_verb_form'
+COMPLEMENTARY_INFINITIVE = 'complementary_infinitive'
+NEGATIVE_COMPLEMENT = 'negative_complement'
+INFINITIVE = 'infinitive'
+SUBSTANTIVE = 'substantive'
+ADJECTIVE = 'adjective'
+ADVERB = 'adverb'
+NUMERAL = 'numeral'
+POSSESSIVE_ARTICLE = 'possessive_article'
+RELATIVE_PRONOUN = 'relative_pronoun'
+ADMIRATIVE = 'admirative'
+POSTERIOR_PARTICIPLE = 'posterior_participle'
+PREPOSITION = 'preposition'
+PARTICLE = 'particle'
+AUXILIARY = 'auxiliary'
+UNRESOLVED = 'unresolved'
+
+CATEGORIES = (
+    LEMMA, INVALID, STATUS,
+    SUFFIX_CONJUGATION, RESULTATIVE, PARTICIPLE, RELATIVE_FORM, IMPERATIVE,
+    NOMINAL_VERB_FORM, COMPLEMENTARY_INFINITIVE, NEGATIVE_COMPLEMENT, INFINITIVE,
+    SUBSTANTIVE, ADJECTIVE, ADVERB, NUMERAL, POSSESSIVE_ARTICLE, RELATIVE_PRONOUN,
+    ADMIRATIVE, POSTERIOR_PARTICIPLE, PREPOSITION, PARTICLE, AUXILIARY,
+    UNRESOLVED,
+)
+
+# stem types as returned by :func:`aaew_linggloss.stemType`, indexed by ``Context.stem``
+STEMS = ('', 'inf', 'gem', 'strong')
+STEM_NONE, STEM_INF, STEM_GEM, STEM_STRONG = range(len(STEMS))
+
+_STEM_TYPES = {
+    'verb_3-inf': STEM_INF,
+    'verb_4-inf': STEM_INF,
+    'verb_5-inf': STEM_INF,
+    'verb_caus_3-inf': STEM_INF,
+    'verb_caus_4-inf': STEM_INF,
+    'verb_irr': STEM_INF,
+    'verb_2-gem': STEM_GEM,
+    'verb_3-gem': STEM_GEM,
+    'verb_caus_2-gem': STEM_GEM,
+    'verb_caus_3-gem': STEM_GEM,
+    'verb_2-lit': STEM_STRONG,
+    'verb_3-lit': STEM_STRONG,
+    'verb_4-lit': STEM_STRONG,
+    'verb_5-lit': STEM_STRONG,
+    'verb_6-lit': STEM_STRONG,
+    'verb_caus_2-lit': STEM_STRONG,
+    'verb_caus_3-lit': STEM_STRONG,
+    'verb_caus_4-lit': STEM_STRONG,
+    'verb_caus_5-lit': STEM_STRONG,
+}
+
+# part of speech classes the flexcode rules tell apart: (stem, noun, adjective)
+SHAPES = (
+    (STEM_NONE, 'N', 'ADJ'),
+    (STEM_INF, 'N', 'ADJ'),
+    (STEM_GEM, 'N', 'ADJ'),
+    (STEM_STRONG, 'N', 'ADJ'),
+    (STEM_NONE, 'N.m', 'ADJ'),
+    (STEM_NONE, 'N.f', 'ADJ'),
+    (STEM_NONE, 'N', 'PREP-adjz'),
+    (STEM_NONE, 'N', 'N-adjz'),
+)
+
+_NOUN_BASES = {
+    'substantive_masc': 'N.m',
+    'substantive_fem': 'N.f',
+}
+
+_ADJECTIVE_BASES = {
+    'nisbe_adjective_preposition': 'PREP-adjz',
+    'nisbe_adjective_substantive': 'N-adjz',
+}
+
+
+Context = namedtuple(
+    'Context',
+    ['stem', 'noun', 'adjective', 'posGloss', 'defaultGloss', 'shape']
+)
+Context.__doc__ = """ everything about a lemma's part of speech the glossing rules depend on.
+
+:param stem: index into :data:`STEMS`
+:param noun: base glossing of substantives (``N``, ``N.m`` or ``N.f``)
+:param adjective: base glossing of adjectives (``ADJ``, ``PREP-adjz`` or ``N-adjz``)
+:param posGloss: glossing derived from part of speech, see :func:`aaew_linggloss.lingGlossFromPOS`
+:param defaultGloss: default glossing for part of speech, see :func:`aaew_linggloss.defaultFlexFromPOS`
+:param shape: index into :data:`SHAPES`
+"""
+
+
+def split_pos_subpos(pos_subpos) -> tuple:
+    """ extract type and subtype from a ``pos_subpos`` dictionary the same way
+    :func:`aaew_linggloss.computeLingGlossing` does.
+
+    >>> split_pos_subpos({'type': 'verb', 'subtype': 'verb_3-lit'})
+    ('verb', 'verb_3-lit')
+
+    >>> split_pos_subpos(None)
+    ('', '')
+    """
+    pos = ''
+    sub_pos = ''
+    if pos_subpos:
+        pos = pos_subpos.get('type')
+        if len(pos_subpos) > 1:
+            sub_pos = pos_subpos.get('subtype')
+    return pos, sub_pos
+
+
+def _pos_lookup(pos, sub_pos, sub_pos_dict, pos_dict) -> str:
+    if sub_pos:
+        glossing = sub_pos_dict.get(sub_pos)
+        if glossing:
+            return glossing
+    if pos:
+        glossing = pos_dict.get(pos)
+        if glossing:
+            return glossing
+    return ''
+
+
+_CONTEXTS = {}
+
+
+def context(pos, sub_pos) -> Context:
+    """ compile part of speech type and subtype into a :class:`Context`.
+    Contexts are cached, so this is cheap to call repeatedly.
+
+    >>> context('verb', 'verb_3-inf').stem == STEM_INF
+    True
+    """
+    # values other than strings can not match any rule, so they all behave alike
+    if not isinstance(pos, str):
+        pos = None
+    if not isinstance(sub_pos, str):
+        sub_pos = None
+    key = (pos, sub_pos)
+    ctx = _CONTEXTS.get(key)
+    if ctx is None:
+        stem = _STEM_TYPES.get(sub_pos, STEM_NONE)
+        noun = _NOUN_BASES.get(sub_pos, 'N') if pos == 'substantive' else 'N'
+        adjective = _ADJECTIVE_BASES.get(sub_pos, 'ADJ')
+        ctx = _CONTEXTS[key] = Context(
+            stem=stem,
+            noun=noun,
+            adjective=adjective,
+            posGloss=_pos_lookup(pos, sub_pos, dictSubPOSGlossings, dictPOSGlossings),
+            defaultGloss=_pos_lookup(
+                pos, sub_pos, dictSubPOSGlossingsDefault, dictPOSGlossingsDefault
+            ),
+            shape=SHAPES.index((stem, noun, adjective)),
+        )
+    return ctx
+
+
+def shape_context(shape: int) -> Context:
+    """ create a context representing one of the part of speech classes in
+    :data:`SHAPES`, with empty part of speech glossings.
+    """
+    stem, noun, adjective = SHAPES[shape]
+    return Context(stem, noun, adjective, '', '', shape)
+
+
+def _table(size: int, entries: dict, default='') -> tuple:
+    return tuple(
+        entries.get(i, default) for i in range(size)
+    )
+
+
+def _state(flex: int) -> str:
+    return ':stpr' if flex % 10 else ''
+
+
+# Status-Codes (flexcodes 0-9)
+_STATUS_SUFFIXES = _table(10, {
+    0: '(infl. unedited)',
+    1: '(infl. ?)',
+    2: '(infl. ?)',
+    4: '(unclear)',
+    5: '(problematic)',
+    9: '(to be reviewed)',
+})
+
+
+def _status(flexcode: int, ctx: Context) -> tuple:
+    if flexcode == 3:
+        return STATUS, ctx.defaultGloss or '(infl. unspecified)', '', ''
+    return STATUS, ctx.posGloss, _STATUS_SUFFIXES[flexcode], ''
+
+
+# Suffixkonjugation
+_SC_FORMS = _table(100, {
+    2: '.act', 4: '.pass', 10: '.act', 12: '.pass', 14: '.act', 16: '.pass',
+    17: '-pass', 18: '.act', 19: '-pass', 20: '.act', 22: '.act', 24: '.pass',
+    28: '-pass', 30: '-pass', 32: '-pass', 36: '-pass', 38: '.act-ant',
+    40: '.act-ant', 42: '.act-ant', 44: '-ant-pass', 48: '-ant-pass',
+    50: '.act-cnsv', 54: '.act-cnsv', 56: '-cnsv-pass', 57: '-cnsv-pass',
+    60: '.act-oblv', 61: '.act', 64: '.act-oblv', 65: '.act', 66: '-oblv-pass',
+    67: '-pass', 70: '-oblv-pass', 71: '-pass', 72: '.act-post', 73: '.act',
+    76: '.act-post', 77: '.act', 78: '-post-pass', 79: '-pass', 80: '.act-ant',
+    81: '-ant-pass', 82: '-post-pass', 83: '-pass', 84: '.act-compl',
+    85: '.act-compl', 86: '.pass-compl', 87: '.pass-compl', 90: '.act',
+    91: '.pass', 92: '.act', 93: '.pass', 94: '.pass', 95: '-pass', 96: '-pass',
+    97: '.act', 98: '.pass', 99: '.act-compl',
+})
+# stem-dependent base glossings (jrr, sDmm, nDrr)
+_SC_STEM_BASES = {
+    10: {STEM_INF: 'V~ipfv'},
+    12: {STEM_STRONG: 'V~post', STEM_INF: 'V~post'},
+    36: {STEM_INF: 'V~ipfv'},
+    92: {STEM_INF: 'V~ipfv'},
+    93: {STEM_STRONG: 'V~post', STEM_INF: 'V~post'},
+}
+_SC_BASES = tuple(
+    _table(100, {
+        form: bases[stem] for form, bases in _SC_STEM_BASES.items() if stem in bases
+    }, 'V\\tam')
+    for stem in range(len(STEMS))
+)
+
+
+def _suffix_conjugation(flex: int, ctx: Context) -> tuple:
+    form = flex % 1000 // 10
+    return _SC_BASES[ctx.stem][form], _SC_FORMS[form], _state(flex)
+
+
+# Resultativ
+_RES_FORMS = _table(100, {
+    1: '-1sg', 2: '-2sg.m', 3: '-2sg.f', 4: '-3sg.m', 34: '-3sg', 5: '-3sg.f',
+    6: '-1pl', 7: '-2pl', 8: '-3pl.m', 38: '-3pl', 9: '-3pl.f', 10: '-2du',
+    11: '-3du.m', 31: '-3du', 12: '-3du.f', 13: '-1du',
+})
+
+
+def _resultative(flex: int, ctx: Context) -> tuple:
+    return 'V\\res', _RES_FORMS[flex % 1000 // 10], ''
+
+
+# Partizip
+_PTCP_FORMS = _table(100, {
+    1: '.act.m.sg', 2: '.act.f.sg', 32: '.act.f', 3: '.act.m.pl', 4: '.act.f.pl',
+    5: '.act.m.du', 6: '.act.f.du', 7: '.pass.m.sg', 8: '.pass.f.sg',
+    38: '.pass.f', 9: '.pass.m.pl', 10: '.pass.f.pl', 11: '.pass.m.du',
+    12: '.pass.f.du',
+})
+
+
+def _participle(flex: int, ctx: Context) -> tuple:
+    if flex % 10000 // 1000 == 1 and ctx.stem == STEM_INF:
+        base = 'V~ptcp.distr'
+    else:
+        base = 'V\\ptcp'
+    return base, _PTCP_FORMS[flex % 1000 // 10], _state(flex)
+
+
+# Relativform
+_REL_FORMS = _table(100, {
+    1: '.m.sg-ant', 31: '.m-ant', 2: '.f.sg-ant', 32: '.f-ant', 3: '.m.pl-ant',
+    4: '.f.pl-ant', 5: '.m.du-ant', 6: '.f.du-ant', 7: '.m.sg', 8: '.f.sg',
+    38: '.f', 9: '.m.pl', 10: '.f.pl', 11: '.m.du', 12: '.f.du',
+})
+# reduplicating stems yield imperfective relative forms, unless anterior
+_REL_REDUPL_BASES = tuple(
+    'V\\rel' if form.endswith('-ant') else 'V~rel.ipfv'
+    for form in _REL_FORMS
+)
+
+
+def _relative_form(flex: int, ctx: Context) -> tuple:
+    form = flex % 1000 // 10
+    if flex % 10000 // 1000 == 1 and ctx.stem == STEM_INF:
+        base = _REL_REDUPL_BASES[form]
+    else:
+        base = 'V\\rel'
+    return base, _REL_FORMS[form], _state(flex)
+
+
+# Imperativ
+_IMP_FORMS = _table(100, {1: '.sg', 2: '.pl', 3: '.du'})
+
+
+def _imperative(flex: int, ctx: Context) -> tuple:
+    return 'V\\imp', _IMP_FORMS[flex % 1000 // 10], _state(flex)
+
+
+# Nominale Verbalformen
+_NOMINAL_FORMS = _table(10, {
+    0: '\\nmlz/advz', 1: '\\nmlz.m', 2: '\\nmlz.m', 3: '\\nmlz.f', 4: '\\nmlz.f',
+    5: '\\nmlz',
+})
+
+
+def _nominal_verb_form(flex: int, ctx: Context) -> tuple:
+    return 'V', _NOMINAL_FORMS[flex % 1000 // 100], _state(flex)
+
+
+# Komplementsinfinitive
+_COMPL_INF_FORMS = _table(10, {1: '.f', 2: '.f', 3: '.f', 4: '.m', 5: '.f'})
+
+
+def _complementary_infinitive(flex: int, ctx: Context) -> tuple:
+    return 'V\\adv.inf', _COMPL_INF_FORMS[flex % 1000 // 100], _state(flex)
+
+
+# Negativkomplement
+def _negative_complement(flex: int, ctx: Context) -> tuple:
+    return 'V\\advz', '', _state(flex)
+
+
+# Infinitive
+def _infinitive(flex: int, ctx: Context) -> tuple:
+    return 'V\\inf', '', _state(flex)
+
+
+# Substantive
+_NOUN_NUMBERS = _table(10, {0: ':sg', 1: ':pl', 3: ':du'})
+# indexed by last two digits: state digit, suffix digit
+_NOUN_STATES = tuple(
+    ':stpr' if i % 10 else {5: ':stpr', 6: ':stc'}.get(i // 10, '')
+    for i in range(100)
+)
+
+
+def _substantive(flex: int, ctx: Context) -> tuple:
+    flex %= 1000
+    return ctx.noun, _NOUN_NUMBERS[flex // 100], _NOUN_STATES[flex % 100]
+
+
+# Adjektive
+_ADJ_FORMS = _table(10, {
+    1: ':m.sg', 2: ':f.sg', 3: ':m.pl', 4: ':f.pl', 5: ':m.du', 6: ':f.du',
+})
+_ADJ_STPR_FORMS = _table(10, {
+    0: ':m.sg', 1: ':f.sg', 2: ':m.pl', 3: ':f.pl', 4: ':m.du', 5: ':f.du',
+})
+
+
+def _adjective_entry(flex: int) -> tuple:
+    """ (base glossing or ``None`` for part of speech dependent base, form, state)
+    of the last three flexcode digits
+    """
+    stateFlex = flex // 100
+    if stateFlex == 0:
+        return None, _ADJ_FORMS[flex // 10], ''
+    elif stateFlex == 1:
+        return None, '', ':stpr' if 1 <= flex % 100 <= 9 else ''
+    elif stateFlex == 2:
+        if flex // 10 == 26: # nꜣ:nfr=f
+            return 'vblz-ADJ', '', _state(flex)
+        return None, _ADJ_STPR_FORMS[flex // 10 % 10], _state(flex)
+    return None, '', ''
+
+
+_ADJECTIVES = tuple(
+    _adjective_entry(flex) for flex in range(1000)
+)
+
+
+def _adjective(flex: int, ctx: Context) -> tuple:
+    base, form, state = _ADJECTIVES[flex % 1000]
+    return base or ctx.adjective, form, state
+
+
+# Adverbien
+def _adverb(flex: int, ctx: Context) -> tuple:
+    return 'ADV', '', ':stpr'
+
+
+# Zahlen
+_NUM_FORMS = _table(100, {1: '.ord:sg.m', 2: '.ord:sg.f', 3: '.card:m', 4: '.card:f'})
+
+
+def _numeral(flex: int, ctx: Context) -> tuple:
+    return 'NUM', _NUM_FORMS[flex % 1000 // 10], _state(flex)
+
+
+# Possessivartikel
+def _possessive_article(flex: int, ctx: Context) -> tuple:
+    return 'ART.poss', '', _state(flex)
+
+
+# Relativpronomina
+_REL_PRON_FORMS = _table(100, {
+    1: ':m.sg', 2: ':f.sg', 3: ':m.pl', 4: ':f.pl',
+    11: ':m.sg', 12: ':f.sg', 13: ':m.pl', 14: ':f.pl',
+})
+
+
+def _pronoun_state(flex: int) -> str:
+    return ':stpr' if 1 <= flex % 100 <= 9 else ''
+
+
+def _relative_pronoun(flex: int, ctx: Context) -> tuple:
+    flex %= 10000
+    return 'PRON.rel', _REL_PRON_FORMS[flex // 100], _pronoun_state(flex)
+
+
+# Admirativsuffix
+def _admirative(flex: int, ctx: Context) -> tuple:
+    return 'ADJ-excl', '', _state(flex)
+
+
+# sdm.tj.fj
+_POST_PTCP_FORMS = _table(100, {0: '-m.sg', 10: '-f.sg', 20: '-m.pl'})
+
+
+def _posterior_participle(flex: int, ctx: Context) -> tuple:
+    return 'V:ptcp.post', _POST_PTCP_FORMS[flex % 100], ''
+
+
+# Präpositionen
+def _preposition(flex: int, ctx: Context) -> tuple:
+    return 'PREP', '', _state(flex)
+
+
+# Partikeln
+def _particle(flex: int, ctx: Context) -> tuple:
+    return 'PTCL', '', _pronoun_state(flex)
+
+
+# Auxilliar
+def _auxiliary(flex: int, ctx: Context) -> tuple:
+    return 'AUX', '', _state(flex)
+
+
+def _unresolved(flex: int, ctx: Context) -> tuple:
+    return ctx.posGloss or '(unresolved)', '', ''
+
+
+HANDLERS = {
+    SUFFIX_CONJUGATION: _suffix_conjugation,
+    RESULTATIVE: _resultative,
+    PARTICIPLE: _participle,
+    RELATIVE_FORM: _relative_form,
+    IMPERATIVE: _imperative,
+    NOMINAL_VERB_FORM: _nominal_verb_form,
+    COMPLEMENTARY_INFINITIVE: _complementary_infinitive,
+    NEGATIVE_COMPLEMENT: _negative_complement,
+    INFINITIVE: _infinitive,
+    SUBSTANTIVE: _substantive,
+    ADJECTIVE: _adjective,
+    ADVERB: _adverb,
+    NUMERAL: _numeral,
+    POSSESSIVE_ARTICLE: _possessive_article,
+    RELATIVE_PRONOUN: _relative_pronoun,
+    ADMIRATIVE: _admirative,
+    POSTERIOR_PARTICIPLE: _posterior_participle,
+    PREPOSITION: _preposition,
+    PARTICLE: _particle,
+    AUXILIARY: _auxiliary,
+    UNRESOLVED: _unresolved,
+}
+
+
+def category(flex: int) -> str:
+    """ determine the category of a flexcode with its negation digit stripped
+    (i.e. ``0 <= flex < 100000``), in the same order the reference implementation
+    tests for them. Status codes are not considered.
+
+    >>> category(10930)
+    'suffix_conjugation'
+    """
+    if (flex // 10000) == 1 or 82 <= (flex // 1000) <= 87:
+        return SUFFIX_CONJUGATION
+    elif (flex // 10000) == 2:
+        return RESULTATIVE
+    elif (flex // 10000) == 3:
+        return PARTICIPLE
+    elif (flex // 10000) == 4:
+        return RELATIVE_FORM
+    elif (flex // 10000) == 5:
+        return IMPERATIVE
+    elif (flex // 1000) == 60:
+        return NOMINAL_VERB_FORM
+    elif (flex // 1000) == 62:
+        return COMPLEMENTARY_INFINITIVE
+    elif (flex // 1000) == 63:
+        return NEGATIVE_COMPLEMENT
+    elif (flex // 1000) == 61 or 64 <= (flex // 1000) <= 69:
+        return INFINITIVE
+    elif (flex // 1000) == 70:
+        return SUBSTANTIVE
+    elif (flex // 1000) == 71:
+        return ADJECTIVE
+    elif (flex // 1000) == 72:
+        return ADVERB
+    elif (flex // 1000) == 74:
+        return NUMERAL
+    elif (flex // 100) == 800:
+        return POSSESSIVE_ARTICLE
+    elif (flex // 100) >= 801 and (flex // 1000) <= 81:
+        return RELATIVE_PRONOUN
+    elif (flex // 1000) == 90:
+        return ADMIRATIVE
+    elif (flex // 100) == 910:
+        return POSTERIOR_PARTICIPLE
+    elif (flex // 100) == 930:
+        return PREPOSITION
+    elif (flex // 100) == 940:
+        return PARTICLE
+    elif (flex // 1000) == 96:
+        return AUXILIARY
+    return UNRESOLVED
+
+
+# categories only depend on the first three of five digits
+DISPATCH = tuple(
+    (category(prefix * 100), HANDLERS[category(prefix * 100)])
+    for prefix in range(1000)
+)
+
+
+def analyze(flexcode, ctx: Context) -> tuple:
+    """ apply the glossing rules to a flexcode within a part of speech context,
+    without lemma ID based glossing.
+
+    >>> analyze(70060, context('substantive', 'substantive_masc'))
+    ('substantive', 'N.m', ':sg', ':stc')
+
+    :returns: tuple of category, base glossing, form and state; the glossing is the
+        concatenation of the last three
+    """
+    try:
+        flexcode = int(flexcode)
+    except ValueError:
+        return INVALID, '(invalid code)', '', ''
+    if flexcode < 0:
+        flexcode = -flexcode
+    if flexcode <= 9:
+        return _status(flexcode, ctx)
+    flex = flexcode % 100000 # Negationsstelle x00000 abschneiden
+    cat, handler = DISPATCH[flex // 100]
+    base, form, state = handler(flex, ctx)
+    return cat, base, form, state
+
+
+def compute_ling_glossing(flexcode, lemmaID: str, pos_subpos: dict) -> str:
+    """ Apply Leipzig Glossing Rules to Part of Speech and flexion information of a
+    lemma occurrence, using the compiled rules. Same signature and results as
+    :func:`aaew_linggloss.computeLingGlossing`.
+
+    >>> compute_ling_glossing(70060, '125581', {'type': 'substantive', 'subtype': 'substantive_masc'})
+    'N.m:sg:stc'
+
+    :param flexcode: BTS flexcode
+    :param lemmaID: BTS lemma ID
+    :param pos_subpos: BTS part of speech type/subtype; python dictionary with ``type`` and optional ``subtype`` key
+    """
+    glossing = lingGlossFromLemmaIDDict.get(lemmaID)
+    if glossing:
+        return glossing
+    _, base, form, state = analyze(flexcode, context(*split_pos_subpos(pos_subpos)))
+    return base + form + state
@@ -0,0 +1,150 @@
+""" Compact binary form of ``data/flexcodes.json``.
+
+``data/flexcodes.bin`` holds the flexcodes as a sorted array of 32 bit integers, each
+pointing into a table of distinct UTF-8 encoded glossing encodings. The file is
+memory-mapped read-only, so processes forked from one another share its pages, and
+flexcodes are looked up by binary search on their integer value.
+
+``flexcodes.json`` remains the source of truth; regenerate the binary file after
+changing it with ``aaew-linggloss build-flexcodes``.
+"""
+import array
+import bisect
+import mmap
+import os
+import struct
+import sys
+
+from .mapping import load_mapping_file, load_resource
+
+
+FILENAME = 'flexcodes.bin'
+SOURCE = 'flexcodes.json'
+
+MAGIC = b'AAEWFLX1'
+_HEADER = struct.Struct('<8sII') # magic, number of flexcodes, number of strings
+
+
+def _array(typecode: str, data) -> memoryview:
+    if sys.byteorder == 'little':
+        return memoryview(data).cast(typecode)
+    values = array.array(typecode, bytes(data))
+    values.byteswap()
+    return memoryview(values)
+
+
+class FlexcodeTable:
+    """ read-only mapping of integer flexcodes to glossing encodings.
+
+    :param buffer: contents of a ``flexcodes.bin`` file, e.g. an :class:`mmap.mmap`
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        magic, count, strings = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError('not a flexcode table')
+        view = memoryview(buffer)
+        start = _HEADER.size
+        self.keys = _array('i', view[start:start + 4 * count])
+        start += 4 * count
+        self.values = _array('I', view[start:start + 4 * count])
+        start += 4 * count
+        self.offsets = _array('I', view[start:start + 4 * (strings + 1)])
+        self.blob = view[start + 4 * (strings + 1):]
+        self._strings = [None] * strings
+
+    @classmethod
+    def open(cls, path: str) -> 'FlexcodeTable':
+        """ memory-map a ``flexcodes.bin`` file.
+        """
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @staticmethod
+    def compile(flexcodes: dict) -> bytes:
+        """ convert a mapping of flexcodes to glossing encodings into the binary format.
+
+        >>> FlexcodeTable(FlexcodeTable.compile({'10': 'a', '-2': 'b', '7': 'a'})).get(7)
+        'a'
+        """
+        items = sorted((int(key), value) for key, value in flexcodes.items())
+        strings = {}
+        for _, value in items:
+            strings.setdefault(value, len(strings))
+        encoded = [value.encode('utf-8') for value in strings]
+        offsets = [0]
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        arrays = [
+            array.array('i', [key for key, _ in items]),
+            array.array('I', [strings[value] for _, value in items]),
+            array.array('I', offsets),
+        ]
+        if sys.byteorder == 'big':
+            for values in arrays:
+                values.byteswap()
+        return b''.join(
+            [_HEADER.pack(MAGIC, len(items), len(strings))]
+            + [values.tobytes() for values in arrays]
+            + encoded
+        )
+
+    def string(self, index: int) -> str:
+        """ decode an entry of the string table; decoded strings are kept and reused.
+        """
+        value = self._strings[index]
+        if value is None:
+            value = self._strings[index] = str(
+                self.blob[self.offsets[index]:self.offsets[index + 1]], 'utf-8'
+            )
+        return value
+
+    def get(self, flexcode: int, default=None):
+        """ look up the glossing encoding of an integer flexcode.
+        """
+        keys = self.keys
+        i = bisect.bisect_left(keys, flexcode)
+        if i < len(keys) and keys[i] == flexcode:
+            return self.string(self.values[i])
+        return default
+
+    def items(self):
+        for i, key in enumerate(self.keys):
+            yield key, self.string(self.values[i])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, flexcode: int):
+        return self.get(flexcode) is not None
+
+
+def default_path() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', FILENAME)
+
+
+def build(path: str = None):
+    """ regenerate ``flexcodes.bin`` from ``flexcodes.json``.
+    """
+    with open(path or default_path(), 'wb') as f:
+        f.write(FlexcodeTable.compile(load_mapping_file(SOURCE)))
+
+
+_TABLE = None
+
+
+def get_flexcode_table() -> FlexcodeTable:
+    """ return the shared flexcode table, memory-mapping the shipped binary file if
+    possible, else reading it into memory or compiling it from ``flexcodes.json``.
+    """
+    global _TABLE
+    if _TABLE is None:
+        try:
+            _TABLE = FlexcodeTable.open(default_path())
+        except (OSError, ValueError, struct.error):
+            try:
+                _TABLE = FlexcodeTable(load_resource(FILENAME))
+            except (OSError, ValueError, struct.error):
+                _TABLE = FlexcodeTable(FlexcodeTable.compile(load_mapping_file(SOURCE)))
+    return _TABLE
@@ -0,0 +1,106 @@
+""" Glossing pandas DataFrames, available as the ``linggloss`` accessor once this
+module is imported.
+
+Requires the ``pandas`` extra (``pip install aaew-linggloss[pandas]``).
+
+>>> import pandas as pd
+>>> df = pd.DataFrame({
+...     'flexcode': [70060, 70060, 0],
+...     'lemmaID': ['125581', '125581', '10050'],
+...     'type': ['substantive', 'substantive', 'pronoun'],
+...     'subtype': ['substantive_masc', 'substantive_masc', 'personal_pronoun'],
+... })
+>>> df.linggloss.gloss().tolist()
+['N.m:sg:stc', 'N.m:sg:stc', '-3sg.m']
+
+Input columns are factorized and only their distinct ``(flexcode, lemmaID, type,
+subtype)`` combinations are glossed, with the same results as
+:func:`aaew_linggloss.computeLingGlossing`. Glossings are returned as a categorical
+column, i.e. one small integer code per row. Missing lemma IDs, types and subtypes
+(``None``, ``NaN``) are treated as ``None``, missing flexcodes as ``NaN``, i.e.
+``(invalid code)``. Arrow tables can be glossed with :func:`ling_glossings`.
+"""
+import numpy as np
+import pandas as pd
+
+from .vectorized import compute_ling_glossing_ids
+
+
+def _factorize(column: pd.Series, missing=None) -> tuple:
+    """ return an object array of distinct values and int64 codes of all values.
+    """
+    codes, uniques = pd.factorize(column)
+    uniques = uniques.to_numpy(dtype=object) if hasattr(uniques, 'to_numpy') else uniques.astype(object)
+    codes = codes.astype(np.int64)
+    if (codes < 0).any():
+        # number missing values like any other, in order of appearance
+        codes[codes < 0] = len(uniques)
+        codes, order = pd.factorize(codes)
+        uniques = np.append(uniques, np.array([missing], dtype=object))[order]
+        codes = codes.astype(np.int64, copy=False)
+    return uniques, codes
+
+
+def _first_rows(codes: np.ndarray) -> np.ndarray:
+    """ return the position of the first occurrence of each factorized code.
+    """
+    # codes are numbered in order of appearance
+    return pd.Series(codes).drop_duplicates().index.to_numpy()
+
+
+def ling_glossings(frame, flexcode: str = 'flexcode', lemma: str = 'lemmaID', type: str = 'type',
+                   subtype: str = 'subtype') -> pd.Series:
+    """ gloss the rows of a DataFrame or Arrow table.
+
+    :param frame: :class:`pandas.DataFrame` or :class:`pyarrow.Table`
+    :param flexcode: name of the flexcode column
+    :param lemma: name of the lemma ID column, or ``None`` if there is none
+    :param type: name of the part of speech type column, or ``None``
+    :param subtype: name of the part of speech subtype column, or ``None``
+    :returns: categorical :class:`pandas.Series` of glossings, aligned with ``frame``
+    """
+    names = [flexcode, lemma, type, subtype]
+    if not isinstance(frame, pd.DataFrame) and hasattr(frame, 'to_pandas'):
+        # Arrow table: convert the input columns only
+        frame = frame.select([name for name in names if name is not None]).to_pandas()
+
+    columns = [
+        _factorize(frame[name], np.nan if i == 0 else None) if name is not None else None
+        for i, name in enumerate(names)
+    ]
+    # number the distinct combinations, keeping codes below the number of rows
+    keys = columns[0][1]
+    for column in columns[1:]:
+        if column is not None:
+            uniques, codes = column
+            keys, _ = pd.factorize(keys * max(len(uniques), 1) + codes)
+            keys = keys.astype(np.int64, copy=False)
+    rows = _first_rows(keys)
+
+    ids, vocabulary = compute_ling_glossing_ids(*[
+        column[0][column[1][rows]] if column is not None else None for column in columns
+    ])
+    used, ids = np.unique(ids, return_inverse=True)
+    dtype = np.int8 if len(used) < 128 else np.int16 if len(used) < 32768 else np.int32
+    return pd.Series(
+        pd.Categorical.from_codes(
+            ids.astype(dtype)[keys], categories=[vocabulary[i] for i in used]
+        ),
+        index=frame.index,
+        name='lingGloss',
+    )
+
+
+@pd.api.extensions.register_dataframe_accessor('linggloss')
+class LingGlossAccessor:
+    """ ``DataFrame.linggloss`` accessor.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self._frame = frame
+
+    def gloss(self, flexcode: str = 'flexcode', lemma: str = 'lemmaID', type: str = 'type',
+              subtype: str = 'subtype') -> pd.Series:
+        """ gloss the rows of the DataFrame, see :func:`ling_glossings`.
+        """
+        return ling_glossings(self._frame, flexcode, lemma, type, subtype)
@@ -0,0 +1,194 @@
+""" Golden file regression harness.
+
+A golden file freezes the glossings of the reference implementation for a systematic
+set of lemma occurrences: every flexcode in ``data/flexcodes.json`` combined with
+every part of speech type and subtype, and every lemma ID with a glossing of its own.
+Any glossing engine can then be checked against it in bulk::
+
+    aaew-linggloss golden --engine table aaew_linggloss/tests/golden.tsv.gz
+
+The file is a gzipped TSV with the columns flexcode, lemmaID, type, subtype and
+gloss; empty type and subtype cells stand for ``None``.
+"""
+import csv
+import gzip
+
+from . import computeLingGlossing, computeLingGlossings, engine, posSubposFromColumns
+from .mapping import (
+    lingGlossFromLemmaIDDict,
+    dictPOSGlossings,
+    dictSubPOSGlossings,
+    load_mapping_file,
+)
+
+
+COLUMNS = ('flexcode', 'lemmaID', 'type', 'subtype', 'gloss')
+
+# BTS part of speech type each subtype belongs to
+SUBTYPE_TYPES = {
+    'animal_name': 'entity_name',
+    'article': 'determiner',
+    'artifact_name': 'entity_name',
+    'cardinal': 'numeral',
+    'demonstrative_pronoun': 'pronoun',
+    'epith_god': 'epitheton_title',
+    'epith_king': 'epitheton_title',
+    'gods_name': 'entity_name',
+    'interrogative_pronoun': 'pronoun',
+    'kings_name': 'entity_name',
+    'nisbe_adjective_preposition': 'adjective',
+    'nisbe_adjective_substantive': 'adjective',
+    'ordinal': 'numeral',
+    'org_name': 'entity_name',
+    'particle_enclitic': 'particle',
+    'particle_nonenclitic': 'particle',
+    'person_name': 'entity_name',
+    'personal_pronoun': 'pronoun',
+    'place_name': 'entity_name',
+    'prepositional_adverb': 'adverb',
+    'relative_pronoun': 'pronoun',
+    'substantive_fem': 'substantive',
+    'substantive_masc': 'substantive',
+    'title': 'epitheton_title',
+}
+
+# flexcodes not in the flexcode list, for input the rules have to reject or reduce
+EXTRA_FLEXCODES = [-10930, 100005, 900000, 1110842, 'x', '']
+
+# flexcodes for which lemma IDs are glossed, including lemma IDs mapped to an empty
+# string, which fall through to the flexcode
+LEMMA_FLEXCODES = [0, 10020, 70060]
+
+
+def pos_subposes() -> list:
+    """ list the ``(type, subtype)`` pairs covered by the golden file.
+    """
+    pairs = [(None, None)]
+    pairs += [(pos, None) for pos in dictPOSGlossings]
+    pairs += [
+        (SUBTYPE_TYPES.get(sub_pos, 'verb'), sub_pos) for sub_pos in dictSubPOSGlossings
+    ]
+    return pairs
+
+
+def golden_occurrences():
+    """ generate the ``(flexcode, lemmaID, type, subtype)`` tuples covered by the
+    golden file.
+    """
+    flexcodes = sorted(int(flexcode) for flexcode in load_mapping_file('flexcodes.json'))
+    for flexcode in flexcodes + EXTRA_FLEXCODES:
+        for pos, sub_pos in pos_subposes():
+            yield (flexcode, '1', pos, sub_pos)
+    for lemmaID in lingGlossFromLemmaIDDict:
+        for flexcode in LEMMA_FLEXCODES:
+            yield (flexcode, lemmaID, None, None)
+
+
+def _reference(occurrences: list) -> list:
+    return [
+        computeLingGlossing(flexcode, lemmaID, posSubposFromColumns(pos, sub_pos))
+        for flexcode, lemmaID, pos, sub_pos in occurrences
+    ]
+
+
+def _engine(occurrences: list) -> list:
+    return [
+        engine.compute_ling_glossing(flexcode, lemmaID, posSubposFromColumns(pos, sub_pos))
+        for flexcode, lemmaID, pos, sub_pos in occurrences
+    ]
+
+
+def _vectorized(occurrences: list) -> list:
+    from .vectorized import compute_ling_glossings
+    return list(compute_ling_glossings(
+        *(list(column) for column in zip(*occurrences))
+    ))
+
+
+ENGINES = {
+    'reference': _reference,
+    'engine': _engine,
+    'table': computeLingGlossings,
+    'vectorized': _vectorized,
+}
+
+
+def generate(glossings=_reference) -> list:
+    """ gloss all golden occurrences.
+
+    :param glossings: function glossing a list of occurrences in bulk
+    :returns: list of ``(flexcode, lemmaID, type, subtype, gloss)`` tuples
+    """
+    occurrences = list(golden_occurrences())
+    return [
+        occurrence + (gloss,)
+        for occurrence, gloss in zip(occurrences, glossings(occurrences))
+    ]
+
+
+def _cell(value) -> str:
+    return '' if value is None else str(value)
+
+
+def _flexcode(cell: str):
+    try:
+        return int(cell)
+    except ValueError:
+        return cell
+
+
+def write_rows(stream, rows):
+    """ write rows of values to a text stream as in golden files, with ``None`` as
+    empty cells.
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_rows(stream, [(70060, '1', None, None, 'N:sg:stc')])
+    >>> stream.getvalue()
+    '70060\\t1\\t\\t\\tN:sg:stc\\n'
+    """
+    writer = csv.writer(stream, delimiter='\t', lineterminator='\n', quoting=csv.QUOTE_MINIMAL)
+    writer.writerows([_cell(value) for value in row] for row in rows)
+
+
+def write(path: str, entries: list):
+    """ save golden entries to a gzipped TSV file.
+    """
+    with gzip.open(path, 'wt', encoding='utf-8', newline='') as f:
+        write_rows(f, [COLUMNS])
+        write_rows(f, entries)
+
+
+def read(path: str) -> list:
+    """ load golden entries from a file written by :func:`write`.
+
+    :returns: list of ``(flexcode, lemmaID, type, subtype, gloss)`` tuples
+    """
+    with gzip.open(path, 'rt', encoding='utf-8', newline='') as f:
+        rows = csv.reader(f, delimiter='\t')
+        if tuple(next(rows)) != COLUMNS:
+            raise ValueError('not a golden file: {}'.format(path))
+        return [
+            (_flexcode(flexcode), lemmaID, pos or None, sub_pos or None, gloss)
+            for flexcode, lemmaID, pos, sub_pos, gloss in rows
+        ]
+
+
+def diff(entries: list, glossings=_reference) -> list:
+    """ gloss the occurrences of golden entries in bulk and return the ones glossed
+    differently.
+
+    >>> diff([(70060, '1', 'substantive', None, 'N:sg:stc')], ENGINES['table'])
+    []
+
+    :param entries: golden entries as returned by :func:`read`
+    :param glossings: function glossing a list of occurrences in bulk, e.g. one of
+        :data:`ENGINES`
+    :returns: list of ``(occurrence, expected, actual)`` tuples
+    """
+    occurrences = [entry[:4] for entry in entries]
+    return [
+        (occurrence, entry[4], actual)
+        for occurrence, entry, actual in zip(occurrences, entries, glossings(occurrences))
+        if actual != entry[4]
+    ]
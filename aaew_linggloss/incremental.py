@@ -0,0 +1,242 @@
+""" Incremental re-glossing of previously glossed records.
+
+A *state* fingerprints everything glossing depends on: the lemma ID glossings, the
+part of speech glossings, the context shapes of part of speech subtypes and the
+glossing rules, the latter as digests of blocks of 100 flexcodes per context shape.
+Glossed records additionally carry a hash of their glossing input and the digest of
+the state they were glossed with. Comparing that state to the current one tells
+which records can keep their glossing:
+
+>>> old = fingerprint()
+>>> changes = Changes(old, fingerprint())
+>>> changes.affects(70060, '1', 'substantive', None)
+False
+>>> old['lemmas']['1'] = 'N'
+>>> Changes(old, fingerprint()).affects(70060, '1', 'substantive', None)
+True
+
+States are kept in a *history* keyed by their digests, so that records glossed with
+any earlier state, e.g. shards of a corpus reglossed at different times, can be
+compared with the current one. Records glossed with a state missing from the history
+are reglossed.
+"""
+import hashlib
+import json
+
+from . import engine, posSubposFromColumns
+from .mapping import (
+    lingGlossFromLemmaIDDict,
+    dictPOSGlossings,
+    dictSubPOSGlossings,
+    dictPOSGlossingsDefault,
+    dictSubPOSGlossingsDefault,
+)
+from .records import DEFAULT_FIELDS, Fields, gloss_occurrence, get_field, occurrence, set_field
+from .table import FLEX_RANGE, get_table
+
+
+STATE_VERSION = 1
+BLOCK_SIZE = 100
+HASH_FIELD = 'lingGlossHash'
+STATE_FIELD = 'lingGlossState'
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def input_hash(flexcode, lemmaID, pos, sub_pos) -> str:
+    """ hash the glossing input of an occurrence.
+
+    >>> input_hash(70060, '1', 'substantive', None) == input_hash(70060, '1', 'substantive', None)
+    True
+    """
+    return _digest(json.dumps([flexcode, lemmaID, pos, sub_pos], default=repr))
+
+
+def fingerprint() -> dict:
+    """ fingerprint the current lemma ID glossings, part of speech glossings and
+    glossing rules as a JSON serializable state.
+    """
+    table = get_table()
+    vocabulary = [gloss or '' for gloss in table.vocabulary]
+    ids = table.ids
+    rules = [
+        [
+            _digest('\x1f'.join([vocabulary[i] for i in ids[start:start + BLOCK_SIZE]]))
+            for start in range(shape * FLEX_RANGE, (shape + 1) * FLEX_RANGE, BLOCK_SIZE)
+        ]
+        for shape in range(len(engine.SHAPES))
+    ]
+    return {
+        'version': STATE_VERSION,
+        'shapes': [list(shape) for shape in engine.SHAPES],
+        'lemmas': dict(lingGlossFromLemmaIDDict),
+        'pos': [
+            dict(dictPOSGlossings), dict(dictSubPOSGlossings),
+            dict(dictPOSGlossingsDefault), dict(dictSubPOSGlossingsDefault),
+        ],
+        'subtypes': {
+            sub_pos: [engine.context('substantive', sub_pos).shape, engine.context('verb', sub_pos).shape]
+            for sub_pos in sorted(
+                set(engine._STEM_TYPES) | set(engine._NOUN_BASES) | set(engine._ADJECTIVE_BASES)
+            )
+        },
+        'rules': rules,
+    }
+
+
+def state_digest(state: dict) -> str:
+    """ digest identifying a state, stored in each glossed record.
+    """
+    return _digest(json.dumps(state, sort_keys=True, ensure_ascii=False))
+
+
+def load_history(path: str) -> dict:
+    """ read a state history, mapping state digests to states. Files holding a
+    single state are read as a history of that state.
+    """
+    history = load_state(path)
+    if 'version' in history:
+        return {state_digest(history): history}
+    return history
+
+
+def save_history(path: str, history: dict):
+    save_state(path, history)
+
+
+def load_state(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(path: str, state: dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+
+
+def _changed_keys(old: dict, new: dict) -> set:
+    return {key for key in set(old) | set(new) if old.get(key) != new.get(key)}
+
+
+class Changes:
+    """ differences between two states, deciding which occurrences they affect.
+
+    :param old: state the records were glossed with, or ``None`` if unknown
+    :param new: current state
+    """
+
+    def __init__(self, old: dict, new: dict):
+        self.everything = (
+            old is None
+            or old.get('version') != new['version']
+            or old.get('shapes') != new['shapes']
+        )
+        if self.everything:
+            return
+        self.lemmas = _changed_keys(old['lemmas'], new['lemmas'])
+        self.pos = set()
+        for old_glossings, new_glossings in zip(old['pos'], new['pos']):
+            self.pos |= _changed_keys(old_glossings, new_glossings)
+        # subtypes now compiled into a different context shape
+        self.pos |= _changed_keys(old.get('subtypes', {}), new['subtypes'])
+        self.blocks = {
+            (shape, block)
+            for shape, (old_blocks, new_blocks) in enumerate(zip(old['rules'], new['rules']))
+            for block, (a, b) in enumerate(zip(old_blocks, new_blocks))
+            if a != b
+        }
+
+    def __bool__(self):
+        return self.everything or bool(self.lemmas or self.pos or self.blocks)
+
+    def affects(self, flexcode, lemmaID, pos, sub_pos) -> bool:
+        """ decide whether the glossing of an occurrence may have changed.
+        """
+        if self.everything:
+            return True
+        if lemmaID in self.lemmas:
+            return True
+        if lingGlossFromLemmaIDDict.get(lemmaID):
+            return False
+        if (pos in self.pos) or (sub_pos in self.pos):
+            return True
+        if not self.blocks:
+            return False
+        try:
+            flex = abs(int(flexcode))
+        except (TypeError, ValueError, OverflowError):
+            return False
+        if flex <= 9:
+            return False
+        ctx = engine.context(*engine.split_pos_subpos(posSubposFromColumns(pos, sub_pos)))
+        return (ctx.shape, flex % FLEX_RANGE // BLOCK_SIZE) in self.blocks
+
+
+class Reglosser:
+    """ re-glosses records whose glossing input or glossing may have changed, keeping
+    the glossing of all others.
+
+    :param history: earlier states by their digests, see :func:`load_history`
+    :param state: current state
+    :param fields: record field names
+    :param hash_field: record field holding the hash of the glossing input
+    :param on_change: function called with a dictionary describing each changed
+        glossing (default: append it to :attr:`changelog`)
+    :param state_field: record field holding the digest of the state it was glossed with
+    """
+
+    def __init__(self, history: dict, state: dict, fields: Fields = DEFAULT_FIELDS, hash_field: str = HASH_FIELD,
+                 on_change=None, state_field: str = STATE_FIELD):
+        self.history = history or {}
+        self.state = state
+        self.digest = state_digest(state)
+        self.fields = fields
+        self.hash_field = hash_field
+        self.state_field = state_field
+        self._changes = {}
+        self.kept = 0
+        self.reglossed = 0
+        self.changed = 0
+        self.changelog = []
+        self.on_change = on_change or self.changelog.append
+
+    def changes(self, digest: str) -> Changes:
+        """ differences between the state with the given digest and the current one.
+        """
+        changes = self._changes.get(digest)
+        if changes is None:
+            changes = self._changes[digest] = Changes(self.history.get(digest), self.state)
+        return changes
+
+    def regloss(self, records):
+        """ update records in place, reporting changed glossings to :attr:`on_change`.
+
+        :returns: generator of records
+        """
+        fields = self.fields
+        for record in records:
+            values = occurrence(record, fields)
+            digest = input_hash(*values)
+            glossed_with = get_field(record, self.state_field)
+            if get_field(record, self.hash_field) == digest and (
+                glossed_with == self.digest
+                or glossed_with is not None and not self.changes(glossed_with).affects(*values)
+            ):
+                self.kept += 1
+                set_field(record, self.state_field, self.digest)
+                yield record
+                continue
+            self.reglossed += 1
+            old = get_field(record, fields.gloss)
+            new = gloss_occurrence(*values)
+            if old != new:
+                self.changed += 1
+                self.on_change(dict(zip(
+                    ('flexcode', 'lemmaID', 'type', 'subtype', 'old', 'new'), values + (old, new)
+                )))
+            set_field(record, fields.gloss, new)
+            set_field(record, self.hash_field, digest)
+            set_field(record, self.state_field, self.digest)
+            yield record
@@ -0,0 +1,165 @@
+""" Opt-in instrumentation of glossing by flexcode category.
+
+:class:`Instrumentation` wraps a glossing function and records, for each category of
+the glossing rules (see :data:`aaew_linggloss.engine.CATEGORIES`), how often it was
+hit, the time spent in it and the classes of outcomes. Glossing functions that are
+not wrapped are not affected at all.
+
+>>> instrumentation = Instrumentation()
+>>> instrumentation.gloss(70060, '1', 'substantive', None)
+'N:sg:stc'
+>>> instrumentation.gloss('x', '1', 'verb', None)
+'(invalid code)'
+>>> instrumentation.counts()
+{('substantive', 'glossed'): 1, ('invalid', 'invalid'): 1}
+"""
+import time
+from collections import Counter, defaultdict
+
+from . import engine, posSubposFromColumns, table
+from .mapping import lingGlossFromLemmaIDDict
+
+
+# outcome classes
+GLOSSED = 'glossed'
+LEMMA = 'lemma'
+STATUS = 'status'
+UNEDITED = 'unedited'
+POS_FALLBACK = 'pos_fallback'
+UNRESOLVED = 'unresolved'
+INVALID = 'invalid'
+
+OUTCOMES = (GLOSSED, LEMMA, STATUS, UNEDITED, POS_FALLBACK, UNRESOLVED, INVALID)
+
+PREFIX = 'aaew_linggloss'
+
+
+def category(flexcode, lemmaID) -> str:
+    """ determine which category of the glossing rules handles an occurrence.
+
+    >>> category('-10930', '1')
+    'suffix_conjugation'
+    """
+    if lingGlossFromLemmaIDDict.get(lemmaID):
+        return engine.LEMMA
+    try:
+        flexcode = abs(int(flexcode))
+    except (TypeError, ValueError, OverflowError):
+        return engine.INVALID
+    if flexcode <= 9:
+        return engine.STATUS
+    return engine.DISPATCH[flexcode % 100000 // 100][0]
+
+
+def outcome(category: str, glossing: str) -> str:
+    """ classify the glossing of an occurrence of a given category. Status code
+    ``0``, inflection not yet edited, is told apart from other status codes.
+
+    >>> outcome('status', 'V(infl. unedited)')
+    'unedited'
+    """
+    if category == engine.LEMMA:
+        return LEMMA
+    if glossing == '(invalid code)':
+        return INVALID
+    if glossing == '(unresolved)':
+        return UNRESOLVED
+    if category == engine.STATUS:
+        return UNEDITED if (glossing or '').endswith('(infl. unedited)') else STATUS
+    if category == engine.UNRESOLVED:
+        return POS_FALLBACK
+    return GLOSSED
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Instrumentation:
+    """ glossing function wrapper recording per category call counts, cumulative
+    time and outcome classes. Not thread-safe.
+
+    :param glossing: function with the signature of :func:`aaew_linggloss.computeLingGlossing`
+    :param clock: timer returning seconds
+    """
+
+    def __init__(self, glossing=table.compute_ling_glossing, clock=time.perf_counter):
+        self.glossing = glossing
+        self.clock = clock
+        self.outcomes = Counter()
+        self.seconds = defaultdict(float)
+
+    def computeLingGlossing(self, flexcode, lemmaID: str, pos_subpos: dict) -> str:
+        """ drop-in replacement for :func:`aaew_linggloss.computeLingGlossing`.
+        """
+        cat = category(flexcode, lemmaID)
+        start = self.clock()
+        glossing = self.glossing(flexcode, lemmaID, pos_subpos)
+        self.seconds[cat] += self.clock() - start
+        self.outcomes[cat, outcome(cat, glossing)] += 1
+        return glossing
+
+    def gloss(self, flexcode, lemmaID, pos, sub_pos) -> str:
+        """ gloss a lemma occurrence given as separate values.
+        """
+        return self.computeLingGlossing(flexcode, lemmaID, posSubposFromColumns(pos, sub_pos))
+
+    def counts(self) -> dict:
+        """ return the number of glossings per ``(category, outcome)`` pair.
+        """
+        return dict(self.outcomes)
+
+    def to_dict(self) -> dict:
+        """ return calls, cumulative seconds and outcome counts per category.
+        """
+        stats = {}
+        for (cat, result), count in sorted(self.outcomes.items()):
+            entry = stats.setdefault(cat, {
+                'calls': 0, 'seconds': self.seconds[cat], 'outcomes': {},
+            })
+            entry['calls'] += count
+            entry['outcomes'][result] = count
+        return stats
+
+    def to_prometheus(self, prefix: str = PREFIX) -> str:
+        """ render the recorded metrics in the Prometheus text exposition format.
+
+        >>> i = Instrumentation(clock=lambda: 0.0)
+        >>> _ = i.gloss(99999, '1', 'particle', None)
+        >>> print(i.to_prometheus())
+        # HELP aaew_linggloss_glossings_total Glossings per flexcode category and outcome.
+        # TYPE aaew_linggloss_glossings_total counter
+        aaew_linggloss_glossings_total{category="unresolved",outcome="pos_fallback"} 1
+        # HELP aaew_linggloss_glossing_seconds_total Time spent glossing per flexcode category.
+        # TYPE aaew_linggloss_glossing_seconds_total counter
+        aaew_linggloss_glossing_seconds_total{category="unresolved"} 0.0
+        <BLANKLINE>
+        """
+        lines = [
+            '# HELP {}_glossings_total Glossings per flexcode category and outcome.'.format(prefix),
+            '# TYPE {}_glossings_total counter'.format(prefix),
+        ]
+        for (cat, result), count in sorted(self.outcomes.items()):
+            lines.append('{}_glossings_total{{category="{}",outcome="{}"}} {}'.format(
+                prefix, _escape(cat), _escape(result), count
+            ))
+        lines += [
+            '# HELP {}_glossing_seconds_total Time spent glossing per flexcode category.'.format(prefix),
+            '# TYPE {}_glossing_seconds_total counter'.format(prefix),
+        ]
+        for cat, seconds in sorted(self.seconds.items()):
+            lines.append('{}_glossing_seconds_total{{category="{}"}} {!r}'.format(
+                prefix, _escape(cat), seconds
+            ))
+        return '\n'.join(lines) + '\n'
+
+    def merge(self, other: 'Instrumentation'):
+        """ add the metrics recorded by another instance, e.g. in a worker process.
+        """
+        self.outcomes.update(other.outcomes)
+        for cat, seconds in other.seconds.items():
+            self.seconds[cat] += seconds
+
+    def clear(self):
+        self.outcomes.clear()
+        self.seconds.clear()
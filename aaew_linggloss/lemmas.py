@@ -0,0 +1,143 @@
+""" Registry of lemma metadata.
+
+Glossing depends on a lemma's ID and part of speech, which are the same for all its
+occurrences. A :class:`LemmaRegistry` resolves them once per lemma, so occurrences
+can be glossed from just flexcode and lemma ID:
+
+>>> lemmas = LemmaRegistry()
+>>> lemmas.add('125581', 'substantive', 'substantive_masc')
+Lemma(type='substantive', subtype='substantive_masc', override=None, context=...)
+>>> lemmas.gloss(70060, '125581')
+'N.m:sg:stc'
+
+Registries can be loaded from lemma lists in the formats supported by
+:mod:`aaew_linggloss.records`. Registries take lemma IDs as strings throughout, for
+registered and unregistered lemmas alike, so that IDs read as integers from JSONL
+match those read from CSV or TSV and gloss the same.
+"""
+from collections import namedtuple
+
+from . import engine, posSubposFromColumns
+from .mapping import lingGlossFromLemmaIDDict
+from .records import DEFAULT_FIELDS, Fields, get_field, guess_format, read_records
+from .table import compute_ling_glossing, get_table
+
+
+class Lemma(namedtuple('Lemma', ['type', 'subtype', 'override', 'context'])):
+    """ glossing relevant metadata of a lemma: BTS part of speech type and subtype,
+    lemma ID based glossing (or ``None``), and compiled part of speech context.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'Lemma(type={!r}, subtype={!r}, override={!r}, context=...)'.format(
+            self.type, self.subtype, self.override
+        )
+
+    @property
+    def stem(self) -> str:
+        """ verb stem class, one of :data:`aaew_linggloss.engine.STEMS`. """
+        return engine.STEMS[self.context.stem]
+
+    @property
+    def posGloss(self) -> str:
+        return self.context.posGloss
+
+    @property
+    def defaultGloss(self) -> str:
+        return self.context.defaultGloss
+
+
+def lemma(lemmaID, pos=None, sub_pos=None) -> Lemma:
+    """ compile the metadata of a lemma.
+
+    >>> lemma('1', 'verb', 'verb_3-inf').stem
+    'inf'
+    """
+    return Lemma(
+        pos, sub_pos,
+        lingGlossFromLemmaIDDict.get(lemmaID) or None,
+        engine.context(*engine.split_pos_subpos(posSubposFromColumns(pos, sub_pos))),
+    )
+
+
+def _key(lemmaID):
+    """ normalize a lemma ID as it enters a registry. """
+    return None if lemmaID is None else str(lemmaID)
+
+
+class LemmaRegistry:
+    """ mapping of lemma IDs to :class:`Lemma` records.
+    """
+
+    def __init__(self):
+        self.lemmas = {}
+        self.table = get_table()
+
+    def add(self, lemmaID: str, pos=None, sub_pos=None) -> Lemma:
+        """ register or replace the part of speech of a lemma.
+        """
+        lemmaID = _key(lemmaID)
+        record = self.lemmas[lemmaID] = lemma(lemmaID, pos, sub_pos)
+        return record
+
+    @classmethod
+    def load(cls, path: str, fmt: str = None, fields: Fields = DEFAULT_FIELDS) -> 'LemmaRegistry':
+        """ read a registry from a JSONL, CSV or TSV lemma list.
+
+        :param fmt: record format (default: guessed from file extension)
+        :param fields: record field names; only lemma ID, type and subtype are used
+        """
+        registry = cls()
+        with open(path, encoding='utf-8', newline='') as f:
+            for record in read_records(f, fmt or guess_format(path)):
+                registry.add(
+                    get_field(record, fields.lemmaID),
+                    get_field(record, fields.type),
+                    get_field(record, fields.subtype) or None,
+                )
+        return registry
+
+    def get(self, lemmaID) -> Lemma:
+        """ return the record of a lemma, or one without part of speech if the lemma
+        is not registered.
+        """
+        lemmaID = _key(lemmaID)
+        record = self.lemmas.get(lemmaID)
+        if record is None:
+            record = lemma(lemmaID)
+        return record
+
+    def gloss(self, flexcode, lemmaID) -> str:
+        """ gloss an occurrence of a registered lemma. Unregistered lemmas are glossed
+        as if their part of speech was unknown.
+        """
+        record = self.get(lemmaID)
+        return record.override or self.table.glossing(flexcode, record.context)
+
+    def gloss_occurrence(self, flexcode, lemmaID, pos=None, sub_pos=None) -> str:
+        """ gloss an occurrence with the signature of
+        :func:`aaew_linggloss.records.gloss_occurrence`, taking part of speech from
+        the registry and from the arguments only for unregistered lemmas.
+        """
+        lemmaID = _key(lemmaID)
+        record = self.lemmas.get(lemmaID)
+        if record is None:
+            record = lemma(lemmaID, pos, sub_pos)
+        return record.override or self.table.glossing(flexcode, record.context)
+
+    def computeLingGlossing(self, flexcode, lemmaID: str, pos_subpos: dict) -> str:
+        """ drop-in replacement for :func:`aaew_linggloss.computeLingGlossing`, ignoring
+        ``pos_subpos`` for registered lemmas.
+        """
+        lemmaID = _key(lemmaID)
+        record = self.lemmas.get(lemmaID)
+        if record is None:
+            return compute_ling_glossing(flexcode, lemmaID, pos_subpos)
+        return record.override or self.table.glossing(flexcode, record.context)
+
+    def __len__(self):
+        return len(self.lemmas)
+
+    def __contains__(self, lemmaID):
+        return _key(lemmaID) in self.lemmas
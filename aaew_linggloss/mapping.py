@@ -1,6 +1,20 @@
-import os
 import json
-import pkg_resources
+
+
+def load_resource(filename: str) -> bytes:
+    """ read a file from this module's ``data`` subdirectory.
+
+    :param filename: name of the file
+    """
+    try:
+        from importlib.resources import files
+    except ImportError: # python < 3.9
+        import pkgutil
+        data = pkgutil.get_data(__package__, 'data/' + filename)
+        if data is None:
+            raise FileNotFoundError(filename)
+        return data
+    return files(__package__).joinpath('data', filename).read_bytes()
 
 
 def load_mapping_file(filename: str) -> dict:
@@ -9,11 +23,17 @@ def load_mapping_file(filename: str) -> dict:
 
     :param filename: name of the JSON file
     """
-    with pkg_resources.resource_stream(__name__, os.path.join('data', filename)) as f:
-        return json.load(f)
+    return json.loads(load_resource(filename))
+
 
+def __getattr__(name: str):
+    """ load ``FLEXCODES`` on first access, so that importing the package stays cheap.
+    """
+    if name == 'FLEXCODES':
+        flexcodes = globals()['FLEXCODES'] = load_mapping_file('flexcodes.json')
+        return flexcodes
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
-FLEXCODES = load_mapping_file('flexcodes.json')
 
 lingGlossFromLemmaIDDict = {
     # Personalpronomina
@@ -0,0 +1,212 @@
+""" Normalization of flexcodes as found in corpus exports.
+
+Flexcodes come as integers, strings, floats (e.g. ``70060.0`` from pandas columns
+with missing values), ``NaN``, empty strings and worse. :class:`FlexcodeNormalizer`
+turns them into integers once, before glossing, and counts every kind of input it
+accepts or rejects:
+
+>>> normalizer = FlexcodeNormalizer()
+>>> normalizer.normalize_all([70060, '70060', 70060.0, float('nan'), '', 'x'])
+[70060, 70060, 70060, None, None, None]
+>>> sorted(normalizer.rejected().items())
+[('empty', 1), ('malformed', 1), ('nan', 1)]
+
+Normalization follows ``int()`` as used by :func:`aaew_linggloss.computeLingGlossing`,
+except that it is stricter with floats, rejecting fractional ones instead of
+truncating them, and more lenient with strings, accepting integral float notation
+such as ``'70060.0'``. ``None``, infinite floats and other types, on which
+``int()`` raises, are rejected as well, and so are flexcodes whose absolute value
+does not fit into the int64 arrays of :mod:`aaew_linggloss.vectorized`. Rejected
+flexcodes gloss as ``(invalid code)``.
+"""
+import math
+import numbers
+from collections import Counter
+
+
+# accepted
+INTEGER = 'integer'
+STRING = 'string'
+FLOAT = 'float'
+FLOAT_STRING = 'float_string'
+# rejected
+MISSING = 'missing'
+NAN = 'nan'
+EMPTY = 'empty'
+FRACTIONAL = 'fractional'
+INFINITE = 'infinite'
+OUT_OF_RANGE = 'out_of_range'
+MALFORMED = 'malformed'
+OTHER = 'other'
+
+CLASSES = (
+    INTEGER, STRING, FLOAT, FLOAT_STRING,
+    MISSING, NAN, EMPTY, FRACTIONAL, INFINITE, OUT_OF_RANGE, MALFORMED, OTHER,
+)
+ACCEPTED = frozenset((INTEGER, STRING, FLOAT, FLOAT_STRING))
+
+# flexcodes are held in int64 arrays and negated there, so -2 ** 63 is out of range
+INT64_MAX = 2 ** 63 - 1
+
+
+def _int(flexcode: int, accepted: str) -> tuple:
+    if -INT64_MAX <= flexcode <= INT64_MAX:
+        return flexcode, accepted
+    return None, OUT_OF_RANGE
+
+
+def _float(number: float, accepted: str) -> tuple:
+    if math.isnan(number):
+        return None, NAN
+    if math.isinf(number):
+        return None, INFINITE
+    if not number.is_integer():
+        return None, FRACTIONAL
+    return _int(int(number), accepted)
+
+
+def classify(value) -> tuple:
+    """ normalize a flexcode.
+
+    >>> classify(' -10930 ')
+    (-10930, 'string')
+    >>> classify(70.1)
+    (None, 'fractional')
+    >>> classify('1e20')
+    (None, 'out_of_range')
+
+    :returns: tuple of the integer flexcode, or ``None`` if rejected, and the input
+        class, one of :data:`CLASSES`
+    """
+    if type(value) is int:
+        return _int(value, INTEGER)
+    if isinstance(value, str):
+        try:
+            return _int(int(value), STRING)
+        except ValueError:
+            pass
+        value = value.strip()
+        if not value:
+            return None, EMPTY
+        try:
+            return _float(float(value), FLOAT_STRING)
+        except ValueError:
+            return None, MALFORMED
+    if value is None:
+        return None, MISSING
+    if isinstance(value, bool):
+        return None, OTHER
+    if isinstance(value, numbers.Integral):
+        return _int(int(value), INTEGER)
+    if isinstance(value, numbers.Real):
+        return _float(float(value), FLOAT)
+    return None, OTHER
+
+
+class FlexcodeNormalizer:
+    """ normalizes flexcodes, counting them per input class.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def normalize(self, value) -> int:
+        """ return the integer flexcode, or ``None`` if rejected.
+        """
+        flexcode, cls = classify(value)
+        self.counts[cls] += 1
+        return flexcode
+
+    def normalize_all(self, values) -> list:
+        """ normalize a sequence of flexcodes into a list of integers and ``None``.
+        Each distinct value is only classified once.
+        """
+        classified = {}
+        flexcodes = []
+        classes = Counter()
+        for value in values:
+            # 70060, 70060.0 and True == 1 are equal, but belong to different classes
+            key = (type(value), value)
+            try:
+                flexcode, cls = classified[key]
+            except KeyError:
+                flexcode, cls = classified[key] = classify(value)
+            except TypeError: # unhashable
+                flexcode, cls = classify(value)
+            flexcodes.append(flexcode)
+            classes[cls] += 1
+        self.counts.update(classes)
+        return flexcodes
+
+    def normalize_array(self, values):
+        """ normalize an array-like of flexcodes with NumPy.
+
+        :returns: int64 :class:`numpy.ma.MaskedArray`, masked where rejected; accepted
+            by :func:`aaew_linggloss.vectorized.compute_ling_glossings`
+        """
+        import numpy as np
+        from .vectorized import _asarray
+
+        values = _asarray(values)
+        if values.dtype.kind in 'iu':
+            if values.dtype == np.uint64:
+                out_of_range = values > INT64_MAX
+            elif values.dtype == np.int64:
+                out_of_range = values < -INT64_MAX
+            else:
+                out_of_range = np.zeros(len(values), dtype=bool)
+            self.counts.update({cls: int(count) for cls, count in [
+                (OUT_OF_RANGE, out_of_range.sum()), (INTEGER, len(values) - out_of_range.sum()),
+            ] if count})
+            return np.ma.MaskedArray(np.where(out_of_range, 0, values).astype(np.int64), mask=out_of_range)
+        if values.dtype.kind == 'f':
+            nan = np.isnan(values)
+            infinite = np.isinf(values)
+            finite = ~(nan | infinite)
+            fractional = finite & (values != np.trunc(np.where(finite, values, 0)))
+            # float(INT64_MAX) rounds up to 2 ** 63, which is out of range
+            out_of_range = finite & ~fractional & (np.abs(np.where(finite, values, 0)) >= 2.0 ** 63)
+            rejected = nan | infinite | fractional | out_of_range
+            self.counts.update({cls: int(count) for cls, count in [
+                (NAN, nan.sum()), (INFINITE, infinite.sum()), (FRACTIONAL, fractional.sum()),
+                (OUT_OF_RANGE, out_of_range.sum()), (FLOAT, len(values) - rejected.sum()),
+            ] if count})
+            return np.ma.MaskedArray(
+                np.where(rejected, 0, values).astype(np.int64), mask=rejected
+            )
+        index = {}
+        classified = []
+
+        def code(value) -> int:
+            key = (type(value), value)
+            try:
+                i = index.get(key)
+            except TypeError: # unhashable
+                i = None
+                key = None
+            if i is None:
+                i = len(classified)
+                classified.append(classify(value))
+                if key is not None:
+                    index[key] = i
+            return i
+
+        codes = np.fromiter(map(code, values.tolist()), dtype=np.intp, count=len(values))
+        flexcodes = np.array([flexcode or 0 for flexcode, _ in classified], dtype=np.int64)
+        rejected = np.array([cls not in ACCEPTED for _, cls in classified], dtype=bool)
+        class_codes = np.array([CLASSES.index(cls) for _, cls in classified], dtype=np.intp)
+        for i, count in enumerate(np.bincount(class_codes[codes], minlength=len(CLASSES))):
+            if count:
+                self.counts[CLASSES[i]] += int(count)
+        return np.ma.MaskedArray(flexcodes[codes], mask=rejected[codes])
+
+    def rejected(self) -> dict:
+        """ return the number of rejected flexcodes per input class.
+        """
+        return {cls: count for cls, count in self.counts.items() if cls not in ACCEPTED and count}
+
+    def merge(self, other: 'FlexcodeNormalizer'):
+        self.counts.update(other.counts)
+
+    def clear(self):
+        self.counts.clear()
@@ -0,0 +1,107 @@
+""" Glossing on multiple CPU cores.
+
+Input is split into chunks which are glossed in a pool of worker processes; results
+come back in input order. Each worker loads the glossing tables once when it starts,
+and only a bounded number of chunks is in flight at any time, so arbitrarily long
+input streams can be glossed in constant memory. Workers can gloss through a
+glossing cache of their own, optionally warmed up from a snapshot, see
+:func:`gloss_occurrences`.
+"""
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from . import computeLingGlossings
+from .records import DEFAULT_FIELDS, Fields, gloss_jsonl_lines as _gloss_jsonl_lines, gloss_occurrence
+from .table import get_table
+
+
+DEFAULT_CHUNKSIZE = 10000
+
+# glossing cache of a worker process, set up by _init_worker
+_CACHE = None
+
+
+def _init_worker(snapshot: str = None, cache_size: int = 0):
+    global _CACHE
+    _CACHE = None
+    if snapshot:
+        from .snapshot import restore
+        _CACHE = restore(snapshot)
+    if cache_size > 0:
+        from .cache import GlossCache
+        cache = GlossCache(cache_size)
+        if _CACHE is not None:
+            cache.update(_CACHE.items())
+        _CACHE = cache
+    get_table()
+
+
+def gloss_occurrences(occurrences: list) -> list:
+    """ gloss a chunk of ``(flexcode, lemmaID, type, subtype)`` tuples in a worker
+    process, through the worker's glossing cache if it has one.
+    """
+    if _CACHE is None:
+        return computeLingGlossings(occurrences)
+    return [_CACHE.gloss(*occurrence) for occurrence in occurrences]
+
+
+def gloss_jsonl_lines(lines: list, fields: Fields = DEFAULT_FIELDS) -> str:
+    """ gloss a chunk of JSONL lines in a worker process like
+    :func:`aaew_linggloss.records.gloss_jsonl_lines`, through the worker's glossing
+    cache if it has one.
+    """
+    return _gloss_jsonl_lines(lines, fields, gloss_occurrence if _CACHE is None else _CACHE.gloss)
+
+
+def chunked(iterable, size: int):
+    """ split an iterable into lists of at most ``size`` items.
+
+    >>> list(chunked(range(5), 2))
+    [[0, 1], [2, 3], [4]]
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(func, chunks, workers: int = None, initializer=_init_worker, initargs: tuple = ()):
+    """ apply ``func`` to each chunk in a process pool, yielding results in order.
+    At most twice as many chunks as there are workers are submitted ahead.
+
+    :param func: picklable function taking a chunk
+    :param chunks: iterable of chunks
+    :param workers: number of worker processes (default: number of CPUs)
+    :param initargs: arguments of ``initializer``; the default initializer takes the
+        path of a snapshot to restore, see :mod:`aaew_linggloss.snapshot`, and the
+        size of the worker's glossing cache
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def computeLingGlossingsParallel(occurrences, workers: int = None, chunksize: int = DEFAULT_CHUNKSIZE):
+    """ Apply Leipzig Glossing Rules to a sequence of lemma occurrences in parallel.
+    Same input and results as :func:`aaew_linggloss.computeLingGlossings`, but returns
+    a generator.
+
+    :param occurrences: iterable of ``(flexcode, lemmaID, type, subtype)`` tuples
+    :param workers: number of worker processes (default: number of CPUs)
+    :param chunksize: number of occurrences sent to a worker at once
+    :returns: generator of glossings in input order
+    """
+    for glossings in map_chunks(
+        computeLingGlossings, chunked(occurrences, chunksize), workers
+    ):
+        yield from glossings
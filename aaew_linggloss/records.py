@@ -0,0 +1,212 @@
+""" Streaming access to lemma occurrence records in JSONL, CSV and TSV corpus exports.
+"""
+import csv
+import json
+from collections import deque, namedtuple
+
+from . import table
+from . import posSubposFromColumns
+
+
+Fields = namedtuple('Fields', ['flexcode', 'lemmaID', 'type', 'subtype', 'gloss'])
+Fields.__doc__ = """ names of the record fields holding glossing input and output.
+In JSON records, fields may be given as dot-separated paths into nested objects,
+e.g. ``lemma.POS.type``.
+"""
+
+DEFAULT_FIELDS = Fields('flexcode', 'lemmaID', 'type', 'subtype', 'lingGloss')
+
+FORMATS = ('jsonl', 'csv', 'tsv')
+
+
+def get_field(record: dict, path: str):
+    """ read a possibly nested field from a record.
+
+    >>> get_field({'lemma': {'id': '10030'}}, 'lemma.id')
+    '10030'
+
+    >>> get_field({'lemma': {}}, 'lemma.POS.type')
+    """
+    if path in record:
+        return record[path]
+    value = record
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def set_field(record: dict, path: str, value):
+    """ write a possibly nested field of a record, creating intermediate objects.
+
+    >>> r = {}; set_field(r, 'flexion.lingGloss', 'N:sg'); r
+    {'flexion': {'lingGloss': 'N:sg'}}
+    """
+    if path in record:
+        record[path] = value
+        return
+    keys = path.split('.')
+    for key in keys[:-1]:
+        record = record.setdefault(key, {})
+    record[keys[-1]] = value
+
+
+def occurrence(record: dict, fields: Fields = DEFAULT_FIELDS) -> tuple:
+    """ extract ``(flexcode, lemmaID, type, subtype)`` from a record.
+    """
+    return (
+        get_field(record, fields.flexcode),
+        get_field(record, fields.lemmaID),
+        get_field(record, fields.type),
+        get_field(record, fields.subtype),
+    )
+
+
+def gloss_occurrence(flexcode, lemmaID, pos, sub_pos) -> str:
+    """ gloss a lemma occurrence given as separate values.
+
+    >>> gloss_occurrence('70060', '125581', 'substantive', 'substantive_masc')
+    'N.m:sg:stc'
+    """
+    return table.compute_ling_glossing(
+        flexcode, lemmaID, posSubposFromColumns(pos, sub_pos)
+    )
+
+
+def gloss_records(records, fields: Fields = DEFAULT_FIELDS, workers: int = 1, chunksize: int = 10000,
+                  gloss=gloss_occurrence, snapshot: str = None, cache_size: int = 0):
+    """ gloss a stream of records, adding the glossing to each record in place.
+
+    >>> list(gloss_records([{'flexcode': 0, 'lemmaID': '10030'}]))
+    [{'flexcode': 0, 'lemmaID': '10030', 'lingGloss': '-1sg'}]
+
+    :param records: iterable of dictionaries
+    :param workers: number of processes to gloss in; see :mod:`aaew_linggloss.parallel`
+    :param chunksize: number of records sent to a worker process at once
+    :param gloss: glossing function with the signature of :func:`gloss_occurrence`,
+        e.g. :meth:`aaew_linggloss.cache.GlossCache.gloss`; ignored if ``workers > 1``
+    :param snapshot: snapshot file for worker processes to start from, see
+        :mod:`aaew_linggloss.snapshot`
+    :param cache_size: size of the glossing cache of each worker process (default: off,
+        or the snapshot's cache)
+    :returns: generator of glossed records
+    """
+    if workers > 1:
+        yield from _gloss_records_parallel(records, fields, workers, chunksize, snapshot, cache_size)
+        return
+    for record in records:
+        set_field(
+            record, fields.gloss,
+            gloss(*occurrence(record, fields))
+        )
+        yield record
+
+
+def _gloss_records_parallel(records, fields: Fields, workers: int, chunksize: int, snapshot: str = None,
+                            cache_size: int = 0):
+    from .parallel import chunked, gloss_occurrences, map_chunks
+
+    pending = deque()
+
+    def occurrence_chunks():
+        for chunk in chunked(records, chunksize):
+            pending.append(chunk)
+            yield [occurrence(record, fields) for record in chunk]
+
+    for glossings in map_chunks(
+        gloss_occurrences, occurrence_chunks(), workers, initargs=(snapshot, cache_size)
+    ):
+        for record, glossing in zip(pending.popleft(), glossings):
+            set_field(record, fields.gloss, glossing)
+            yield record
+
+
+def gloss_jsonl_lines(lines: list, fields: Fields = DEFAULT_FIELDS, gloss=gloss_occurrence) -> str:
+    """ gloss a chunk of JSONL lines, returning the glossed records as JSONL text.
+    Lets worker processes do the JSON parsing and serialization, too.
+
+    >>> gloss_jsonl_lines(['{"flexcode": 96423}'])
+    '{"flexcode": 96423, "lingGloss": "AUX:stpr"}\\n'
+    """
+    return ''.join(
+        json.dumps(record, ensure_ascii=False) + '\n'
+        for record in gloss_records(
+            (json.loads(line) for line in lines if line.strip()), fields, gloss=gloss
+        )
+    )
+
+
+def guess_format(filename: str, default: str = 'jsonl') -> str:
+    """ infer record format from file extension.
+
+    >>> guess_format('corpus.tsv')
+    'tsv'
+    """
+    for fmt in FORMATS:
+        if filename.lower().endswith('.' + fmt):
+            return fmt
+    return default
+
+
+def read_records(stream, fmt: str = 'jsonl'):
+    """ read records one by one from a text stream.
+
+    :param fmt: one of :data:`FORMATS`
+    :returns: generator of dictionaries
+    """
+    if fmt == 'jsonl':
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        yield from csv.DictReader(
+            stream, delimiter='\t' if fmt == 'tsv' else ','
+        )
+
+
+class RecordWriter:
+    """ write records to a text stream in bulk, ``buffer_size`` records at a time.
+
+    :param stream: text stream
+    :param fmt: one of :data:`FORMATS`
+    :param fieldnames: additional columns appended to the input's CSV/TSV columns
+    """
+
+    def __init__(self, stream, fmt: str = 'jsonl', fieldnames: list = (), buffer_size: int = 1000):
+        self.stream = stream
+        self.fmt = fmt
+        self.fieldnames = list(fieldnames)
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._csv = None
+
+    def write(self, record: dict):
+        if self.fmt == 'jsonl':
+            self._buffer.append(json.dumps(record, ensure_ascii=False) + '\n')
+        else:
+            if self._csv is None:
+                self._csv = csv.DictWriter(
+                    self.stream,
+                    list(record) + [f for f in self.fieldnames if f not in record],
+                    delimiter='\t' if self.fmt == 'tsv' else ',',
+                    lineterminator='\n',
+                )
+                self._csv.writeheader()
+            self._buffer.append(record)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.fmt == 'jsonl':
+            self.stream.writelines(self._buffer)
+        elif self._buffer:
+            self._csv.writerows(self._buffer)
+        self._buffer = []
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
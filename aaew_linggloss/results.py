@@ -0,0 +1,124 @@
+""" Structured glossing results.
+
+:func:`compute_ling_gloss` returns a :class:`Gloss` instead of a glossing string, so
+that category, base glossing, form and state need not be parsed back out of it.
+Identical results are one and the same instance, and the glossing string is only
+built when first asked for:
+
+>>> gloss = compute_ling_gloss(70060, '125581', {'type': 'substantive', 'subtype': 'substantive_masc'})
+>>> gloss.category, gloss.base, gloss.form, gloss.state
+('substantive', 'N.m', ':sg', ':stc')
+>>> str(gloss)
+'N.m:sg:stc'
+>>> gloss is compute_ling_gloss('70060', '125581', {'type': 'substantive', 'subtype': 'substantive_masc'})
+True
+"""
+from . import computeLingGlossing, engine
+from .diagnostics import DiagnosticsCollector
+from .mapping import lingGlossFromLemmaIDDict
+
+
+class Gloss:
+    """ glossing of a lemma occurrence, broken down into its parts. Instances are
+    interned and immutable; create them with :func:`intern_gloss`.
+
+    :param category: flexcode category, one of :data:`aaew_linggloss.engine.CATEGORIES`
+    :param base: base glossing, e.g. ``V\\tam`` or ``N.m``
+    :param form: form glossing, e.g. ``.act-ant``
+    :param state: state glossing, e.g. ``:stpr``
+    :param stem: stem type (``inf``, ``gem`` or ``strong``) the base glossing depends
+        on, e.g. for the ``V~ipfv`` of 3-inf verbs; empty if it does not
+    :param diagnostics: tuple of :class:`aaew_linggloss.diagnostics.DiagnosticKind`
+    """
+    __slots__ = ('category', 'base', 'form', 'state', 'stem', 'diagnostics', '_text')
+
+    def __init__(self, category: str, base: str, form: str = '', state: str = '', stem: str = '',
+                 diagnostics: tuple = ()):
+        set_attribute = object.__setattr__
+        set_attribute(self, 'category', category)
+        set_attribute(self, 'base', base)
+        set_attribute(self, 'form', form)
+        set_attribute(self, 'state', state)
+        set_attribute(self, 'stem', stem)
+        set_attribute(self, 'diagnostics', diagnostics)
+        set_attribute(self, '_text', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Gloss instances are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Gloss instances are immutable')
+
+    @property
+    def text(self) -> str:
+        """ the glossing string, as returned by :func:`aaew_linggloss.computeLingGlossing`.
+        """
+        text = self._text
+        if text is None:
+            text = self.base + self.form + self.state
+            object.__setattr__(self, '_text', text)
+        return text
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return 'Gloss({})'.format(', '.join(repr(value) for value in self._key()))
+
+    def _key(self) -> tuple:
+        return (self.category, self.base, self.form, self.state, self.stem, self.diagnostics)
+
+    def __reduce__(self):
+        # re-intern when unpickled, e.g. in another process
+        return intern_gloss, self._key()
+
+
+_GLOSSES = {}
+
+
+def intern_gloss(category: str, base: str, form: str = '', state: str = '', stem: str = '',
+                 diagnostics: tuple = ()) -> Gloss:
+    """ return the :class:`Gloss` with the given parts, creating it on first use.
+
+    >>> intern_gloss('adverb', 'ADV', '', ':stpr') is intern_gloss('adverb', 'ADV', '', ':stpr')
+    True
+    """
+    key = (category, base, form, state, stem, diagnostics)
+    gloss = _GLOSSES.get(key)
+    if gloss is None:
+        gloss = _GLOSSES[key] = Gloss(*key)
+    return gloss
+
+
+def interned() -> int:
+    """ return the number of distinct :class:`Gloss` instances created so far.
+    """
+    return len(_GLOSSES)
+
+
+def compute_ling_gloss(flexcode, lemmaID: str, pos_subpos: dict, diagnostics: bool = False) -> Gloss:
+    """ Apply Leipzig Glossing Rules to Part of Speech and flexion information of a
+    lemma occurrence. Same signature as :func:`aaew_linggloss.computeLingGlossing`,
+    whose result is the :attr:`Gloss.text` of the returned glossing.
+
+    >>> compute_ling_gloss(10100, '1', {'type': 'verb', 'subtype': 'verb_3-inf'})
+    Gloss('suffix_conjugation', 'V~ipfv', '.act', '', 'inf', ())
+    >>> compute_ling_gloss(70060, '1', {'type': 'substantive'}, diagnostics=True).diagnostics[0].code
+    'noun_no_gender'
+
+    :param diagnostics: whether to fill in :attr:`Gloss.diagnostics`; this runs the
+        reference implementation in addition and is considerably slower
+    """
+    glossing = lingGlossFromLemmaIDDict.get(lemmaID)
+    if glossing:
+        return intern_gloss(engine.LEMMA, glossing)
+    ctx = engine.context(*engine.split_pos_subpos(pos_subpos))
+    category, base, form, state = engine.analyze(flexcode, ctx)
+    # stem dependent base glossings are marked by the stem modifier ~
+    stem = engine.STEMS[ctx.stem] if '~' in base else ''
+    kinds = ()
+    if diagnostics:
+        collector = DiagnosticsCollector(max_records=None)
+        computeLingGlossing(flexcode, lemmaID, pos_subpos, diagnostics=collector)
+        kinds = tuple(record.kind for record in collector)
+    return intern_gloss(category, base, form, state, stem, kinds)
@@ -0,0 +1,123 @@
+""" Reverse index from glossings to the flexcodes producing them.
+
+Lets searches for glossings be rewritten into filters on flexcodes:
+
+>>> index = get_index()
+>>> sorted({match.flexcode for match in index.exact('V\\\\tam.pass:stpr')})[:3]
+[-910249, -910248, -910247]
+>>> index.exact('V~post.pass')[0]
+Match(flexcode=10120, gloss='V~post.pass', conditions=('stem=inf', 'stem=strong'))
+
+Where a flexcode produces a glossing only for some parts of speech, the match lists
+the conditions under which it does, e.g. ``stem=inf`` for verbs with infirm stem or
+``noun=N.f`` for feminine substantives. Status codes (0-9), whose glossing consists of
+the part of speech only, are not indexed.
+"""
+import bisect
+from collections import defaultdict, namedtuple
+
+from . import engine
+from .flexcodes import get_flexcode_table
+from .table import FLEX_RANGE, get_table
+
+
+Match = namedtuple('Match', ['flexcode', 'gloss', 'conditions'])
+Match.__doc__ = """ a flexcode producing a glossing, and the part of speech conditions
+under which it does; empty if it always does.
+"""
+
+
+def shape_condition(shape: int) -> str:
+    """ describe the part of speech subtypes of a context shape.
+
+    >>> shape_condition(1)
+    'stem=inf'
+    """
+    stem, noun, adjective = engine.SHAPES[shape]
+    parts = []
+    if stem:
+        parts.append('stem=' + engine.STEMS[stem])
+    if noun != 'N':
+        parts.append('noun=' + noun)
+    if adjective != 'ADJ':
+        parts.append('adjective=' + adjective)
+    return ','.join(parts) or 'default'
+
+
+class ReverseIndex:
+    """ maps glossings to :class:`Match` lists.
+
+    :param flexcodes: flexcodes to index (default: the BTS flexcodes listed in
+        ``data/flexcodes.json``)
+    """
+
+    def __init__(self, flexcodes=None):
+        if flexcodes is None:
+            flexcodes = get_flexcode_table().keys
+        glosses = get_table()
+        shapes = range(len(engine.SHAPES))
+        conditions = tuple(shape_condition(shape) for shape in shapes)
+        found = defaultdict(list)
+        for flexcode in flexcodes:
+            flex = abs(flexcode)
+            if flex <= 9:
+                continue
+            flex %= FLEX_RANGE
+            by_gloss = defaultdict(list)
+            for shape in shapes:
+                by_gloss[glosses.ids[shape * FLEX_RANGE + flex]].append(conditions[shape])
+            for i, shape_conditions in by_gloss.items():
+                gloss = glosses.vocabulary[i]
+                if gloss is None:
+                    continue
+                if len(shape_conditions) == len(conditions):
+                    shape_conditions = ()
+                found[gloss].append(Match(flexcode, gloss, tuple(shape_conditions)))
+        self.matches = {gloss: sorted(matches) for gloss, matches in found.items()}
+        self.glosses = sorted(self.matches)
+
+    def exact(self, gloss: str) -> list:
+        """ return the matches of a complete glossing.
+        """
+        return self.matches.get(gloss, [])
+
+    def prefix(self, prefix: str) -> list:
+        """ return the matches of all glossings starting with ``prefix``.
+
+        >>> sorted({match.gloss for match in get_index().prefix('V\\\\imp.')})
+        ['V\\\\imp.du', 'V\\\\imp.pl', 'V\\\\imp.sg', 'V\\\\imp.sg:stpr']
+        """
+        start = bisect.bisect_left(self.glosses, prefix)
+        end = bisect.bisect_left(self.glosses, prefix + '\U0010ffff', start)
+        return self._collect(self.glosses[start:end])
+
+    def substring(self, fragment: str) -> list:
+        """ return the matches of all glossings containing ``fragment``.
+        """
+        return self._collect(gloss for gloss in self.glosses if fragment in gloss)
+
+    def _collect(self, glosses) -> list:
+        matches = []
+        for gloss in glosses:
+            matches.extend(self.matches[gloss])
+        return sorted(matches)
+
+    def flexcodes(self, query: str, mode: str = 'exact') -> list:
+        """ return the sorted, distinct flexcodes matching a query, e.g. for use in a
+        search ``terms`` filter.
+
+        :param mode: ``exact``, ``prefix`` or ``substring``
+        """
+        return sorted({match.flexcode for match in getattr(self, mode)(query)})
+
+
+_INDEX = None
+
+
+def get_index() -> ReverseIndex:
+    """ return a shared reverse index of the BTS flexcodes, building it on first use.
+    """
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = ReverseIndex()
+    return _INDEX
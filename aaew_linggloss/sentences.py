@@ -0,0 +1,100 @@
+""" Glossing whole sentences and documents.
+
+Lemma metadata (lemma ID based glossing, part of speech context) is looked up once
+per distinct lemma of a sentence or document, so that tokens only cost a table lookup
+of their flexcode.
+
+>>> gloss_sentence([
+...     (0, '10050', 'pronoun', 'personal_pronoun'),
+...     (70060, '125581', 'substantive', 'substantive_masc'),
+... ])
+SentenceGlossing(glosses=['-3sg.m', 'N.m:sg:stc'], line='-3sg.m N.m:sg:stc')
+"""
+from collections import namedtuple
+
+from .lemmas import Lemma, lemma
+from .records import Fields, occurrence
+from .table import get_table
+
+
+# token layout of TLA sentence objects
+TOKEN_FIELDS = Fields(
+    'flexion.btsFlex', 'lemma.id', 'lemma.POS.type', 'lemma.POS.subtype', 'flexion.lingGloss'
+)
+
+SentenceGlossing = namedtuple('SentenceGlossing', ['glosses', 'line'])
+SentenceGlossing.__doc__ = """ glossings of the tokens of a sentence, and the gloss
+line of its interlinear representation.
+"""
+
+
+def interlinear_line(glosses: list, missing: str = '_') -> str:
+    """ join token glossings into the gloss line of an interlinear representation.
+
+    >>> interlinear_line(['N.f:sg', '', '-1sg'])
+    'N.f:sg _ -1sg'
+
+    :param missing: placeholder for tokens without glossing
+    """
+    return ' '.join(gloss or missing for gloss in glosses)
+
+
+class SentenceGlosser:
+    """ glosses sentences, remembering the metadata of the lemmas seen so far.
+    Use one instance per document.
+
+    :param fields: field names for tokens given as dictionaries
+    """
+
+    def __init__(self, fields: Fields = TOKEN_FIELDS):
+        self.fields = fields
+        self.table = get_table()
+        self.lemmas = {}
+
+    def lemma(self, lemmaID, pos, sub_pos) -> Lemma:
+        """ return the metadata of a lemma, compiling it on first use.
+        """
+        key = (lemmaID, pos, sub_pos)
+        record = self.lemmas.get(key)
+        if record is None:
+            record = self.lemmas[key] = lemma(lemmaID, pos, sub_pos)
+        return record
+
+    def glosses(self, tokens) -> list:
+        """ gloss the tokens of a sentence.
+
+        :param tokens: iterable of dictionaries or ``(flexcode, lemmaID, type, subtype)`` tuples
+        """
+        glosses = []
+        for token in tokens:
+            if isinstance(token, dict):
+                flexcode, lemmaID, pos, sub_pos = occurrence(token, self.fields)
+            else:
+                flexcode, lemmaID, pos, sub_pos = token
+            record = self.lemma(lemmaID, pos, sub_pos)
+            glosses.append(record.override or self.table.glossing(flexcode, record.context))
+        return glosses
+
+    def gloss_sentence(self, tokens) -> SentenceGlossing:
+        glosses = self.glosses(tokens)
+        return SentenceGlossing(glosses, interlinear_line(glosses))
+
+
+def gloss_sentence(tokens, fields: Fields = TOKEN_FIELDS) -> SentenceGlossing:
+    """ gloss the tokens of a sentence and render its interlinear gloss line.
+
+    :param tokens: iterable of TLA token dictionaries, laid out as described by
+        ``fields``, or of ``(flexcode, lemmaID, type, subtype)`` tuples
+    """
+    return SentenceGlosser(fields).gloss_sentence(tokens)
+
+
+def gloss_document(sentences, fields: Fields = TOKEN_FIELDS) -> list:
+    """ gloss a sequence of sentences, looking up the metadata of each lemma only once
+    for the whole document.
+
+    :param sentences: iterable of token sequences as accepted by :func:`gloss_sentence`
+    :returns: list of :class:`SentenceGlossing`
+    """
+    glosser = SentenceGlosser(fields)
+    return [glosser.gloss_sentence(tokens) for tokens in sentences]
@@ -0,0 +1,201 @@
+""" Glossing service speaking JSON over HTTP, available as ``aaew-linggloss serve``.
+
+Keeps the glossing tables loaded and memoizes glossings across all clients. Lemma
+occurrences are sent in batches::
+
+    $ curl -d '{"occurrences": [[70060, "1", "substantive", "substantive_masc"]]}' localhost:8080/gloss
+    {"glosses": ["N.m:sg:stc"]}
+
+Occurrences are ``[flexcode, lemmaID, type, subtype]`` arrays or objects with these
+keys. ``GET /stats`` reports request counts, cache statistics and the p50/p99
+latency of recent requests.
+
+Only the standard library is used; the server is meant to run locally or behind a
+reverse proxy, not to face the internet.
+"""
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from http import HTTPStatus
+
+from .cache import GlossCache
+from .table import get_table
+
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status: HTTPStatus, message: str = None):
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+class LatencyRecorder:
+    """ keeps the latencies of the most recent requests and computes percentiles.
+
+    >>> latencies = LatencyRecorder()
+    >>> for seconds in range(1, 101): latencies.record(seconds / 1000)
+    >>> latencies.percentile(50), latencies.percentile(99)
+    (0.05, 0.099)
+    """
+
+    def __init__(self, size: int = 10000):
+        self.latencies = deque(maxlen=size)
+
+    def record(self, seconds: float):
+        self.latencies.append(seconds)
+
+    def percentile(self, p: float) -> float:
+        """ return the ``p``-th percentile (nearest rank), or ``None`` before the
+        first request.
+        """
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[max(0, math.ceil(len(latencies) * p / 100) - 1)]
+
+
+def _occurrence(item) -> tuple:
+    if isinstance(item, dict):
+        return (item.get('flexcode'), item.get('lemmaID'), item.get('type'), item.get('subtype'))
+    if isinstance(item, list) and 1 <= len(item) <= 4:
+        return tuple(item) + (None,) * (4 - len(item))
+    raise HTTPError(HTTPStatus.BAD_REQUEST, 'invalid occurrence: {!r}'.format(item))
+
+
+class GlossService:
+    """ request handling state shared by all connections.
+
+    :param cache_size: maximum number of memoized glossings
+    """
+
+    def __init__(self, cache_size: int = 100000):
+        get_table()
+        self.cache = GlossCache(cache_size)
+        self.latencies = LatencyRecorder()
+        self.requests = 0
+        self.occurrences = 0
+        self.errors = 0
+
+    def gloss(self, payload) -> dict:
+        """ gloss a batch of occurrences from a decoded request body.
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get('occurrences'), list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, 'expected {"occurrences": [...]}')
+        occurrences = [_occurrence(item) for item in payload['occurrences']]
+        gloss = self.cache.gloss
+        try:
+            glosses = [gloss(*occurrence) for occurrence in occurrences]
+        except (TypeError, OverflowError) as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        self.occurrences += len(glosses)
+        return {'glosses': glosses}
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'occurrences': self.occurrences,
+            'errors': self.errors,
+            'latency_p50': self.latencies.percentile(50),
+            'latency_p99': self.latencies.percentile(99),
+            'cache': self.cache.stats(),
+        }
+
+    def dispatch(self, method: str, path: str, body: bytes) -> dict:
+        if path == '/gloss':
+            if method != 'POST':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, 'invalid JSON')
+            return self.gloss(payload)
+        if path == '/stats':
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return self.stats()
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """ serve HTTP/1.1 requests on a connection until the client closes it.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                start = time.perf_counter()
+                keep_alive = await self._respond(request_line, reader, writer)
+                await writer.drain()
+                self.latencies.record(time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, request_line: bytes, reader, writer) -> bool:
+        self.requests += 1
+        keep_alive = True
+        try:
+            try:
+                method, path, version = request_line.decode('latin-1').split()
+            except ValueError:
+                keep_alive = False
+                raise HTTPError(HTTPStatus.BAD_REQUEST)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+            try:
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                length = -1
+            if not 0 <= length <= MAX_BODY_SIZE:
+                keep_alive = False
+                raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            body = await reader.readexactly(length)
+            status, response = HTTPStatus.OK, self.dispatch(method, path.split('?')[0], body)
+        except HTTPError as e:
+            self.errors += 1
+            status, response = e.status, {'error': str(e)}
+        data = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            'HTTP/1.1 {} {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\n{}\r\n'.format(
+                status.value, status.phrase, len(data), '' if keep_alive else 'Connection: close\r\n',
+            ).encode('latin-1') + data
+        )
+        return keep_alive
+
+
+async def start_server(host: str = '127.0.0.1', port: int = 8080, service: GlossService = None):
+    """ start serving on ``host:port``; port 0 picks a free port.
+
+    :returns: :class:`asyncio.base_events.Server`
+    """
+    service = service or GlossService()
+    return await asyncio.start_server(service.handle, host, port)
+
+
+def run(host: str = '127.0.0.1', port: int = 8080, cache_size: int = 100000):
+    """ serve until interrupted.
+    """
+    async def main():
+        server = await start_server(host, port, GlossService(cache_size))
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,122 @@
+""" Snapshots of the fully built glossing state, for fast worker startup.
+
+Loading the gloss table, numbering the gloss vocabulary, compiling part of speech
+contexts and warming up a glossing cache take time every process pays again.
+:func:`save` writes all of it into a single file, which :func:`restore` maps into
+memory instead::
+
+    snapshot.save('linggloss.snapshot', cache=warm_cache)
+    # in each worker
+    cache = snapshot.restore('linggloss.snapshot')
+
+The gloss table is stored uncompressed and used in place from the memory map, so
+processes on the same machine share its pages. A snapshot only fits the version of
+this package that created it; :func:`restore` refuses others with a
+:class:`ValueError`.
+"""
+import array
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from . import engine, table, vocabulary
+from .cache import GlossCache
+from .flexcodes import _array
+from .mapping import (
+    lingGlossFromLemmaIDDict,
+    dictPOSGlossings,
+    dictSubPOSGlossings,
+    dictPOSGlossingsDefault,
+    dictSubPOSGlossingsDefault,
+    load_resource,
+)
+
+
+MAGIC = b'AAEWSNP1'
+_HEADER = struct.Struct('<8sI') # magic, length of JSON header
+
+
+def source_digest() -> str:
+    """ digest of the shipped gloss table and the lemma ID and part of speech
+    glossings, identifying the glossing state a snapshot is valid for.
+    """
+    try:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', table.FILENAME), 'rb') as f:
+            data = f.read()
+    except OSError:
+        try:
+            data = load_resource(table.FILENAME)
+        except OSError:
+            data = b''
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(json.dumps([
+        lingGlossFromLemmaIDDict, dictPOSGlossings, dictSubPOSGlossings,
+        dictPOSGlossingsDefault, dictSubPOSGlossingsDefault,
+    ], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def save(path: str, cache: GlossCache = None):
+    """ write the current glossing state into a snapshot file.
+
+    :param cache: glossing cache to include, e.g. one warmed up on a sample corpus;
+        only caches in front of the default glossing function make sense here
+    """
+    gloss_table = table.get_table()
+    header = json.dumps({
+        'digest': source_digest(),
+        'shapes': len(engine.SHAPES),
+        'size': table.FLEX_RANGE,
+        'table': gloss_table.vocabulary,
+        'vocabulary': vocabulary.get_vocabulary().glossings,
+        'contexts': list(engine._CONTEXTS),
+        'cache': None if cache is None else {
+            'maxsize': cache.maxsize,
+            'entries': [list(key) + [glossing] for key, glossing in cache.items()],
+        },
+    }, ensure_ascii=False).encode('utf-8')
+    header += b' ' * (-(_HEADER.size + len(header)) % 8) # align gloss table
+    ids = array.array('H', gloss_table.ids)
+    if sys.byteorder == 'big':
+        ids.byteswap()
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(header)))
+        f.write(header)
+        f.write(ids.tobytes())
+
+
+def restore(path: str) -> GlossCache:
+    """ install the glossing state of a snapshot file in this process.
+
+    :returns: the snapshot's glossing cache, or ``None`` if it has none
+    :raises ValueError: if the file is no snapshot or does not fit this package
+    """
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < _HEADER.size:
+        raise ValueError('not a glossing snapshot')
+    magic, size = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError('not a glossing snapshot')
+    start = _HEADER.size + size
+    header = json.loads(buffer[_HEADER.size:start].decode('utf-8'))
+    if (
+        header['digest'] != source_digest()
+        or header['shapes'] != len(engine.SHAPES)
+        or header['size'] != table.FLEX_RANGE
+        or len(buffer) - start != 2 * len(engine.SHAPES) * table.FLEX_RANGE
+    ):
+        raise ValueError('snapshot does not match the glossing rules of this package')
+
+    table._TABLE = table.GlossTable(header['table'], _array('H', memoryview(buffer)[start:]))
+    vocabulary._VOCABULARY = vocabulary.GlossVocabulary(header['vocabulary'])
+    for pos, sub_pos in header['contexts']:
+        engine.context(pos, sub_pos)
+    if header['cache'] is None:
+        return None
+    cache = GlossCache(header['cache']['maxsize'])
+    cache.update((tuple(entry[:4]), entry[4]) for entry in header['cache']['entries'])
+    return cache
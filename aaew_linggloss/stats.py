@@ -0,0 +1,183 @@
+""" Corpus statistics over glossings, available as ``aaew-linggloss stats``.
+
+:class:`CorpusStatistics` counts glossings per part of speech type, flexcode
+categories per group (e.g. per period) and outcome classes, optionally along with
+diagnostics, in a single pass over a stream of records:
+
+>>> statistics = CorpusStatistics()
+>>> statistics.count_records([
+...     {'flexcode': 70060, 'lemmaID': '1', 'type': 'substantive'},
+...     {'flexcode': 0, 'lemmaID': '1', 'type': 'substantive'},
+... ])
+>>> statistics.glosses
+Counter({('substantive', 'N:sg:stc'): 1, ('substantive', 'N(infl. unedited)'): 1})
+
+Counters of separate parts of a corpus can be merged, so that statistics can be
+computed in worker processes, see :func:`count_chunk`.
+"""
+import csv
+import json
+from collections import Counter
+
+from . import computeLingGlossing, posSubposFromColumns
+from .diagnostics import DiagnosticsCollector
+from .instrumentation import category, outcome
+from .records import DEFAULT_FIELDS, Fields, get_field, gloss_occurrence, occurrence
+
+
+# CSV rows hold one count each, see :meth:`CorpusStatistics.rows`
+CSV_COLUMNS = ('counter', 'group', 'value', 'count')
+
+# outcome of records without a gloss field, counted with ``glossed``
+MISSING = 'missing'
+
+
+def _key(value) -> str:
+    return '' if value is None else str(value)
+
+
+def _most_common(counter: Counter) -> list:
+    """ like :meth:`Counter.most_common`, but ordering ties by key, so that merged
+    counts always come out the same.
+    """
+    return sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+
+
+class CorpusStatistics:
+    """ mergeable counts over lemma occurrence records.
+
+    :param fields: record field names
+    :param group_field: record field to group category counts by, e.g. a period
+    :param diagnostics: whether to count diagnostics; glosses with the reference
+        implementation, which is considerably slower
+    :param glossed: take glossings from the records' gloss field instead of glossing
+    """
+
+    def __init__(self, fields: Fields = DEFAULT_FIELDS, group_field: str = None, diagnostics: bool = False,
+                 glossed: bool = False):
+        self.fields = fields
+        self.group_field = group_field
+        self.diagnostics = DiagnosticsCollector() if diagnostics else None
+        self.glossed = glossed
+        self.occurrences = 0
+        self.glosses = Counter()
+        self.categories = Counter()
+        self.outcomes = Counter()
+
+    def count(self, record: dict):
+        """ count a record.
+        """
+        flexcode, lemmaID, pos, sub_pos = occurrence(record, self.fields)
+        if self.glossed:
+            glossing = get_field(record, self.fields.gloss)
+        elif self.diagnostics is not None:
+            glossing = computeLingGlossing(
+                flexcode, lemmaID, posSubposFromColumns(pos, sub_pos), diagnostics=self.diagnostics
+            )
+        else:
+            glossing = gloss_occurrence(flexcode, lemmaID, pos, sub_pos)
+        cat = category(flexcode, lemmaID)
+        group = get_field(record, self.group_field) if self.group_field else None
+        self.occurrences += 1
+        self.glosses[_key(pos), _key(glossing)] += 1
+        self.categories[_key(group), cat] += 1
+        self.outcomes[MISSING if glossing is None else outcome(cat, glossing)] += 1
+
+    def count_records(self, records):
+        for record in records:
+            self.count(record)
+
+    def merge(self, other: 'CorpusStatistics'):
+        """ add the counts of another instance, e.g. from a worker process.
+        """
+        self.occurrences += other.occurrences
+        self.glosses.update(other.glosses)
+        self.categories.update(other.categories)
+        self.outcomes.update(other.outcomes)
+        if self.diagnostics is not None and other.diagnostics is not None:
+            self.diagnostics.merge(other.diagnostics)
+
+    def shares(self) -> dict:
+        """ return the share of each glossing among all occurrences.
+
+        >>> statistics = CorpusStatistics()
+        >>> statistics.count_records([{'flexcode': 'x'}, {'flexcode': 70060}])
+        >>> statistics.shares()['(invalid code)']
+        0.5
+        """
+        totals = Counter()
+        for (_, glossing), count in self.glosses.items():
+            totals[glossing] += count
+        return {
+            glossing: count / self.occurrences for glossing, count in _most_common(totals)
+        }
+
+    def outcome_shares(self) -> dict:
+        """ return the share of each outcome class among all occurrences, e.g. of
+        ``unresolved`` and ``unedited`` glossings across parts of speech.
+
+        >>> statistics = CorpusStatistics()
+        >>> statistics.count_records([
+        ...     {'flexcode': 0, 'type': 'verb'}, {'flexcode': 0, 'type': 'substantive'},
+        ...     {'flexcode': 99999}, {'flexcode': 70060},
+        ... ])
+        >>> statistics.outcome_shares()
+        {'unedited': 0.5, 'glossed': 0.25, 'unresolved': 0.25}
+        """
+        return {
+            name: count / self.occurrences for name, count in _most_common(self.outcomes)
+        }
+
+    def rows(self):
+        """ yield ``(counter, group, value, count)`` rows, most frequent first within
+        each counter.
+        """
+        for (pos, glossing), count in _most_common(self.glosses):
+            yield 'gloss', pos, glossing, count
+        for (group, cat), count in _most_common(self.categories):
+            yield 'category', group, cat, count
+        for name, count in _most_common(self.outcomes):
+            yield 'outcome', '', name, count
+        if self.diagnostics is not None:
+            for code, count in _most_common(self.diagnostics.counter):
+                yield 'diagnostic', '', code, count
+
+    def to_dict(self) -> dict:
+        result = {
+            'occurrences': self.occurrences,
+            'glosses': [
+                {'type': pos, 'gloss': glossing, 'count': count}
+                for (pos, glossing), count in _most_common(self.glosses)
+            ],
+            'categories': [
+                {'group': group, 'category': cat, 'count': count}
+                for (group, cat), count in _most_common(self.categories)
+            ],
+            'outcomes': dict(_most_common(self.outcomes)),
+            'shares': self.shares(),
+            'outcome_shares': self.outcome_shares(),
+        }
+        if self.diagnostics is not None:
+            result['diagnostics'] = dict(_most_common(self.diagnostics.counter))
+        return result
+
+    def write_json(self, stream):
+        json.dump(self.to_dict(), stream, ensure_ascii=False, indent=1)
+        stream.write('\n')
+
+    def write_csv(self, stream, delimiter: str = ','):
+        writer = csv.writer(stream, delimiter=delimiter, lineterminator='\n')
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(self.rows())
+
+
+def count_chunk(chunk: list, fields: Fields = DEFAULT_FIELDS, group_field: str = None, diagnostics: bool = False,
+                glossed: bool = False, jsonl: bool = False) -> CorpusStatistics:
+    """ count a chunk of records, or of JSONL lines if ``jsonl`` is set. Used by
+    worker processes; merge the results with :meth:`CorpusStatistics.merge`.
+    """
+    statistics = CorpusStatistics(fields, group_field, diagnostics, glossed)
+    if jsonl:
+        chunk = (json.loads(line) for line in chunk if line.strip())
+    statistics.count_records(chunk)
+    return statistics
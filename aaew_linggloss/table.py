@@ -0,0 +1,193 @@
+""" Exhaustive precomputed glossings.
+
+The flexcode based glossing rules only depend on the flexcode with its negation digit
+stripped (``0 <= flex < 100000``) and on which of the part of speech classes in
+:data:`aaew_linggloss.engine.SHAPES` a lemma belongs to. A :class:`GlossTable` holds
+the result of every such combination, so that glossing a lemma occurrence takes a
+single indexed read. Only status codes and unresolved flexcodes depend on the actual
+part of speech glossings and are filled in at lookup time.
+
+The table is shipped in ``data/glosstable.bin``; regenerate it after changing the
+glossing rules by running ``python -m aaew_linggloss.table``. Its header holds a
+digest of the rules it was built from (see :func:`rules_digest`); tables built from
+other rules are rebuilt on load.
+"""
+import array
+import hashlib
+import json
+import os
+import struct
+import sys
+import warnings
+import zlib
+
+from . import engine
+from .mapping import (
+    lingGlossFromLemmaIDDict,
+    dictPOSGlossings,
+    dictSubPOSGlossings,
+    dictPOSGlossingsDefault,
+    dictSubPOSGlossingsDefault,
+    load_resource,
+)
+
+
+FILENAME = 'glosstable.bin'
+FLEX_RANGE = 100000
+
+_HEADER = struct.Struct('<I')
+
+
+def rules_digest() -> str:
+    """ digest of the glossing rules in :mod:`aaew_linggloss.engine` and of the part
+    of speech glossings, or ``None`` if the source of the rules is not available.
+    """
+    try:
+        with open(engine.__file__, 'rb') as f:
+            source = f.read().replace(b'\r\n', b'\n')
+    except (OSError, TypeError):
+        return None
+    digest = hashlib.blake2b(source, digest_size=16)
+    digest.update(json.dumps([
+        dictPOSGlossings, dictSubPOSGlossings, dictPOSGlossingsDefault, dictSubPOSGlossingsDefault,
+    ], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class GlossTable:
+    """ glossings of every flexcode for every part of speech class.
+
+    :param vocabulary: list of distinct glossings; ``None`` marks unresolved flexcodes
+    :param ids: vocabulary indices, one row of :data:`FLEX_RANGE` entries per
+        part of speech class
+    """
+
+    def __init__(self, vocabulary: list, ids: array.array):
+        self.vocabulary = vocabulary
+        self.ids = ids
+
+    @classmethod
+    def build(cls) -> 'GlossTable':
+        """ compute the table from the compiled glossing rules.
+        """
+        vocabulary = {None: 0}
+        ids = array.array('H')
+        for shape in range(len(engine.SHAPES)):
+            ctx = engine.shape_context(shape)
+            for flex in range(FLEX_RANGE):
+                category, handler = engine.DISPATCH[flex // 100]
+                if category == engine.UNRESOLVED:
+                    glossing = None
+                else:
+                    glossing = ''.join(handler(flex, ctx))
+                ids.append(
+                    vocabulary.setdefault(glossing, len(vocabulary))
+                )
+        return cls(list(vocabulary), ids)
+
+    def to_bytes(self) -> bytes:
+        """ serialize into the compressed format of ``data/glosstable.bin``.
+        """
+        header = json.dumps({
+            'shapes': len(engine.SHAPES),
+            'size': FLEX_RANGE,
+            'rules': rules_digest(),
+            'vocabulary': self.vocabulary,
+        }).encode('utf-8')
+        ids = array.array('H', self.ids)
+        if sys.byteorder == 'big':
+            ids.byteswap()
+        return zlib.compress(
+            _HEADER.pack(len(header)) + header + ids.tobytes(), 9
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GlossTable':
+        """ deserialize a table produced by :meth:`to_bytes`.
+
+        :raises ValueError: if the table does not fit the current glossing rules
+        """
+        data = zlib.decompress(data)
+        size, = _HEADER.unpack_from(data)
+        header = json.loads(data[_HEADER.size:_HEADER.size + size].decode('utf-8'))
+        if header['shapes'] != len(engine.SHAPES) or header['size'] != FLEX_RANGE:
+            raise ValueError('gloss table does not match part of speech classes')
+        rules = rules_digest()
+        if rules is not None and header.get('rules') != rules:
+            raise ValueError('gloss table was built from other glossing rules')
+        ids = array.array('H')
+        ids.frombytes(data[_HEADER.size + size:])
+        if sys.byteorder == 'big':
+            ids.byteswap()
+        return cls(header['vocabulary'], ids)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    def glossing(self, flexcode, ctx: engine.Context) -> str:
+        """ look up the glossing of a flexcode within a part of speech context,
+        without lemma ID based glossing.
+
+        >>> get_table().glossing('-10930', engine.context('verb', 'verb_3-lit'))
+        'V~post.pass'
+        """
+        try:
+            flexcode = int(flexcode)
+        except ValueError:
+            return '(invalid code)'
+        if flexcode < 0:
+            flexcode = -flexcode
+        if flexcode <= 9:
+            _, base, form, state = engine.analyze(flexcode, ctx)
+            return base + form + state
+        glossing = self.vocabulary[
+            self.ids[ctx.shape * FLEX_RANGE + flexcode % FLEX_RANGE]
+        ]
+        if glossing is None:
+            return ctx.posGloss or '(unresolved)'
+        return glossing
+
+
+_TABLE = None
+
+
+def get_table() -> GlossTable:
+    """ return the gloss table shipped with this package, or build it with a
+    warning if it is missing or outdated.
+    """
+    global _TABLE
+    if _TABLE is None:
+        try:
+            _TABLE = GlossTable.from_bytes(load_resource(FILENAME))
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            warnings.warn(
+                'cannot load {} ({}), building the gloss table instead; '
+                'regenerate it with python -m aaew_linggloss.table'.format(FILENAME, e),
+                RuntimeWarning, stacklevel=2,
+            )
+            _TABLE = GlossTable.build()
+    return _TABLE
+
+
+def compute_ling_glossing(flexcode, lemmaID: str, pos_subpos: dict) -> str:
+    """ Apply Leipzig Glossing Rules to Part of Speech and flexion information of a
+    lemma occurrence by table lookup. Same signature and results as
+    :func:`aaew_linggloss.computeLingGlossing`.
+
+    >>> compute_ling_glossing(70060, '125581', {'type': 'substantive', 'subtype': 'substantive_masc'})
+    'N.m:sg:stc'
+    """
+    glossing = lingGlossFromLemmaIDDict.get(lemmaID)
+    if glossing:
+        return glossing
+    return get_table().glossing(
+        flexcode, engine.context(*engine.split_pos_subpos(pos_subpos))
+    )
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(__file__), 'data', FILENAME
+    )
+    GlossTable.build().save(path)
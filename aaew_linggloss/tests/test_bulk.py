@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from .. import cli, computeLingGlossing, resolve_flexcode
+from ..bulk import BulkEnricher, bulk_items, enrich_bulk
+
+
+def _token(flexcode, lemmaID, pos=None):
+    token = {'flexion': {'btsFlex': flexcode}, 'lemma': {'id': lemmaID}}
+    if pos:
+        token['lemma']['POS'] = {'type': pos}
+    return token
+
+
+BULK = [
+    {'index': {'_index': 'sentence', '_id': 's1'}},
+    {'id': 's1', 'tokens': [_token(70060, '1', 'substantive'), _token(-10930, '2', 'verb'), {'type': 'gap'}]},
+    {'delete': {'_id': 's0'}},
+    {'update': {'_id': 's2'}},
+    {'doc': {'tokens': [_token(0, '10030')]}},
+    {'create': {'_id': 'l1'}},
+    {'id': 'l1', 'name': 'lemma without tokens'},
+]
+
+
+def _lines(items):
+    return [json.dumps(item) + '\n' for item in items]
+
+
+def test_enrich_bulk():
+    lines = _lines(BULK)
+    enriched = [json.loads(line) for line in enrich_bulk(lines)]
+    assert len(enriched) == len(BULK)
+    tokens = enriched[1]['tokens']
+    assert [token.get('flexion', {}).get('lingGloss') for token in tokens] == [
+        computeLingGlossing(70060, '1', {'type': 'substantive'}),
+        computeLingGlossing(-10930, '2', {'type': 'verb'}),
+        None,
+    ]
+    assert tokens[1]['flexion']['bGlossing'] == resolve_flexcode(-10930)
+    assert enriched[4]['doc']['tokens'][0]['flexion']['lingGloss'] == '-1sg'
+    assert list(enrich_bulk(lines))[5:] == lines[5:]
+
+
+def test_bulk_items_invalid():
+    with pytest.raises(ValueError):
+        list(bulk_items(['{"index": {}}']))
+    with pytest.raises(ValueError):
+        list(bulk_items(['{"tokens": []}', '{}']))
+
+
+def test_bulk_enricher_fields():
+    enricher = BulkEnricher(tokens_field='sentence.tokens', bts_field=None)
+    document = {'sentence': {'tokens': [_token(10020, '1', 'verb')]}}
+    assert enricher.enrich(document)
+    assert document['sentence']['tokens'][0]['flexion'] == {'btsFlex': 10020, 'lingGloss': 'V\\tam.act'}
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_cli_bulk(tmp_path, workers):
+    infile = tmp_path / 'bulk.ndjson'
+    outfile = tmp_path / 'enriched.ndjson'
+    infile.write_text(''.join(_lines(BULK * 3)))
+    cli.main(['bulk', str(infile), '-o', str(outfile), '-w', str(workers), '--chunk-size', '2'])
+    assert outfile.read_text() == ''.join(enrich_bulk(_lines(BULK * 3)))
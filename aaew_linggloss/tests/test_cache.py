@@ -0,0 +1,24 @@
+from .. import computeLingGlossing
+from ..cache import GlossCache
+
+
+def test_cache_counters():
+    cache = GlossCache(maxsize=2)
+    for flexcode in (10020, '10020', 10040, 10020, 96423, 10040):
+        cache.gloss(flexcode, '1', 'verb', 'verb_3-lit')
+    assert cache.stats() == {
+        'hits': 2, 'misses': 4, 'evictions': 2, 'size': 2, 'maxsize': 2,
+        'hit_rate': 2 / 6,
+    }
+
+
+def test_cache_results():
+    cache = GlossCache(maxsize=10)
+    for flexcode in (0, 3, 70060, 'x', None, 10930, -10930, 1.0):
+        for lemmaID in ('1', '10030', 10030):
+            for pos_subpos in ({'type': 'verb', 'subtype': 'verb_3-inf'}, {'type': 'substantive'}, None):
+                try:
+                    expected = computeLingGlossing(flexcode, lemmaID, pos_subpos)
+                except TypeError:
+                    continue
+                assert cache.computeLingGlossing(flexcode, lemmaID, pos_subpos) == expected
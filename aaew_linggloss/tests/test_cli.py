@@ -0,0 +1,56 @@
+import json
+
+from .. import cli
+
+
+def test_cli_gloss_jsonl(tmp_path):
+    infile = tmp_path / 'tokens.jsonl'
+    outfile = tmp_path / 'glossed.jsonl'
+    infile.write_text(
+        '{"flexion": {"btsFlex": 70060}, "lemma": {"id": "125581", "POS": {"type": "substantive", "subtype": "substantive_masc"}}}\n'
+        '{"flexion": {"btsFlex": 0}, "lemma": {"id": "10030", "POS": {"type": "pronoun"}}}\n'
+    )
+    cli.main([
+        'gloss', str(infile), '-o', str(outfile), '--buffer-size', '1',
+        '--flexcode-field', 'flexion.btsFlex', '--lemmaid-field', 'lemma.id',
+        '--type-field', 'lemma.POS.type', '--subtype-field', 'lemma.POS.subtype',
+        '--gloss-field', 'flexion.lingGloss',
+    ])
+    glossings = [
+        json.loads(line)['flexion']['lingGloss']
+        for line in outfile.read_text().splitlines()
+    ]
+    assert glossings == ['N.m:sg:stc', '-1sg']
+
+
+def test_cli_gloss_tsv(tmp_path):
+    infile = tmp_path / 'tokens.tsv'
+    outfile = tmp_path / 'glossed.tsv'
+    infile.write_text(
+        'flexcode\tlemmaID\ttype\tsubtype\n'
+        '-10930\t1\tverb\tverb_3-lit\n'
+        'x\t1\tverb\t\n'
+    )
+    cli.main(['gloss', str(infile), '-o', str(outfile)])
+    assert outfile.read_text().splitlines() == [
+        'flexcode\tlemmaID\ttype\tsubtype\tlingGloss',
+        '-10930\t1\tverb\tverb_3-lit\tV~post.pass',
+        'x\t1\tverb\t\t(invalid code)',
+    ]
+
+
+def test_cli_gloss_workers(tmp_path):
+    infile = tmp_path / 'tokens.jsonl'
+    infile.write_text(''.join(
+        json.dumps({'flexcode': flexcode, 'lemmaID': '1', 'type': 'verb'}) + '\n'
+        for flexcode in range(10000, 10100)
+    ))
+    serial, parallel = tmp_path / 'serial.jsonl', tmp_path / 'parallel.jsonl'
+    cli.main(['gloss', str(infile), '-o', str(serial)])
+    cli.main(['gloss', str(infile), '-o', str(parallel), '-w', '2', '--chunk-size', '7'])
+    assert serial.read_text() == parallel.read_text()
+    cli.main([
+        'gloss', str(infile), '-o', str(parallel), '-w', '2', '--chunk-size', '7',
+        '--cache-size', '10', '--buffer-size', '20',
+    ])
+    assert serial.read_text() == parallel.read_text()
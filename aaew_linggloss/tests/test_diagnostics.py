@@ -0,0 +1,37 @@
+from .. import computeLingGlossing
+from ..diagnostics import DiagnosticsCollector, ERROR, KINDS, WARNING
+from .test_engine import POS_SUBPOS
+
+
+def test_diagnostics_counts():
+    collector = DiagnosticsCollector(max_records=None)
+    assert computeLingGlossing('x', '1', {'type': 'verb'}, collector) == '(invalid code)'
+    assert computeLingGlossing(70060, '1', {'type': 'verb'}, collector) == 'N:sg:stc'
+    assert computeLingGlossing(70060, '1', {'type': 'substantive'}, collector) == 'N:sg:stc'
+    assert collector.counts() == {
+        'invalid_flexcode': 1, 'suspicious_pos': 1, 'noun_no_gender': 1,
+    }
+    assert collector.counts(ERROR) == {'invalid_flexcode': 1}
+    assert collector.total(WARNING) == 2
+    record = next(iter(collector))
+    assert (record.code, record.pos, record.flexcode) == ('invalid_flexcode', 'verb', 'x')
+    assert str(record) == 'verb\t\tx\tError: Invalid flexcode [no number]: '
+
+
+def test_diagnostics_do_not_change_glossings():
+    collector = DiagnosticsCollector()
+    for pos_subpos in POS_SUBPOS:
+        for flexcode in range(0, 100000, 7):
+            assert computeLingGlossing(flexcode, '1', pos_subpos, collector) \
+                == computeLingGlossing(flexcode, '1', pos_subpos)
+    assert set(collector.counts()) <= set(KINDS)
+    assert collector.records == []
+
+
+def test_diagnostics_merge():
+    a, b = DiagnosticsCollector(max_records=1), DiagnosticsCollector(max_records=1)
+    computeLingGlossing(10000, '1', {'type': 'verb'}, a)
+    computeLingGlossing(10000, '1', {'type': 'verb'}, b)
+    a.merge(b)
+    assert a.counts() == {'sc_underspecified': 2}
+    assert len(a.records) == 1
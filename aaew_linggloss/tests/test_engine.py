@@ -0,0 +1,60 @@
+import pytest
+
+from .. import (
+    computeLingGlossing,
+    engine,
+    lingGlossFromLemmaIDDict,
+)
+
+
+POS_SUBPOS = [
+    None,
+    {'type': 'verb'},
+    {'type': 'verb', 'subtype': 'verb_3-inf'},
+    {'type': 'verb', 'subtype': 'verb_3-gem'},
+    {'type': 'verb', 'subtype': 'verb_2-lit'},
+    {'type': 'substantive'},
+    {'type': 'substantive', 'subtype': 'substantive_masc'},
+    {'type': 'substantive', 'subtype': 'substantive_fem'},
+    {'type': 'adjective', 'subtype': 'nisbe_adjective_preposition'},
+    {'type': 'adjective', 'subtype': 'nisbe_adjective_substantive'},
+    {'type': 'pronoun', 'subtype': 'personal_pronoun'},
+]
+
+
+@pytest.mark.parametrize('pos_subpos', POS_SUBPOS)
+def test_engine_flexcode_space(pos_subpos):
+    mismatches = [
+        flexcode for flexcode in range(100000)
+        if engine.compute_ling_glossing(flexcode, '1', pos_subpos)
+        != computeLingGlossing(flexcode, '1', pos_subpos)
+    ]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize('flexcode', [
+    -10168, -9, '3', 100005, 110930, '-71260', 900000, 1110842, '', 'x', '70.1', 70060.0,
+])
+def test_engine_edge_cases(flexcode):
+    for pos_subpos in POS_SUBPOS:
+        assert engine.compute_ling_glossing(flexcode, '1', pos_subpos) == computeLingGlossing(
+            flexcode, '1', pos_subpos
+        )
+
+
+def test_engine_lemma_ids():
+    for lemmaID in lingGlossFromLemmaIDDict:
+        assert engine.compute_ling_glossing(0, lemmaID, None) == computeLingGlossing(
+            0, lemmaID, None
+        )
+
+
+def test_engine_pos_glossings():
+    from ..mapping import dictPOSGlossings, dictSubPOSGlossings
+    for pos in list(dictPOSGlossings) + ['', None, 'unknown']:
+        for sub_pos in list(dictSubPOSGlossings) + [None, 'unknown']:
+            pos_subpos = {'type': pos, 'subtype': sub_pos}
+            for flexcode in list(range(10)) + [73000, 100001]:
+                assert engine.compute_ling_glossing(flexcode, '1', pos_subpos) == computeLingGlossing(
+                    flexcode, '1', pos_subpos
+                )
@@ -0,0 +1,23 @@
+from .. import bts, cli, resolve_flexcode
+from ..flexcodes import FlexcodeTable, get_flexcode_table
+
+
+def test_flexcodes_binary_up_to_date():
+    table = get_flexcode_table()
+    assert dict(table.items()) == {
+        int(flexcode): value for flexcode, value in bts.FLEXCODES.items()
+    }
+
+
+def test_resolve_flexcode_matches_json():
+    for flexcode, value in bts.FLEXCODES.items():
+        assert resolve_flexcode(flexcode) == value
+        assert resolve_flexcode(int(flexcode)) == value
+    for flexcode in ('010168', ' 10168', '+10168', '10168.0', 10168.0, True, None, 73000, 2**40):
+        assert resolve_flexcode(flexcode) == bts.FLEXCODES.get(str(flexcode))
+
+
+def test_build_flexcodes(tmp_path):
+    path = tmp_path / 'flexcodes.bin'
+    cli.main(['build-flexcodes', '-o', str(path)])
+    assert FlexcodeTable.open(str(path)).get(-10168) == 'SC.pass.spec.2du'
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from .. import (
+    computeLingGlossing,
+    posSubposFromColumns,
+)
+from ..frames import ling_glossings
+
+
+def test_accessor_matches_reference():
+    rng = random.Random(0)
+    size = 20000
+    df = pd.DataFrame({
+        'flexcode': [rng.choice([rng.randrange(-200000, 200000), rng.randrange(10)]) for _ in range(size)],
+        'lemma_id': [rng.choice(['1', '10030', 'dm3623', '125581', None]) for _ in range(size)],
+        'type': [rng.choice(['verb', 'substantive', 'adjective', None, 'pronoun']) for _ in range(size)],
+        'subtype': [rng.choice(['verb_3-inf', 'substantive_fem', 'nisbe_adjective_substantive', None]) for _ in range(size)],
+    }, index=range(size, 0, -1))
+    glosses = df.linggloss.gloss(lemma='lemma_id')
+    assert glosses.dtype == 'category'
+    assert (glosses.index == df.index).all()
+    assert glosses.tolist() == [
+        computeLingGlossing(f, l, posSubposFromColumns(t, s))
+        for f, l, t, s in df.itertuples(index=False)
+    ]
+
+
+def test_missing_values_and_columns():
+    df = pd.DataFrame({
+        'flexcode': [70060.0, float('nan'), 10930.0],
+        'type': ['verb', 'verb', float('nan')],
+    })
+    assert ling_glossings(df, lemma=None, subtype=None).tolist() == [
+        computeLingGlossing(70060, None, {'type': 'verb'}),
+        '(invalid code)',
+        computeLingGlossing(10930, None, posSubposFromColumns(None, None)),
+    ]
+    # missing values first, without further columns
+    assert ling_glossings(
+        pd.DataFrame({'flexcode': [None, 70060, None, 3]}), lemma=None, type=None, subtype=None
+    ).tolist() == ['(invalid code)', 'N:sg:stc', '(invalid code)', '(infl. unspecified)']
+
+
+def test_empty_frame():
+    df = pd.DataFrame({'flexcode': [], 'lemmaID': [], 'type': [], 'subtype': []})
+    assert len(df.linggloss.gloss()) == 0
@@ -3,6 +3,8 @@ import pytest
 from .. import (
     bts,
     computeLingGlossing,
+    computeLingGlossings,
+    posSubposFromColumns,
     resolve_flexcode,
 )
 
@@ -24,3 +26,18 @@ def test_gloss():
         }
     )
     assert g == 'N.m:sg:stc'
+
+
+def test_gloss_batch():
+    occurrences = [
+        (70060, '125581', 'substantive', 'substantive_masc'),
+        ('10120', '1', 'verb', 'verb_3-inf'),
+        (0, '10030', 'pronoun', 'personal_pronoun'),
+        ('x', '1', 'verb', None),
+        (-10168, '1', 'verb', 'verb_2-lit'),
+        (70060, '125581', 'substantive', 'substantive_masc'),
+    ]
+    assert computeLingGlossings(occurrences) == [
+        computeLingGlossing(f, l, posSubposFromColumns(t, s))
+        for f, l, t, s in occurrences
+    ]
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+from .. import cli, golden
+
+
+GOLDEN_FILE = os.path.join(os.path.dirname(__file__), 'golden.tsv.gz')
+
+
+@pytest.fixture(scope='module')
+def entries():
+    if not os.path.exists(GOLDEN_FILE):
+        pytest.skip('golden file not installed')
+    return golden.read(GOLDEN_FILE)
+
+
+def test_golden_coverage(entries):
+    assert [entry[:4] for entry in entries] == list(golden.golden_occurrences())
+
+
+@pytest.mark.parametrize('name', sorted(golden.ENGINES))
+def test_golden_engines(entries, name):
+    if name == 'vectorized':
+        pytest.importorskip('numpy')
+    assert golden.diff(entries, golden.ENGINES[name]) == []
+
+
+def test_golden_cli(tmp_path, capsys):
+    path = str(tmp_path / 'golden.tsv.gz')
+    golden.write(path, [(70060, '1', 'substantive', None, 'N:sg'), ('x', '1', None, None, '(invalid code)')])
+    with pytest.raises(SystemExit) as e:
+        cli.main(['golden', path])
+    assert e.value.code == '1 mismatches'
+    assert capsys.readouterr().out == '70060\t1\tsubstantive\t\tN:sg\tN:sg:stc\n'
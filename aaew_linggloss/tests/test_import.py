@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+
+# generous upper bound, importing typically takes a few dozen milliseconds
+IMPORT_TIME_LIMIT = 0.25
+
+
+def _run(code: str) -> list:
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        stdout=subprocess.PIPE, check=True, universal_newlines=True,
+    ).stdout.split()
+
+
+def test_import_time():
+    elapsed, pkg_resources, flexcodes = _run(
+        'import sys, time\n'
+        't = time.perf_counter()\n'
+        'import aaew_linggloss\n'
+        'print(time.perf_counter() - t)\n'
+        'print("pkg_resources" in sys.modules)\n'
+        'print("FLEXCODES" in vars(aaew_linggloss.mapping))\n'
+    )
+    assert pkg_resources == 'False'
+    assert flexcodes == 'False'
+    assert float(elapsed) < IMPORT_TIME_LIMIT
+
+
+def test_flexcodes_loaded_on_demand():
+    before, after, json = _run(
+        'import aaew_linggloss\n'
+        'print(aaew_linggloss.flexcodes._TABLE is not None)\n'
+        'aaew_linggloss.resolve_flexcode(10930)\n'
+        'print(aaew_linggloss.flexcodes._TABLE is not None)\n'
+        'print("FLEXCODES" in vars(aaew_linggloss.mapping))\n'
+    )
+    assert (before, after, json) == ('False', 'True', 'False')
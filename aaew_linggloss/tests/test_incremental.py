@@ -0,0 +1,109 @@
+import json
+
+from .. import cli, mapping
+from ..incremental import Reglosser, fingerprint, load_history, state_digest
+from ..records import gloss_records
+
+
+RECORDS = [
+    {'flexcode': 70060, 'lemmaID': '1', 'type': 'substantive', 'subtype': 'substantive_masc'},
+    {'flexcode': 10020, 'lemmaID': '2', 'type': 'verb', 'subtype': 'verb_3-lit'},
+    {'flexcode': 3, 'lemmaID': '3', 'type': 'particle'},
+    {'flexcode': 0, 'lemmaID': '10030', 'type': 'pronoun'},
+]
+
+
+def _regloss(old, records):
+    # records count as glossed with ``old``
+    history = {}
+    records = [dict(record) for record in records]
+    if old is not None:
+        history[state_digest(old)] = old
+        for record in records:
+            record['lingGlossState'] = state_digest(old)
+    reglosser = Reglosser(history, fingerprint())
+    return reglosser, list(reglosser.regloss(records))
+
+
+def test_regloss_unchanged():
+    state = fingerprint()
+    _, glossed = _regloss(None, RECORDS)
+    reglosser, reglossed = _regloss(state, glossed)
+    assert (reglosser.kept, reglosser.reglossed) == (len(RECORDS), 0)
+    assert reglossed == glossed
+    assert [r['lingGloss'] for r in glossed] == [r['lingGloss'] for r in gloss_records(RECORDS)]
+
+
+def test_regloss_changed_input():
+    _, glossed = _regloss(None, RECORDS)
+    glossed[0]['flexcode'] = 70110
+    reglosser, reglossed = _regloss(fingerprint(), glossed)
+    assert (reglosser.kept, reglosser.reglossed, reglosser.changed) == (3, 1, 1)
+    assert reglosser.changelog == [{
+        'flexcode': 70110, 'lemmaID': '1', 'type': 'substantive', 'subtype': 'substantive_masc',
+        'old': 'N.m:sg:stc', 'new': 'N.m:pl',
+    }]
+
+
+def test_regloss_changed_mappings():
+    state = fingerprint()
+    _, glossed = _regloss(None, RECORDS)
+    state['lemmas']['10030'] = '-1pl'
+    state['pos'][0]['particle'] = 'P'
+    reglosser, _ = _regloss(state, glossed)
+    assert (reglosser.kept, reglosser.reglossed, reglosser.changed) == (2, 2, 0)
+
+    state = fingerprint()
+    state['rules'][4][700] = 'changed'
+    state['subtypes']['verb_3-lit'] = [0, 0]
+    reglosser, _ = _regloss(state, glossed)
+    assert reglosser.reglossed == 2
+
+
+def test_regloss_unknown_state():
+    _, glossed = _regloss(None, RECORDS)
+    for record in glossed:
+        record['lingGlossState'] = 'unknown'
+    reglosser = Reglosser({}, fingerprint())
+    reglossed = list(reglosser.regloss(glossed))
+    assert reglosser.reglossed == len(RECORDS)
+    assert {record['lingGlossState'] for record in reglossed} == {state_digest(fingerprint())}
+
+
+def test_cli_regloss(tmp_path, capsys, monkeypatch):
+    infile = tmp_path / 'tokens.jsonl'
+    outfile = tmp_path / 'glossed.jsonl'
+    state = tmp_path / 'state.json'
+    changelog = tmp_path / 'changes.jsonl'
+    infile.write_text(''.join(json.dumps(record) + '\n' for record in RECORDS))
+    with monkeypatch.context() as patched:
+        patched.setitem(mapping.lingGlossFromLemmaIDDict, '10030', '-1pl')
+        cli.main(['regloss', str(infile), '-o', str(outfile), '--state', str(state)])
+    assert 'reglossed 4 of 4' in capsys.readouterr().err
+    cli.main([
+        'regloss', str(outfile), '-o', str(tmp_path / 'reglossed.jsonl'),
+        '--state', str(state), '--changelog', str(changelog),
+    ])
+    assert 'reglossed 1 of 4 records, 1 glossings changed' in capsys.readouterr().err
+    assert json.loads(changelog.read_text())['old'] == '-1pl'
+    history = load_history(str(state))
+    assert history[state_digest(fingerprint())]['lemmas']['10030'] == mapping.lingGlossFromLemmaIDDict['10030']
+    assert len(history) == 2
+
+
+def test_cli_regloss_shards(tmp_path, capsys, monkeypatch):
+    state = str(tmp_path / 'state.json')
+    shards = []
+    for name in 'ab':
+        shard = tmp_path / (name + '.jsonl')
+        shard.write_text(''.join(json.dumps(record) + '\n' for record in RECORDS))
+        cli.main(['regloss', str(shard), '-o', str(shard) + '.glossed', '--state', state])
+        shards.append(str(shard) + '.glossed')
+    capsys.readouterr()
+    # glossing rules change between runs
+    monkeypatch.setitem(mapping.lingGlossFromLemmaIDDict, '10030', '-1pl')
+    for shard in shards:
+        cli.main(['regloss', shard, '-o', shard + '.new', '--state', state])
+        assert 'reglossed 1 of 4 records, 1 glossings changed' in capsys.readouterr().err
+        assert '"lingGloss": "-1pl"' in (tmp_path / (shard + '.new')).read_text()
+    assert len(load_history(state)) == 2
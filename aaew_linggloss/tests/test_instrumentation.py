@@ -0,0 +1,55 @@
+from .. import cli, computeLingGlossing, engine
+from ..instrumentation import Instrumentation, category
+
+
+def test_instrumentation_categories():
+    instrumentation = Instrumentation()
+    occurrences = [
+        (10020, '1', {'type': 'verb', 'subtype': 'verb_3-lit'}),
+        (-10020, '1', {'type': 'verb', 'subtype': 'verb_3-lit'}),
+        (0, '10030', None),
+        (3, '1', {'type': 'substantive'}),
+        (0, '1', {'type': 'verb'}),
+        (99999, '1', {'type': 'particle'}),
+        (99999, '1', None),
+        ('', '1', None),
+    ]
+    for occurrence in occurrences:
+        assert instrumentation.computeLingGlossing(*occurrence) == computeLingGlossing(*occurrence)
+    stats = instrumentation.to_dict()
+    assert {cat: entry['outcomes'] for cat, entry in stats.items()} == {
+        'suffix_conjugation': {'glossed': 2},
+        'lemma': {'lemma': 1},
+        'status': {'status': 1, 'unedited': 1},
+        'unresolved': {'pos_fallback': 1, 'unresolved': 1},
+        'invalid': {'invalid': 1},
+    }
+    assert stats['unresolved']['calls'] == 2
+    assert all(entry['seconds'] >= 0 for entry in stats.values())
+    assert set(stats) <= set(engine.CATEGORIES)
+
+
+def test_instrumentation_category_matches_engine():
+    ctx = engine.context('verb', None)
+    for flexcode in range(10, 100000, 37):
+        assert category(flexcode, '1') == engine.analyze(flexcode, ctx)[0]
+
+
+def test_instrumentation_merge():
+    a, b = Instrumentation(clock=lambda: 1.0), Instrumentation(clock=lambda: 1.0)
+    a.gloss(70060, '1', 'substantive', None)
+    b.gloss(70060, '1', 'substantive', None)
+    a.merge(b)
+    assert a.counts() == {('substantive', 'glossed'): 2}
+
+
+def test_cli_metrics(tmp_path):
+    infile = tmp_path / 'tokens.jsonl'
+    metrics = tmp_path / 'metrics.prom'
+    infile.write_text('{"flexcode": 70060}\n{"flexcode": 70060}\n')
+    cli.main([
+        'gloss', str(infile), '-o', str(tmp_path / 'out.jsonl'),
+        '--cache-size', '10', '--metrics', str(metrics),
+    ])
+    assert 'aaew_linggloss_glossings_total{category="substantive",outcome="glossed"} 2\n' \
+        in metrics.read_text()
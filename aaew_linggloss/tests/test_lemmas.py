@@ -0,0 +1,88 @@
+import json
+
+from .. import cli, computeLingGlossing, posSubposFromColumns
+from ..lemmas import LemmaRegistry
+from .test_engine import POS_SUBPOS
+
+
+def test_registry_reference():
+    registry = LemmaRegistry()
+    lemmas = {}
+    for i, pos_subpos in enumerate(POS_SUBPOS):
+        pos, sub_pos = (pos_subpos or {}).get('type'), (pos_subpos or {}).get('subtype')
+        lemmas[str(i)] = (pos, sub_pos)
+        registry.add(str(i), pos, sub_pos)
+    registry.add('10030', 'pronoun', 'personal_pronoun')
+    lemmas['10030'] = ('pronoun', 'personal_pronoun')
+    for lemmaID, (pos, sub_pos) in lemmas.items():
+        for flexcode in (0, 3, 10020, -10930, 30110, 70060, 71010, 99999, 'x'):
+            expected = computeLingGlossing(flexcode, lemmaID, posSubposFromColumns(pos, sub_pos))
+            assert registry.gloss(flexcode, lemmaID) == expected
+            assert registry.gloss_occurrence(flexcode, lemmaID, 'verb') == expected
+            assert registry.computeLingGlossing(flexcode, lemmaID, None) == expected
+
+
+def test_registry_unknown_lemmas():
+    registry = LemmaRegistry()
+    assert '10030' not in registry
+    assert registry.gloss(0, '10030') == '-1sg'
+    assert registry.gloss(3, '1') == computeLingGlossing(3, '1', None)
+    assert registry.gloss_occurrence(70060, '1', 'substantive', 'substantive_fem') == 'N.f:sg:stc'
+
+
+def test_registry_record():
+    record = LemmaRegistry().add('1', 'verb', 'verb_2-gem')
+    assert (record.stem, record.posGloss, record.override) == ('gem', 'V', None)
+
+
+def test_cli_lemmas(tmp_path):
+    lemmas = tmp_path / 'lemmas.tsv'
+    lemmas.write_text('lemmaID\ttype\tsubtype\n125581\tsubstantive\tsubstantive_masc\n')
+    infile = tmp_path / 'tokens.jsonl'
+    outfile = tmp_path / 'glossed.jsonl'
+    infile.write_text('{"flexcode": 70060, "lemmaID": "125581"}\n{"flexcode": 70060, "lemmaID": "2"}\n')
+    cli.main(['gloss', str(infile), '-o', str(outfile), '--lemmas', str(lemmas), '--cache-size', '5'])
+    assert outfile.read_text() == (
+        '{"flexcode": 70060, "lemmaID": "125581", "lingGloss": "N.m:sg:stc"}\n'
+        '{"flexcode": 70060, "lemmaID": "2", "lingGloss": "N:sg:stc"}\n'
+    )
+
+
+def test_cli_lemmas_cache_int_ids(tmp_path):
+    lemmas = tmp_path / 'lemmas.jsonl'
+    lemmas.write_text(
+        '{"lemmaID": 1, "type": "substantive", "subtype": "substantive_masc"}\n'
+        '{"lemmaID": 2, "type": "substantive", "subtype": "substantive_fem"}\n'
+    )
+    infile = tmp_path / 'tokens.jsonl'
+    infile.write_text('{"flexcode": 70060, "lemmaID": 1}\n{"flexcode": 70060, "lemmaID": 2}\n')
+    glossings = {}
+    for cache_size in ('0', '5'):
+        outfile = tmp_path / 'glossed{}.jsonl'.format(cache_size)
+        cli.main(['gloss', str(infile), '-o', str(outfile), '--lemmas', str(lemmas), '--cache-size', cache_size])
+        glossings[cache_size] = [json.loads(line)['lingGloss'] for line in outfile.read_text().splitlines()]
+    assert glossings['0'] == glossings['5'] == ['N.m:sg:stc', 'N.f:sg:stc']
+
+
+def test_registry_normalizes_lemma_ids():
+    registry = LemmaRegistry()
+    registry.add(1, 'substantive', 'substantive_masc')
+    registry.add('2', 'substantive', 'substantive_fem')
+    assert '1' in registry and 2 in registry
+    assert registry.get('1') is registry.get(1)
+    assert registry.gloss(70060, 2) == 'N.f:sg:stc'
+    assert registry.gloss_occurrence(70060, '1', 'verb') == 'N.m:sg:stc'
+    assert registry.computeLingGlossing(70060, 1, None) == 'N.m:sg:stc'
+    assert list(registry.lemmas) == ['1', '2']
+
+
+def test_registry_int_and_str_ids():
+    registry = LemmaRegistry()
+    registry.add(10031, 'pronoun', 'personal_pronoun')
+    for lemmaID in (10030, '10030', 10031, '10031'):
+        # registered or not, integer IDs gloss like their string form
+        expected = registry.gloss(70060, str(lemmaID))
+        assert registry.gloss(70060, lemmaID) == expected
+        assert registry.gloss_occurrence(70060, lemmaID, 'pronoun') == expected
+        assert registry.computeLingGlossing(70060, lemmaID, {'type': 'pronoun'}) == expected
+    assert registry.gloss(0, 10030) == '-1sg'
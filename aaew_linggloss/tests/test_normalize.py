@@ -0,0 +1,59 @@
+import pytest
+
+from .. import computeLingGlossing
+from ..normalize import FlexcodeNormalizer, classify
+
+
+VALUES = [
+    70060, -10930, '70060', ' 96423', '70060.0', 70060.0, float('nan'), float('inf'),
+    70.1, '70.1', '', '  ', 'x', 1e20, '1e20', 2 ** 70, '-99999999999999999999', None, True,
+    [70060],
+]
+CLASSES = [
+    'integer', 'integer', 'string', 'string', 'float_string', 'float', 'nan', 'infinite',
+    'fractional', 'fractional', 'empty', 'empty', 'malformed', 'out_of_range', 'out_of_range',
+    'out_of_range', 'out_of_range', 'missing', 'other', 'other',
+]
+
+
+def test_classify():
+    assert [classify(value)[1] for value in VALUES] == CLASSES
+
+
+def test_normalized_glossings_match_reference():
+    # where int() accepts the same inputs
+    for value in [70060, -10930, '70060', ' 96423', 70060.0, float('nan'), '', 'x']:
+        flexcode = FlexcodeNormalizer().normalize(value)
+        assert computeLingGlossing(
+            'x' if flexcode is None else flexcode, '1', {'type': 'verb'}
+        ) == computeLingGlossing(value, '1', {'type': 'verb'})
+
+
+def test_normalize_all():
+    normalizer = FlexcodeNormalizer()
+    flexcodes = normalizer.normalize_all(VALUES * 2)
+    assert flexcodes[:6] == [70060, -10930, 70060, 96423, 70060, 70060]
+    assert flexcodes[6:20] == [None] * 14
+    assert normalizer.counts['empty'] == 4
+    assert normalizer.counts['out_of_range'] == 8
+    assert sum(normalizer.rejected().values()) == 28
+
+
+def test_normalize_array():
+    np = pytest.importorskip('numpy')
+    from ..vectorized import compute_ling_glossings
+    for values in [
+        VALUES, np.array([1, [2]], dtype=object),
+        [70060.0, np.nan, 3.5, -np.inf, 10930.0, 1e20, -2.0 ** 63, 2.0 ** 63, -2.0 ** 62], [70060, 3],
+        np.array([70060, 2 ** 64 - 1], dtype=np.uint64), np.array([-2 ** 63, 3], dtype=np.int64),
+    ]:
+        arrays, lists = FlexcodeNormalizer(), FlexcodeNormalizer()
+        flexcodes = arrays.normalize_array(values)
+        assert [None if masked else int(value) for value, masked in zip(flexcodes.data, flexcodes.mask)] == (
+            lists.normalize_all(values)
+        )
+        assert arrays.counts == lists.counts
+        assert compute_ling_glossings(flexcodes, types=['verb'] * len(values)).tolist() == [
+            computeLingGlossing('x' if flexcode is None else flexcode, None, {'type': 'verb'})
+            for flexcode in lists.normalize_all(values)
+        ]
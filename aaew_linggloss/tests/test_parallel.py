@@ -0,0 +1,36 @@
+from .. import computeLingGlossings, records
+from .. import parallel
+from ..parallel import computeLingGlossingsParallel
+
+
+OCCURRENCES = [
+    (flexcode, lemmaID, 'verb', 'verb_3-inf')
+    for flexcode in range(10100, 10200)
+    for lemmaID in ('1', '10030')
+]
+
+
+def test_parallel_order():
+    assert list(computeLingGlossingsParallel(OCCURRENCES, workers=2, chunksize=7)) == computeLingGlossings(OCCURRENCES)
+
+
+def test_parallel_records():
+    recs = [
+        {'flexcode': f, 'lemmaID': l, 'type': t, 'subtype': s}
+        for f, l, t, s in OCCURRENCES
+    ]
+    assert [
+        r['lingGloss'] for r in records.gloss_records(recs, workers=2, chunksize=9)
+    ] == computeLingGlossings(OCCURRENCES)
+    assert [
+        r['lingGloss'] for r in records.gloss_records(recs, workers=2, chunksize=9, cache_size=5)
+    ] == computeLingGlossings(OCCURRENCES)
+
+
+def test_worker_cache():
+    try:
+        parallel._init_worker(cache_size=5)
+        assert parallel.gloss_occurrences(OCCURRENCES[:4] * 2) == computeLingGlossings(OCCURRENCES[:4] * 2)
+        assert parallel._CACHE.stats()['hits'] == 4
+    finally:
+        parallel._init_worker()
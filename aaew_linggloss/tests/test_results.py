@@ -0,0 +1,44 @@
+import pickle
+import random
+
+import pytest
+
+from .. import computeLingGlossing
+from ..diagnostics import DiagnosticsCollector
+from ..results import compute_ling_gloss, intern_gloss
+from .test_engine import POS_SUBPOS
+
+
+def test_results_match_reference():
+    rng = random.Random(0)
+    for _ in range(20000):
+        flexcode = rng.choice([rng.randrange(-200000, 200000), rng.randrange(10), 'x'])
+        lemmaID = rng.choice(['1', '10030', 'dm3623'])
+        pos_subpos = rng.choice(POS_SUBPOS)
+        gloss = compute_ling_gloss(flexcode, lemmaID, pos_subpos)
+        assert str(gloss) == computeLingGlossing(flexcode, lemmaID, pos_subpos)
+
+
+def test_results_are_interned():
+    pos_subpos = {'type': 'verb', 'subtype': 'verb_3-inf'}
+    gloss = compute_ling_gloss(10100, '1', pos_subpos)
+    assert gloss is compute_ling_gloss(-10100, '2', pos_subpos)
+    assert gloss is intern_gloss('suffix_conjugation', 'V~ipfv', '.act', '', 'inf')
+    assert pickle.loads(pickle.dumps(gloss)) is gloss
+    assert not hasattr(gloss, '__dict__')
+    with pytest.raises(AttributeError):
+        gloss.base = 'V'
+    with pytest.raises(AttributeError):
+        del gloss.form
+    assert str(gloss) == 'V~ipfv.act'
+    assert compute_ling_gloss(0, '10030', None).category == 'lemma'
+
+
+def test_results_diagnostics():
+    pos_subpos = {'type': 'adjective'}
+    collector = DiagnosticsCollector(max_records=None)
+    computeLingGlossing(70060, '1', pos_subpos, diagnostics=collector)
+    gloss = compute_ling_gloss(70060, '1', pos_subpos, diagnostics=True)
+    assert gloss.diagnostics == tuple(record.kind for record in collector)
+    assert gloss.diagnostics
+    assert compute_ling_gloss(70060, '1', pos_subpos).diagnostics == ()
@@ -0,0 +1,52 @@
+import random
+
+from .. import cli, computeLingGlossing, engine
+from ..reverse import ReverseIndex, get_index
+
+# part of speech producing each context shape
+SHAPE_POS_SUBPOS = [
+    {'type': 'verb'},
+    {'type': 'verb', 'subtype': 'verb_3-inf'},
+    {'type': 'verb', 'subtype': 'verb_2-gem'},
+    {'type': 'verb', 'subtype': 'verb_3-lit'},
+    {'type': 'substantive', 'subtype': 'substantive_masc'},
+    {'type': 'substantive', 'subtype': 'substantive_fem'},
+    {'type': 'adjective', 'subtype': 'nisbe_adjective_preposition'},
+    {'type': 'adjective', 'subtype': 'nisbe_adjective_substantive'},
+]
+
+
+def test_shape_pos_subpos():
+    assert [
+        engine.context(*engine.split_pos_subpos(pos_subpos)).shape
+        for pos_subpos in SHAPE_POS_SUBPOS
+    ] == list(range(len(engine.SHAPES)))
+
+
+def test_reverse_index_matches():
+    index = ReverseIndex(range(-100000, 100000, 7))
+    shapes = {
+        condition: shape for shape, condition in enumerate(
+            ['default', 'stem=inf', 'stem=gem', 'stem=strong', 'noun=N.m', 'noun=N.f',
+             'adjective=PREP-adjz', 'adjective=N-adjz']
+        )
+    }
+    rng = random.Random(0)
+    for gloss in index.glosses:
+        for match in rng.sample(index.exact(gloss), min(5, len(index.exact(gloss)))):
+            for shape in [shapes[c] for c in match.conditions] or range(len(shapes)):
+                assert computeLingGlossing(match.flexcode, '1', SHAPE_POS_SUBPOS[shape]) == gloss
+
+
+def test_reverse_index_lookups():
+    index = get_index()
+    assert index.exact('no such glossing') == []
+    prefixed = index.flexcodes('V\\tam.pass', 'prefix')
+    assert set(index.flexcodes('V\\tam.pass:stpr')) < set(prefixed)
+    assert set(prefixed) <= set(index.flexcodes('tam.pass', 'substring'))
+    assert all('.act-ant' in match.gloss for match in index.substring('.act-ant'))
+
+
+def test_cli_lookup(capsys):
+    cli.main(['lookup', '--prefix', 'V\\imp.du'])
+    assert capsys.readouterr().out.splitlines()[0].split('\t')[1] == 'V\\imp.du'
@@ -0,0 +1,39 @@
+from .. import computeLingGlossing, posSubposFromColumns
+from ..sentences import SentenceGlosser, gloss_document, gloss_sentence
+from .test_engine import POS_SUBPOS
+
+
+def test_gloss_sentence_tokens():
+    sentence = [
+        {'flexion': {'btsFlex': 70060}, 'lemma': {'id': '125581', 'POS': {'type': 'substantive', 'subtype': 'substantive_masc'}}},
+        {'flexion': {'btsFlex': 0}, 'lemma': {'id': '10030', 'POS': {'type': 'pronoun'}}},
+        {'flexion': {'btsFlex': ''}, 'lemma': {'id': '1', 'POS': {'type': 'verb'}}},
+    ]
+    glossing = gloss_sentence(sentence)
+    assert glossing.glosses == ['N.m:sg:stc', '-1sg', '(invalid code)']
+    assert glossing.line == 'N.m:sg:stc -1sg (invalid code)'
+
+
+def test_gloss_sentence_reference():
+    tokens = []
+    for pos_subpos in POS_SUBPOS:
+        pos, sub_pos = (pos_subpos or {}).get('type'), (pos_subpos or {}).get('subtype')
+        for flexcode in (0, 3, 9, 10020, -10930, 20010, 70060, 71010, 96423, 99999, 'x'):
+            for lemmaID in ('1', '10030', 'dm3623'):
+                tokens.append((flexcode, lemmaID, pos, sub_pos))
+    assert gloss_sentence(tokens).glosses == [
+        computeLingGlossing(flexcode, lemmaID, posSubposFromColumns(pos, sub_pos))
+        for flexcode, lemmaID, pos, sub_pos in tokens
+    ]
+
+
+def test_gloss_document_shares_lemmas():
+    glosser = SentenceGlosser()
+    sentences = [
+        [(70060, '1', 'substantive', None), (70110, '1', 'substantive', None)],
+        [(70060, '1', 'substantive', None), (10020, '2', 'verb', 'verb_3-lit')],
+    ]
+    glossings = [glosser.gloss_sentence(tokens) for tokens in sentences]
+    assert len(glosser.lemmas) == 2
+    assert glossings == gloss_document(sentences)
+    assert glossings[1].line == 'N:sg:stc V\\tam.act'
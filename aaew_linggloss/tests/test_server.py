@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+from .. import computeLingGlossing
+from ..server import GlossService, start_server
+
+
+async def _request(port: int, requests: list) -> list:
+    """ send requests over one keep-alive connection, returning status and JSON body
+    of each response.
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    responses = []
+    for method, path, payload in requests:
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        writer.write(
+            '{} {} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\n\r\n'.format(
+                method, path, len(body)
+            ).encode('latin-1') + body
+        )
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.lower()] = value.strip()
+        responses.append((status, json.loads(await reader.readexactly(int(headers['content-length'])))))
+    writer.close()
+    return responses
+
+
+def _serve(service: GlossService, requests: list) -> list:
+    async def main():
+        server = await start_server('127.0.0.1', 0, service)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            return await _request(port, requests)
+
+    return asyncio.run(main())
+
+
+def test_server_gloss():
+    service = GlossService(cache_size=10)
+    occurrences = [
+        [70060, '1', 'substantive', 'substantive_masc'],
+        {'flexcode': '10020', 'lemmaID': '1', 'type': 'verb'},
+        [0, '10030'],
+        ['x', '1', 'verb', None],
+    ]
+    responses = _serve(service, [
+        ('POST', '/gloss', {'occurrences': occurrences}),
+        ('POST', '/gloss', {'occurrences': occurrences[:1]}),
+        ('GET', '/stats', None),
+    ])
+    assert responses[0] == (200, {'glosses': [
+        computeLingGlossing(70060, '1', {'type': 'substantive', 'subtype': 'substantive_masc'}),
+        computeLingGlossing('10020', '1', {'type': 'verb'}),
+        '-1sg',
+        '(invalid code)',
+    ]})
+    status, stats = responses[2]
+    assert stats['requests'] == 3
+    assert stats['occurrences'] == 5
+    assert stats['cache']['hits'] == 1
+    assert 0 < stats['latency_p50'] <= stats['latency_p99']
+
+
+def test_server_errors():
+    responses = _serve(GlossService(), [
+        ('POST', '/gloss', {'tokens': []}),
+        ('POST', '/gloss', {'occurrences': [[{}, '1']]}),
+        ('GET', '/gloss', None),
+        ('GET', '/nothing', None),
+        ('GET', '/stats', None),
+    ])
+    assert [status for status, _ in responses] == [400, 400, 405, 404, 200]
+    assert responses[-1][1]['errors'] == 4
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from .. import cli, engine, parallel, snapshot, table, vocabulary
+from ..cache import GlossCache
+
+
+@pytest.fixture
+def restore_state():
+    state = table._TABLE, vocabulary._VOCABULARY
+    yield
+    table._TABLE, vocabulary._VOCABULARY = state
+
+
+def test_snapshot_roundtrip(tmp_path, restore_state):
+    path = str(tmp_path / 'state.snapshot')
+    cache = GlossCache(10)
+    cache.gloss(10100, '1', 'verb', 'verb_3-inf')
+    cache.gloss(70060, '1', 'substantive', 'substantive_fem')
+    gloss_table = table.get_table()
+    snapshot.save(path, cache)
+    restored = snapshot.restore(path)
+    assert restored.items() == cache.items()
+    assert restored.maxsize == 10
+    assert table.get_table() is not gloss_table
+    assert list(table.get_table().ids) == list(gloss_table.ids)
+    assert table.get_table().vocabulary == gloss_table.vocabulary
+    assert ('verb', 'verb_3-inf') in engine._CONTEXTS
+    # snapshots of restored state are identical
+    snapshot.save(str(tmp_path / 'again.snapshot'), restored)
+    assert (tmp_path / 'again.snapshot').read_bytes() == (tmp_path / 'state.snapshot').read_bytes()
+    assert table.compute_ling_glossing(-10930, '1', {'type': 'verb', 'subtype': 'verb_3-lit'}) == 'V~post.pass'
+
+
+def test_snapshot_rejects_mismatch(tmp_path, restore_state):
+    path = tmp_path / 'state.snapshot'
+    snapshot.save(str(path))
+    assert snapshot.restore(str(path)) is None
+    data = path.read_bytes()
+    path.write_bytes(data.replace(snapshot.source_digest().encode('ascii'), b'0' * 32))
+    with pytest.raises(ValueError):
+        snapshot.restore(str(path))
+    path.write_bytes(b'not a snapshot')
+    with pytest.raises(ValueError):
+        snapshot.restore(str(path))
+
+
+def test_cli_snapshot(tmp_path, restore_state):
+    infile = tmp_path / 'tokens.jsonl'
+    infile.write_text(''.join(
+        json.dumps({'flexcode': flexcode, 'lemmaID': '1', 'type': 'verb', 'subtype': 'verb_3-inf'}) + '\n'
+        for flexcode in range(10000, 10100)
+    ))
+    path = str(tmp_path / 'state.snapshot')
+    plain, warm, parallel = (tmp_path / name for name in ('plain.jsonl', 'warm.jsonl', 'parallel.jsonl'))
+    cli.main(['snapshot', path, '--warm', str(infile), '--cache-size', '50'])
+    cli.main(['gloss', str(infile), '-o', str(plain)])
+    cli.main(['gloss', str(infile), '-o', str(warm), '--snapshot', path])
+    cli.main(['gloss', str(infile), '-o', str(parallel), '-w', '2', '--snapshot', path])
+    assert plain.read_text() == warm.read_text() == parallel.read_text()
+    assert len(snapshot.restore(path)) == 50
+
+
+def test_worker_cache(tmp_path, restore_state):
+    path = str(tmp_path / 'state.snapshot')
+    cache = GlossCache(10)
+    cache.gloss(10100, '1', 'verb', 'verb_3-inf')
+    snapshot.save(path, cache)
+    try:
+        parallel._init_worker(path)
+        assert parallel.gloss_occurrences([(10100, '1', 'verb', 'verb_3-inf')] * 2) == ['V~ipfv.act'] * 2
+        assert parallel.gloss_jsonl_lines(['{"flexcode": 10100, "lemmaID": "1", "type": "verb"}'])
+        assert parallel._CACHE.stats()['hits'] == 2
+    finally:
+        parallel._init_worker()
+    assert parallel._CACHE is None
+
+
+def test_cli_snapshot_lemmas(tmp_path, restore_state):
+    path = str(tmp_path / 'state.snapshot')
+    snapshot.save(path)
+    lemmas = tmp_path / 'lemmas.tsv'
+    lemmas.write_text('lemmaID\ttype\tsubtype\n1\tverb\tverb_3-inf\n')
+    with pytest.raises(SystemExit):
+        cli.main(['gloss', '-', '--snapshot', path, '--lemmas', str(lemmas)])
+
+
+def test_cli_snapshot_workers_restore(tmp_path, restore_state, monkeypatch):
+    path = str(tmp_path / 'state.snapshot')
+    snapshot.save(path)
+    infile = tmp_path / 'tokens.jsonl'
+    infile.write_text('{"flexcode": 70060, "lemmaID": "1", "type": "substantive"}\n')
+    restored = []
+    restore = snapshot.restore
+    monkeypatch.setattr(snapshot, 'restore', lambda path: restored.append(path) or restore(path))
+    cli.main(['gloss', str(infile), '-o', str(tmp_path / 'parallel.jsonl'), '-w', '2', '--snapshot', path])
+    assert restored == []
+    cli.main(['gloss', str(infile), '-o', str(tmp_path / 'serial.jsonl'), '--snapshot', path])
+    assert restored == [path]
@@ -0,0 +1,60 @@
+import json
+
+from .. import cli
+from ..stats import CorpusStatistics, count_chunk
+
+
+RECORDS = [
+    {'flexcode': 70060, 'lemmaID': '1', 'type': 'substantive', 'period': 'MK'},
+    {'flexcode': 10930, 'lemmaID': '1', 'type': 'verb', 'period': 'MK'},
+    {'flexcode': 0, 'lemmaID': '1', 'type': 'verb', 'period': 'NK'},
+    {'flexcode': 99999, 'lemmaID': '1', 'type': None, 'period': 'NK'},
+    {'flexcode': 'x', 'lemmaID': '10030', 'type': 'pronoun'},
+]
+
+
+def test_statistics_merge():
+    whole = count_chunk(RECORDS, group_field='period', diagnostics=True)
+    merged = CorpusStatistics(group_field='period', diagnostics=True)
+    merged.merge(count_chunk(RECORDS[:2], group_field='period', diagnostics=True))
+    merged.merge(count_chunk(RECORDS[2:], group_field='period', diagnostics=True))
+    assert merged.to_dict() == whole.to_dict()
+    assert whole.occurrences == 5
+    assert whole.categories[('MK', 'substantive')] == 1
+    assert whole.categories[('', 'lemma')] == 1
+    assert whole.outcomes == {'glossed': 2, 'unedited': 1, 'unresolved': 1, 'lemma': 1}
+    assert whole.shares()['(unresolved)'] == 0.2
+    assert whole.outcome_shares()['unedited'] == whole.shares()['V(infl. unedited)'] == 0.2
+    assert whole.diagnostics.total() > 0
+
+
+def test_statistics_glossed():
+    statistics = count_chunk([{'flexcode': 70060, 'lingGloss': 'N:sg:stc?'}], glossed=True)
+    assert list(statistics.glosses) == [('', 'N:sg:stc?')]
+
+
+def test_statistics_glossed_missing_gloss():
+    statistics = count_chunk([{'flexcode': 0, 'lemmaID': '1', 'type': 'verb'}], glossed=True)
+    assert statistics.outcomes == {'missing': 1}
+    assert statistics.glosses == {('verb', ''): 1}
+
+
+def test_cli_stats(tmp_path):
+    infile = tmp_path / 'tokens.jsonl'
+    infile.write_text(''.join(json.dumps(record) + '\n' for record in RECORDS * 20))
+    serial, parallel = tmp_path / 'serial.json', tmp_path / 'parallel.json'
+    cli.main(['stats', str(infile), '-o', str(serial), '--group-field', 'period', '--diagnostics'])
+    cli.main([
+        'stats', str(infile), '-o', str(parallel), '--group-field', 'period', '--diagnostics',
+        '-w', '2', '--chunk-size', '7',
+    ])
+    result = json.loads(serial.read_text())
+    assert result == json.loads(parallel.read_text())
+    assert result['occurrences'] == 100
+    assert result['outcomes']['unresolved'] == 20
+    assert result['outcome_shares']['unedited'] == 0.2
+    csvfile = tmp_path / 'stats.csv'
+    cli.main(['stats', str(infile), '-o', str(csvfile)])
+    lines = csvfile.read_text().splitlines()
+    assert lines[0] == 'counter,group,value,count'
+    assert 'outcome,,unresolved,20' in lines
@@ -0,0 +1,67 @@
+import zlib
+
+import pytest
+
+from .. import (
+    computeLingGlossing,
+    engine,
+    table,
+)
+from ..mapping import load_resource
+from .test_engine import POS_SUBPOS
+
+
+def test_table_resource_up_to_date():
+    shipped = table.GlossTable.from_bytes(load_resource(table.FILENAME))
+    built = table.GlossTable.build()
+    assert shipped.vocabulary == built.vocabulary
+    assert shipped.ids == built.ids
+
+
+STALE_HEADER = b'{"shapes": 1, "size": 100000, "vocabulary": [null]}'
+
+
+@pytest.mark.parametrize('data', [
+    b'corrupt', zlib.compress(table._HEADER.pack(len(STALE_HEADER)) + STALE_HEADER),
+])
+def test_table_fallback_warns(monkeypatch, data):
+    monkeypatch.setattr(table, '_TABLE', None)
+    monkeypatch.setattr(table, 'load_resource', lambda filename: data)
+    with pytest.warns(RuntimeWarning, match=table.FILENAME):
+        built = table.get_table()
+    assert built.ids == table.GlossTable.build().ids
+
+
+def test_table_other_rules(monkeypatch):
+    data = load_resource(table.FILENAME)
+    monkeypatch.setattr(table, 'rules_digest', lambda: 'other rules')
+    with pytest.raises(ValueError):
+        table.GlossTable.from_bytes(data)
+    monkeypatch.setattr(table, '_TABLE', None)
+    with pytest.warns(RuntimeWarning, match='other glossing rules'):
+        table.get_table()
+
+
+def test_table_roundtrip():
+    t = table.get_table()
+    u = table.GlossTable.from_bytes(t.to_bytes())
+    assert u.vocabulary == t.vocabulary
+    assert u.ids == t.ids
+
+
+@pytest.mark.parametrize('pos_subpos', POS_SUBPOS)
+def test_table_flexcode_space(pos_subpos):
+    mismatches = [
+        flexcode for flexcode in list(range(100000)) + [-9, 100005, 173000, 'x']
+        if table.compute_ling_glossing(flexcode, '1', pos_subpos)
+        != engine.compute_ling_glossing(flexcode, '1', pos_subpos)
+    ]
+    assert mismatches == []
+
+
+def test_table_glossing():
+    assert table.compute_ling_glossing(
+        70060, '125581', {'type': 'substantive', 'subtype': 'substantive_masc'}
+    ) == computeLingGlossing(
+        70060, '125581', {'type': 'substantive', 'subtype': 'substantive_masc'}
+    )
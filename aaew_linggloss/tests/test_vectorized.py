@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from .. import (
+    computeLingGlossing,
+    posSubposFromColumns,
+)
+from ..vectorized import compute_ling_glossings
+
+
+def test_vectorized_matches_reference():
+    rng = random.Random(0)
+    flexcodes = [rng.choice([rng.randrange(-200000, 200000), rng.randrange(10)]) for _ in range(20000)]
+    lemmaIDs = [rng.choice(['1', '10030', 'dm3623', '125581']) for _ in flexcodes]
+    types = [rng.choice(['verb', 'substantive', 'adjective', None, 'pronoun']) for _ in flexcodes]
+    subtypes = [rng.choice(['verb_3-inf', 'verb_2-lit', 'substantive_fem', 'nisbe_adjective_substantive', None, 'title']) for _ in flexcodes]
+    assert compute_ling_glossings(
+        np.array(flexcodes), lemmaIDs, types, subtypes
+    ).tolist() == [
+        computeLingGlossing(f, l, posSubposFromColumns(t, s))
+        for f, l, t, s in zip(flexcodes, lemmaIDs, types, subtypes)
+    ]
+
+
+def test_vectorized_large_flexcodes():
+    for flexcodes in [
+        ['99999999999999999999999', '-100000000000000070060', 70060, 'x'],
+        [1e20, -1.2345e25, 70060.0],
+        np.array([2 ** 64 - 1, 2 ** 63, 70060], dtype=np.uint64),
+        np.array([-2 ** 63, 2 ** 63 - 1], dtype=np.int64),
+    ]:
+        types = ['verb'] * len(flexcodes)
+        assert compute_ling_glossings(flexcodes, ['1'] * len(flexcodes), types).tolist() == [
+            computeLingGlossing(int(f) if isinstance(f, np.integer) else f, '1', {'type': 'verb'})
+            for f in flexcodes
+        ]
+
+
+def test_vectorized_flexcode_types():
+    flexcodes = [70060.0, float('nan'), '10930', 'x', '', -3]
+    assert compute_ling_glossings(flexcodes[:2], types=['verb'] * 2).tolist() == [
+        computeLingGlossing(f, None, {'type': 'verb'}) for f in flexcodes[:2]
+    ]
+    assert compute_ling_glossings(flexcodes[2:], types=['verb'] * 4).tolist() == [
+        computeLingGlossing(f, None, {'type': 'verb'}) for f in flexcodes[2:]
+    ]
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from .. import computeLingGlossing, posSubposFromColumns
+from ..vocabulary import GlossVocabulary, get_vocabulary
+from .test_engine import POS_SUBPOS
+
+
+def test_gloss_ids_match_reference():
+    vocabulary = get_vocabulary()
+    size = len(vocabulary)
+    rng = random.Random(0)
+    for _ in range(20000):
+        flexcode = rng.choice([rng.randrange(-200000, 200000), rng.randrange(10), 'x'])
+        lemmaID = rng.choice(['1', '10030', 'dm3623'])
+        pos_subpos = rng.choice(POS_SUBPOS)
+        assert vocabulary.decode(vocabulary.gloss_id(flexcode, lemmaID, pos_subpos)) == computeLingGlossing(
+            flexcode, lemmaID, pos_subpos
+        )
+    # all glossings of known parts of speech are numbered in advance
+    assert len(vocabulary) == size
+
+
+def test_vocabulary_is_stable(tmp_path):
+    vocabulary = GlossVocabulary.build()
+    assert vocabulary.glossings == GlossVocabulary.build().glossings
+    assert vocabulary.decode(0) is None
+    vocabulary.save(str(tmp_path / 'vocabulary.json'))
+    assert GlossVocabulary.load(str(tmp_path / 'vocabulary.json')).glossings == vocabulary.glossings
+    new_id = vocabulary.encode('N.x:new')
+    assert new_id == len(vocabulary) - 1
+    assert vocabulary.encode('N.x:new') == new_id
+
+
+def test_vectorized_gloss_ids():
+    np = pytest.importorskip('numpy')
+    vocabulary = get_vocabulary()
+    flexcodes = [70060, 3, 'x', 10930, 0]
+    types = ['substantive', 'verb', 'verb', None, 'unknown_pos']
+    ids = vocabulary.gloss_ids(flexcodes, ['1'] * 5, types)
+    assert ids.dtype == np.int32
+    assert vocabulary.decode_all(ids).tolist() == [
+        computeLingGlossing(f, '1', posSubposFromColumns(t, None)) for f, t in zip(flexcodes, types)
+    ]
+    assert ids.tolist() == [
+        vocabulary.gloss_id(f, '1', posSubposFromColumns(t, None)) for f, t in zip(flexcodes, types)
+    ]
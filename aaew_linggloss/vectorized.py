@@ -0,0 +1,188 @@
+""" Vectorized glossing of whole flexcode columns with NumPy.
+
+Requires the ``numpy`` extra (``pip install aaew-linggloss[numpy]``).
+
+Flexcodes are reduced to their negation-stripped form with array arithmetic and
+glossed by gathering from the precomputed :class:`aaew_linggloss.table.GlossTable`;
+lemma IDs, types and subtypes are factorized, so that lemma ID based glossings and part
+of speech contexts are resolved once per distinct value. Results are the same as
+those of :func:`aaew_linggloss.computeLingGlossing`.
+"""
+import numpy as np
+
+from . import engine
+from .mapping import lingGlossFromLemmaIDDict
+from .normalize import INT64_MAX
+from .table import FLEX_RANGE, get_table
+
+
+def _asarray(values) -> np.ndarray:
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        # ragged nested sequences among the values
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+        return array
+    if array.dtype.kind in 'US' and not isinstance(values, np.ndarray):
+        # keep numpy from turning mixed types into strings
+        array = np.asarray(values, dtype=object)
+    return array
+
+
+def _factorize(values) -> tuple:
+    """ return distinct values and an index array mapping each value to them.
+    """
+    values = _asarray(values)
+    if values.dtype != object:
+        uniques, codes = np.unique(values, return_inverse=True)
+        return uniques.tolist(), codes.reshape(-1)
+    # hashing beats sorting python objects
+    index = {}
+    codes = np.fromiter(
+        (index.setdefault(value, len(index)) for value in values.tolist()),
+        dtype=np.intp, count=len(values),
+    )
+    return list(index), codes
+
+
+def _factorize_codes(codes) -> tuple:
+    """ factorize an array of small non-negative integers.
+    """
+    uniques = np.flatnonzero(np.bincount(codes))
+    remap = np.zeros(uniques[-1] + 1 if len(uniques) else 1, dtype=np.intp)
+    remap[uniques] = np.arange(len(uniques))
+    return uniques.tolist(), remap[codes]
+
+
+def _parse_flexcodes(flexcodes) -> tuple:
+    """ convert flexcodes to integers the same way ``int()`` does. Flexcodes whose
+    absolute value exceeds int64 are reduced to one that glosses the same, since
+    glossing only depends on the last five digits of flexcodes above 9.
+
+    :returns: int64 array of flexcodes and boolean mask of invalid ones
+    """
+    if isinstance(flexcodes, np.ma.MaskedArray):
+        # normalized by :meth:`aaew_linggloss.normalize.FlexcodeNormalizer.normalize_array`
+        return flexcodes.filled(0).astype(np.int64), np.ma.getmaskarray(flexcodes)
+    flexcodes = _asarray(flexcodes)
+    if np.issubdtype(flexcodes.dtype, np.integer):
+        if flexcodes.dtype == np.uint64:
+            flexcodes = np.where(flexcodes > INT64_MAX, flexcodes % FLEX_RANGE + FLEX_RANGE, flexcodes)
+        elif flexcodes.dtype == np.int64:
+            flexcodes = np.where(flexcodes < -INT64_MAX, 2 ** 63 % FLEX_RANGE + FLEX_RANGE, flexcodes)
+        return flexcodes.astype(np.int64), np.zeros(len(flexcodes), dtype=bool)
+    if np.issubdtype(flexcodes.dtype, np.floating):
+        invalid = np.isnan(flexcodes)
+        if np.isinf(flexcodes).any():
+            raise OverflowError('cannot convert float infinity to integer')
+        flexcodes = np.trunc(np.where(invalid, 0, flexcodes))
+        # floats are exact integers at this size, and so is fmod
+        flexcodes = np.where(
+            np.abs(flexcodes) >= 2.0 ** 63, np.fmod(np.abs(flexcodes), FLEX_RANGE) + FLEX_RANGE, flexcodes
+        )
+        return flexcodes.astype(np.int64), invalid
+    uniques, codes = _factorize(flexcodes)
+    parsed = np.zeros(len(uniques), dtype=np.int64)
+    invalid = np.zeros(len(uniques), dtype=bool)
+    for i, flexcode in enumerate(uniques):
+        try:
+            flexcode = int(flexcode)
+        except ValueError:
+            invalid[i] = True
+            continue
+        if not -INT64_MAX <= flexcode <= INT64_MAX:
+            flexcode = abs(flexcode) % FLEX_RANGE + FLEX_RANGE
+        parsed[i] = flexcode
+    return parsed[codes], invalid[codes]
+
+
+def _factorize_optional(values, size: int) -> tuple:
+    if values is None:
+        return [None], np.zeros(size, dtype=np.intp)
+    return _factorize(values)
+
+
+def compute_ling_glossing_ids(flexcodes, lemmaIDs=None, types=None, subtypes=None) -> tuple:
+    """ gloss arrays of lemma occurrences, returning glossings as indices into
+    a vocabulary.
+
+    >>> ids, vocabulary = compute_ling_glossing_ids([70060, 70060, 0], types=['substantive'] * 3)
+    >>> [vocabulary[i] for i in ids]
+    ['N:sg:stc', 'N:sg:stc', 'N(infl. unedited)']
+
+    :param flexcodes: array of BTS flexcodes, or masked array of normalized flexcodes
+        with invalid ones masked
+    :param lemmaIDs: array of BTS lemma IDs (optional)
+    :param types: array of BTS part of speech types (optional)
+    :param subtypes: array of BTS part of speech subtypes (optional)
+    :returns: tuple of an int32 array of vocabulary indices and the vocabulary list
+    """
+    table = get_table()
+    flexcodes, invalid = _parse_flexcodes(flexcodes)
+    size = len(flexcodes)
+    absolute = np.abs(flexcodes)
+    flex = absolute % FLEX_RANGE # Negationsstelle x00000 abschneiden
+    status = absolute <= 9
+
+    types, type_codes = _factorize_optional(types, size)
+    subtypes, subtype_codes = _factorize_optional(subtypes, size)
+    contexts, context_codes = _factorize_codes(
+        type_codes * len(subtypes) + subtype_codes
+    )
+    contexts = [
+        engine.context(types[code // len(subtypes)], subtypes[code % len(subtypes)])
+        for code in contexts
+    ]
+
+    vocabulary = list(table.vocabulary)
+    index = {glossing: i for i, glossing in enumerate(vocabulary)}
+
+    def _id(glossing: str) -> int:
+        if glossing not in index:
+            index[glossing] = len(vocabulary)
+            vocabulary.append(glossing)
+        return index[glossing]
+
+    shapes = np.array([ctx.shape for ctx in contexts], dtype=np.int64)
+    ids = np.frombuffer(table.ids, dtype=np.uint16)[
+        shapes[context_codes] * FLEX_RANGE + flex
+    ].astype(np.int32)
+
+    unresolved = np.array(
+        [_id(ctx.posGloss or '(unresolved)') for ctx in contexts], dtype=np.int32
+    )
+    ids = np.where(ids == 0, unresolved[context_codes], ids)
+
+    statuses = np.array([
+        [_id(''.join(engine.analyze(code, ctx)[1:])) for code in range(10)]
+        for ctx in contexts
+    ], dtype=np.int32).reshape(len(contexts), 10)
+    ids = np.where(
+        status, statuses[context_codes, np.where(status, absolute, 0)], ids
+    )
+    ids[invalid] = _id('(invalid code)')
+
+    if lemmaIDs is not None:
+        lemmas, lemma_codes = _factorize(lemmaIDs)
+        overrides = np.array([
+            _id(lingGlossFromLemmaIDDict[lemma])
+            if lingGlossFromLemmaIDDict.get(lemma) else -1
+            for lemma in lemmas
+        ], dtype=np.int32)
+        overridden = overrides[lemma_codes]
+        ids = np.where(overridden >= 0, overridden, ids)
+
+    return ids, vocabulary
+
+
+def compute_ling_glossings(flexcodes, lemmaIDs=None, types=None, subtypes=None) -> np.ndarray:
+    """ gloss arrays of lemma occurrences.
+
+    >>> compute_ling_glossings([-10930, 96423], types=['verb', 'verb'], subtypes=['verb_3-lit', None])
+    array(['V~post.pass', 'AUX:stpr'], dtype=object)
+
+    :returns: object array of glossings
+    """
+    ids, vocabulary = compute_ling_glossing_ids(flexcodes, lemmaIDs, types, subtypes)
+    return np.array(vocabulary, dtype=object)[ids]
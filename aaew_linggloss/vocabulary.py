@@ -0,0 +1,185 @@
+""" Interned glossing vocabulary with integer glossing IDs.
+
+There are only a few hundred distinct glossings. A :class:`GlossVocabulary` numbers
+them, so that glossed corpora can be held as integer columns and glossings are only
+turned into strings where needed:
+
+>>> vocabulary = get_vocabulary()
+>>> gloss_id = vocabulary.gloss_id(70060, '125581', {'type': 'substantive', 'subtype': 'substantive_masc'})
+>>> vocabulary.decode(gloss_id)
+'N.m:sg:stc'
+>>> vocabulary.encode('N.m:sg:stc') == gloss_id
+True
+
+IDs are stable for a given version of this package: they start with the glossings of
+the rule space, numbered as in :class:`aaew_linggloss.table.GlossTable`, followed by
+all glossings derived from parts of speech and lemma IDs in sorted order. ID ``0`` is
+reserved and decodes to ``None``. Glossings not known in advance are numbered on
+first use by :meth:`GlossVocabulary.encode`.
+"""
+import json
+
+from . import engine
+from .mapping import (
+    lingGlossFromLemmaIDDict,
+    dictPOSGlossings,
+    dictSubPOSGlossings,
+    dictPOSGlossingsDefault,
+    dictSubPOSGlossingsDefault,
+)
+from .table import FLEX_RANGE, get_table
+
+
+def _derived_glossings() -> set:
+    """ glossings of status codes, unresolved and invalid flexcodes and lemma IDs.
+    """
+    glossings = {'(invalid code)'}
+    for posGloss in {''} | set(dictPOSGlossings.values()) | set(dictSubPOSGlossings.values()):
+        ctx = engine.Context(engine.STEM_NONE, 'N', 'ADJ', posGloss, '', 0)
+        glossings.update(''.join(engine.analyze(code, ctx)[1:]) for code in range(10))
+        glossings.add(posGloss or '(unresolved)')
+    for defaultGloss in set(dictPOSGlossingsDefault.values()) | set(dictSubPOSGlossingsDefault.values()):
+        ctx = engine.Context(engine.STEM_NONE, 'N', 'ADJ', '', defaultGloss, 0)
+        glossings.add(''.join(engine.analyze(3, ctx)[1:]))
+    glossings.update(glossing for glossing in lingGlossFromLemmaIDDict.values() if glossing)
+    return glossings
+
+
+class GlossVocabulary:
+    """ bidirectional mapping between glossings and integer IDs.
+
+    :param glossings: glossings in order of their IDs, starting with ``None`` for ID
+        ``0``; the first ones must be those of the gloss table
+    """
+
+    def __init__(self, glossings: list):
+        self.glossings = list(glossings)
+        self.ids = {glossing: i for i, glossing in enumerate(self.glossings)}
+        table = get_table()
+        if self.glossings[:len(table.vocabulary)] != table.vocabulary:
+            raise ValueError('vocabulary does not start with the gloss table vocabulary')
+        self._table_ids = table.ids
+        self._table_size = len(table.vocabulary)
+        self._lemma_ids = {
+            lemmaID: self.encode(glossing)
+            for lemmaID, glossing in lingGlossFromLemmaIDDict.items() if glossing
+        }
+        self._invalid_id = self.encode('(invalid code)')
+        self._contexts = {}
+        self._decoder = None
+
+    @classmethod
+    def build(cls) -> 'GlossVocabulary':
+        """ number the glossings of the gloss table and all derived glossings.
+        """
+        table_vocabulary = get_table().vocabulary
+        known = set(table_vocabulary)
+        return cls(table_vocabulary + sorted(_derived_glossings() - known))
+
+    @classmethod
+    def load(cls, path: str) -> 'GlossVocabulary':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def save(self, path: str):
+        """ write the glossings in order of their IDs as a JSON list, e.g. to decode
+        ID columns elsewhere.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.glossings, f, ensure_ascii=False)
+
+    def encode(self, glossing: str) -> int:
+        """ return the ID of a glossing, numbering it if it is new.
+        """
+        gloss_id = self.ids.get(glossing)
+        if gloss_id is None:
+            gloss_id = self.ids[glossing] = len(self.glossings)
+            self.glossings.append(glossing)
+            self._decoder = None
+        return gloss_id
+
+    def decode(self, gloss_id: int) -> str:
+        return self.glossings[gloss_id]
+
+    def decode_all(self, gloss_ids):
+        """ decode a sequence of IDs into a list of glossings, or a NumPy array of IDs
+        into an object array.
+
+        >>> get_vocabulary().decode_all([1, 2])
+        ['V\\\\tam', 'V\\\\tam:stpr']
+        """
+        if hasattr(gloss_ids, 'dtype'):
+            if self._decoder is None:
+                import numpy as np
+                self._decoder = np.array(self.glossings, dtype=object)
+            return self._decoder[gloss_ids]
+        return list(map(self.glossings.__getitem__, gloss_ids))
+
+    def _context_ids(self, ctx: engine.Context) -> tuple:
+        """ IDs of the status code glossings and of the unresolved glossing within a
+        part of speech context.
+        """
+        ids = self._contexts.get(ctx)
+        if ids is None:
+            ids = self._contexts[ctx] = (
+                tuple(self.encode(''.join(engine.analyze(code, ctx)[1:])) for code in range(10)),
+                self.encode(ctx.posGloss or '(unresolved)'),
+            )
+        return ids
+
+    def glossing_id(self, flexcode, ctx: engine.Context) -> int:
+        """ return the glossing ID of a flexcode within a part of speech context,
+        without lemma ID based glossing.
+        """
+        try:
+            flexcode = int(flexcode)
+        except ValueError:
+            return self._invalid_id
+        if flexcode < 0:
+            flexcode = -flexcode
+        if flexcode <= 9:
+            return self._context_ids(ctx)[0][flexcode]
+        return (
+            self._table_ids[ctx.shape * FLEX_RANGE + flexcode % FLEX_RANGE]
+            or self._context_ids(ctx)[1]
+        )
+
+    def gloss_id(self, flexcode, lemmaID: str, pos_subpos: dict) -> int:
+        """ Same signature as :func:`aaew_linggloss.computeLingGlossing`, returning the
+        ID of the glossing.
+        """
+        gloss_id = self._lemma_ids.get(lemmaID)
+        if gloss_id:
+            return gloss_id
+        return self.glossing_id(flexcode, engine.context(*engine.split_pos_subpos(pos_subpos)))
+
+    def gloss_ids(self, flexcodes, lemmaIDs=None, types=None, subtypes=None):
+        """ gloss arrays of lemma occurrences into an int32 array of IDs, see
+        :func:`aaew_linggloss.vectorized.compute_ling_glossing_ids`. Requires NumPy.
+        """
+        import numpy as np
+        from .vectorized import compute_ling_glossing_ids
+        ids, glossings = compute_ling_glossing_ids(flexcodes, lemmaIDs, types, subtypes)
+        # vectorized IDs agree with ours on the gloss table vocabulary
+        remap = np.arange(len(glossings), dtype=np.int32)
+        for i in range(self._table_size, len(glossings)):
+            remap[i] = self.encode(glossings[i])
+        return remap[ids]
+
+    def __len__(self):
+        return len(self.glossings)
+
+    def __contains__(self, glossing):
+        return glossing in self.ids
+
+
+_VOCABULARY = None
+
+
+def get_vocabulary() -> GlossVocabulary:
+    """ return a shared vocabulary, building it on first use.
+    """
+    global _VOCABULARY
+    if _VOCABULARY is None:
+        _VOCABULARY = GlossVocabulary.build()
+    return _VOCABULARY
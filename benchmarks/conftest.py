@@ -0,0 +1,114 @@
+""" Performance benchmarks, run with ``pytest-benchmark`` from the repository root.
+
+Comparing against the stored baseline, failing on a mean slowdown of more than 25%
+or peak memory growth of more than 25%::
+
+    python -m pytest benchmarks --benchmark-storage=benchmarks/baselines \\
+        --benchmark-compare=0001 --benchmark-compare-fail=mean:25%
+
+Timing baselines are stored per machine type in ``baselines/<machine>/``; record one
+for a new machine or release with ``--benchmark-save=<name>``. Peak memory
+baselines live in ``baselines/memory.json`` and are rewritten with
+``--update-memory-baseline``.
+"""
+import importlib.util
+import json
+import os
+import random
+
+import pytest
+
+from aaew_linggloss.mapping import lingGlossFromLemmaIDDict
+
+
+collect_ignore_glob = []
+if importlib.util.find_spec('pytest_benchmark') is None:
+    collect_ignore_glob.append('test_*.py')
+
+
+MEMORY_BASELINE = os.path.join(os.path.dirname(__file__), 'baselines', 'memory.json')
+MEMORY_TOLERANCE = 1.25
+
+# (weight, flexcodes, type, subtypes) of a rough approximation of the TLA corpus
+CORPUS_MIX = [
+    (30, [70000, 70010, 70020, 70060, 70110, 70160, 70300, 70360], 'substantive',
+        ['substantive_masc', 'substantive_fem', None]),
+    (15, [10020, 10030, 10040, 10110, 10930, 11020, 12020, 83020], 'verb',
+        ['verb_3-lit', 'verb_2-lit', 'verb_3-inf', 'verb_2-gem', 'verb_irr']),
+    (6, [20010, 20030, 20060], 'verb', ['verb_3-lit', 'verb_3-inf']),
+    (6, [30010, 30110, 31020, 32030], 'verb', ['verb_3-lit', 'verb_3-inf', 'verb_2-gem']),
+    (3, [40010, 40110, 41020], 'verb', ['verb_3-lit', 'verb_3-gem']),
+    (3, [50010, 50020], 'verb', ['verb_3-lit', 'verb_irr']),
+    (4, [61010, 62010, 64000, 65000], 'verb', ['verb_3-lit', 'verb_3-inf']),
+    (6, [71000, 71010, 71060, 71210], 'adjective', [None]),
+    (8, [93000, 93010, 0], 'preposition', [None]),
+    (6, [94000, 0], 'particle', [None, 'particle_enclitic']),
+    (3, [96423, 96433], 'verb', ['verb_irr']),
+    (2, [0, 1, 3, 4, 9], 'entity_name', ['person_name', 'place_name']),
+    (1, ['x', '', 99999], 'verb', ['verb_3-lit']),
+]
+LEMMA_OVERRIDE_SHARE = 0.12
+
+
+def synthetic_corpus(size: int, seed: int = 0) -> list:
+    """ generate a reproducible list of ``(flexcode, lemmaID, type, subtype)`` tuples
+    mixing categories like a real corpus, with a share of lemma ID overrides.
+    """
+    rng = random.Random(seed)
+    lemmaIDs = sorted(lingGlossFromLemmaIDDict)
+    weights = [weight for weight, *_ in CORPUS_MIX]
+    occurrences = []
+    for _ in range(size):
+        _, flexcodes, pos, sub_poses = rng.choices(CORPUS_MIX, weights)[0]
+        if rng.random() < LEMMA_OVERRIDE_SHARE:
+            lemmaID = rng.choice(lemmaIDs)
+        else:
+            lemmaID = str(rng.randrange(10000, 200000))
+        occurrences.append(
+            (rng.choice(flexcodes), lemmaID, pos, rng.choice(sub_poses))
+        )
+    return occurrences
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--update-memory-baseline', action='store_true',
+        help='store measured peak memory as the new baseline instead of comparing',
+    )
+
+
+@pytest.fixture(scope='session')
+def corpus():
+    return synthetic_corpus(10000)
+
+
+@pytest.fixture(scope='session')
+def _memory_baselines(request):
+    try:
+        with open(MEMORY_BASELINE) as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {}
+    yield baselines
+    if request.config.getoption('--update-memory-baseline'):
+        with open(MEMORY_BASELINE, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+@pytest.fixture
+def memory_baseline(request, _memory_baselines):
+    """ compare a peak memory measurement in bytes with the stored baseline of the
+    requesting test, failing if it exceeds it by more than :data:`MEMORY_TOLERANCE`.
+    """
+    name = request.node.name
+
+    def check(peak: int):
+        if request.config.getoption('--update-memory-baseline'):
+            _memory_baselines[name] = peak
+        elif name in _memory_baselines:
+            assert peak <= _memory_baselines[name] * MEMORY_TOLERANCE, (
+                'peak memory {} B exceeds baseline {} B'.format(peak, _memory_baselines[name])
+            )
+
+    return check
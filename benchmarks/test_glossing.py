@@ -0,0 +1,102 @@
+""" Throughput of the glossing hot paths, per category and on a synthetic corpus.
+"""
+import tracemalloc
+
+import pytest
+
+from aaew_linggloss import computeLingGlossing, computeLingGlossings, resolve_flexcode, table
+from aaew_linggloss.mapping import lingGlossFromLemmaIDDict
+
+
+IMPLEMENTATIONS = {
+    'reference': computeLingGlossing,
+    'table': table.compute_ling_glossing,
+}
+
+# one typical occurrence per branch of the glossing rules
+CATEGORY_CASES = {
+    'status': (3, '1', {'type': 'substantive', 'subtype': 'substantive_masc'}),
+    'suffix_conjugation': (10020, '1', {'type': 'verb', 'subtype': 'verb_3-lit'}),
+    'resultative': (20010, '1', {'type': 'verb', 'subtype': 'verb_2-lit'}),
+    'participle': (30110, '1', {'type': 'verb', 'subtype': 'verb_3-inf'}),
+    'relative_form': (40110, '1', {'type': 'verb', 'subtype': 'verb_3-gem'}),
+    'substantive': (70060, '1', {'type': 'substantive', 'subtype': 'substantive_fem'}),
+    'adjective': (71010, '1', {'type': 'adjective'}),
+    'auxiliary': (96423, '1', {'type': 'verb', 'subtype': 'verb_irr'}),
+    'unresolved': (99999, '1', {'type': 'particle'}),
+    'lemma_override': (70060, '10030', {'type': 'personal_pronoun'}),
+}
+
+
+@pytest.fixture(params=sorted(IMPLEMENTATIONS))
+def glossing(request):
+    return IMPLEMENTATIONS[request.param]
+
+
+@pytest.mark.parametrize('case', sorted(CATEGORY_CASES))
+def test_category(benchmark, glossing, case):
+    benchmark.group = 'category:' + case
+    flexcode, lemmaID, pos_subpos = CATEGORY_CASES[case]
+    glossing(flexcode, lemmaID, pos_subpos)
+    benchmark(glossing, flexcode, lemmaID, pos_subpos)
+
+
+def test_lemma_override_hits(benchmark):
+    lemmaIDs = sorted(lingGlossFromLemmaIDDict)
+    benchmark.group = 'lemma'
+
+    def gloss_all():
+        for lemmaID in lemmaIDs:
+            computeLingGlossing(0, lemmaID, None)
+
+    benchmark(gloss_all)
+
+
+def test_resolve_flexcode(benchmark):
+    flexcodes = [10930, -10930, 70060, 96423, 99999, '10020']
+    resolve_flexcode(10930)
+    benchmark.group = 'resolve_flexcode'
+
+    def resolve_all():
+        for flexcode in flexcodes:
+            resolve_flexcode(flexcode)
+
+    benchmark(resolve_all)
+
+
+def test_corpus(benchmark, glossing, corpus):
+    benchmark.group = 'corpus'
+    occurrences = [
+        (flexcode, lemmaID, {'type': pos, 'subtype': sub_pos} if sub_pos else {'type': pos})
+        for flexcode, lemmaID, pos, sub_pos in corpus
+    ]
+
+    def gloss_all():
+        for occurrence in occurrences:
+            glossing(*occurrence)
+
+    benchmark(gloss_all)
+
+
+def test_corpus_batch(benchmark, corpus):
+    benchmark.group = 'corpus'
+    benchmark(computeLingGlossings, corpus)
+
+
+def test_corpus_vectorized(benchmark, corpus):
+    pytest.importorskip('numpy')
+    from aaew_linggloss.vectorized import compute_ling_glossings
+    benchmark.group = 'corpus'
+    columns = [list(column) for column in zip(*corpus)]
+    benchmark(compute_ling_glossings, *columns)
+
+
+def test_corpus_memory(corpus, memory_baseline):
+    computeLingGlossings(corpus[:10])
+    tracemalloc.start()
+    try:
+        computeLingGlossings(corpus)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    memory_baseline(peak)
@@ -0,0 +1,67 @@
+""" Import time and the cost of loading the data files.
+"""
+import subprocess
+import sys
+import tracemalloc
+
+from aaew_linggloss import table
+from aaew_linggloss.flexcodes import FlexcodeTable, FILENAME
+from aaew_linggloss.mapping import load_resource
+
+
+def _python(code: str):
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_interpreter_startup(benchmark):
+    benchmark.group = 'import'
+    benchmark.pedantic(_python, ('pass',), rounds=10)
+
+
+def test_import(benchmark):
+    benchmark.group = 'import'
+    benchmark.pedantic(_python, ('import aaew_linggloss',), rounds=10)
+
+
+def test_import_and_gloss(benchmark):
+    benchmark.group = 'import'
+    benchmark.pedantic(_python, (
+        'import aaew_linggloss\n'
+        'aaew_linggloss.table.compute_ling_glossing(70060, "1", {"type": "substantive"})\n'
+        'aaew_linggloss.resolve_flexcode(10930)\n',
+    ), rounds=10)
+
+
+def test_load_gloss_table(benchmark):
+    benchmark.group = 'load'
+    data = load_resource(table.FILENAME)
+    benchmark(table.GlossTable.from_bytes, data)
+
+
+def test_load_flexcode_table(benchmark):
+    benchmark.group = 'load'
+    data = load_resource(FILENAME)
+    benchmark(lambda: FlexcodeTable(data).get(10930))
+
+
+def test_gloss_table_memory(memory_baseline):
+    data = load_resource(table.FILENAME)
+    tracemalloc.start()
+    try:
+        glosses = table.GlossTable.from_bytes(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert glosses.vocabulary
+    memory_baseline(peak)
+
+
+def test_import_and_gloss_from_snapshot(benchmark, tmp_path):
+    benchmark.group = 'import'
+    path = str(tmp_path / 'linggloss.snapshot')
+    _python('from aaew_linggloss import snapshot; snapshot.save({!r})'.format(path))
+    benchmark.pedantic(_python, (
+        'from aaew_linggloss import snapshot\n'
+        'snapshot.restore({!r})\n'
+        'snapshot.table.compute_ling_glossing(70060, "1", {{"type": "substantive"}})\n'.format(path),
+    ), rounds=10)
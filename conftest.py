@@ -0,0 +1,10 @@
+import importlib.util
+
+
+collect_ignore = []
+
+# modules depending on optional extras
+if importlib.util.find_spec('numpy') is None:
+    collect_ignore.append('aaew_linggloss/vectorized.py')
+if importlib.util.find_spec('pandas') is None:
+    collect_ignore.append('aaew_linggloss/frames.py')
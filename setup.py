@@ -22,7 +22,8 @@ setup(
     author_email='daniel.werning@bbaw.de',
     packages=['aaew_linggloss', 'aaew_linggloss.tests'],
     package_dir={"": "."},
-    package_data={"aaew_linggloss": ["data/*.json"]},
+    package_data={"aaew_linggloss": ["data/*.json", "data/*.bin"], "aaew_linggloss.tests": ["golden.tsv.gz"]},
     install_requires=[],
-    extras_require={"dev": ["dephell==0.*,>=0.8.3", "ipython==7.*,>=7.9.0", "pytest==5.*,>=5.2.2"]},
+    entry_points={"console_scripts": ["aaew-linggloss = aaew_linggloss.cli:main"]},
+    extras_require={"dev": ["dephell==0.*,>=0.8.3", "ipython==7.*,>=7.9.0", "pytest==5.*,>=5.2.2", "pytest-benchmark==3.*,>=3.2.2"], "numpy": ["numpy>=1.17"], "pandas": ["numpy>=1.17", "pandas>=1.1"]},
 )